@@ -2,30 +2,104 @@
 #
 # build_parser_tables -- build the parser tables
 #
+"""
+Builds the PLY parser tables for the oscript parsers, writing them into
+the oscript.parse package, so that they are shipped with it and do not
+have to be generated at run time.  PLY verifies the grammar signature
+recorded in a table against the parser when loading it, and regenerates
+the table if they do not match.
+
+With --check, the tables are only verified, and the exit status is
+nonzero if any of them is missing or out of date.
+"""
 import sys
+import importlib
+import argparse
 import logging
 logger = logging.getLogger('build_parser_tables')
 
+import ply.yacc as yacc
+
 from oscript.parse import (sk_lexer, param_parser, sk_parser,
                            para_lexer, para_parser)
 
-# build param parser state machine table
-lex = sk_lexer.skScanner(logger=logger, lextab='scan1_tab', debug=False)
-pp = param_parser.paramParser(lex, logger=logger)
-pp.build()
-
-# build OPE parser state machine table
-lex = sk_lexer.skScanner(logger=logger, lextab='scan2_tab', debug=False)
-op = sk_parser.opeParser(lex, logger=logger)
-op.build()
-
-# build skeleton parser state machine table
-lex = sk_lexer.skScanner(logger=logger, lextab='scan3_tab', debug=False)
-sp = sk_parser.skParser(lex, logger=logger)
-sp.build()
-
-# build PARA parser state machine table
-lex = para_lexer.paraScanner(logger=logger, debug=False)
-pp2 = para_parser.paraParser(lex, logger=logger)
-# not currently necessary for this parser, builds in constructor
-#pp2.build()
+
+def get_parsers():
+    """Returns a list of (parser, start symbol, table module) tuples for
+    each of the parsers whose tables are shipped.
+    """
+    res = []
+
+    # param parser state machine table
+    lex = sk_lexer.skScanner(logger=logger, lextab='scan1_tab', debug=False)
+    pp = param_parser.paramParser(lex, logger=logger)
+    res.append((pp, 'param_list', pp._parsetab))
+
+    # OPE parser state machine table
+    lex = sk_lexer.skScanner(logger=logger, lextab='scan2_tab', debug=False)
+    op = sk_parser.opeParser(lex, logger=logger)
+    res.append((op, 'opecmd', op._parsetab))
+
+    # skeleton parser state machine table
+    lex = sk_lexer.skScanner(logger=logger, lextab='scan3_tab', debug=False)
+    sp = sk_parser.skParser(lex, logger=logger)
+    res.append((sp, 'program', sp._parsetab))
+
+    # PARA parser state machine table
+    lex = para_lexer.paraScanner(logger=logger, debug=False)
+    pp2 = para_parser.paraParser(lex, logger=logger)
+    res.append((pp2, 'object_def', pp2._parsetab))
+
+    return res
+
+
+def check_table(parser, start, tabmodule):
+    """Returns True if the shipped table (tabmodule) matches the grammar
+    of (parser).
+    """
+    pdict = dict([(name, getattr(parser, name)) for name in dir(parser)])
+    pdict['start'] = start
+    pinfo = yacc.ParserReflect(pdict, log=logger)
+    pinfo.get_all()
+
+    try:
+        table = importlib.import_module('oscript.parse.%s' % tabmodule)
+
+    except ImportError:
+        logger.error("table module '%s' is missing" % tabmodule)
+        return False
+
+    if table._lr_signature != pinfo.signature():
+        logger.error("table module '%s' is out of date" % tabmodule)
+        return False
+
+    return True
+
+
+def main(options, args):
+
+    logging.basicConfig(level=logging.INFO)
+
+    parsers = get_parsers()
+
+    if options.check:
+        ok = True
+        for (parser, start, tabmodule) in parsers:
+            ok = check_table(parser, start, tabmodule) and ok
+        if not ok:
+            sys.exit(1)
+        return
+
+    for (parser, start, tabmodule) in parsers:
+        parser.build()
+
+
+if __name__ == '__main__':
+
+    argprs = argparse.ArgumentParser(description="Build oscript parser tables")
+    argprs.add_argument("--check", dest="check", default=False,
+                        action="store_true",
+                        help="Only verify that the tables are up to date")
+    (options, args) = argprs.parse_known_args(sys.argv[1:])
+
+    main(options, args)
@@ -0,0 +1,55 @@
+
+# PARA_parse_tab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'object_defALIASREF COMMA COMMENT EQ FSTR FUNCREF ID LCONT LPAREN LSTR NEWLINE QSTR REGREF RPAREN STRobject_def : object_def  param_def_lineobject_def : param_def_lineobject_def :  object_def NEWLINEobject_def : NEWLINE object_defparam_def_line : param_def\n                          | param_def NEWLINEparam_def : ID defs_listdefs_list : defs_list defsdefs_list : defscase_cond_element : ID EQ STRcase_cond_list : case_cond_element case_cond_list : case_cond_list COMMA case_cond_elementcase_cond   : LPAREN case_cond_list RPARENcomma_separated_list : comma_separated_list COMMA STR\n                                | comma_separated_list COMMA QSTRcomma_separated_list : STR\n                                | QSTRrhs  : FSTR\n                | REGREF\n                | ALIASREF\n                | FUNCREF\n                | LSTR\n                | case_conddefs : STR EQ rhsdefs : STR EQ comma_separated_list'
+    
+_lr_action_items = {'NEWLINE':([0,1,2,3,4,6,7,8,9,10,11,13,15,16,17,18,19,20,21,22,23,24,30,31,32,],[3,7,-2,3,9,-1,-3,7,-6,-7,-9,-8,-16,-24,-25,-18,-19,-20,-21,-22,-23,-17,-14,-15,-13,]),'ID':([0,1,2,3,4,6,7,8,9,10,11,13,15,16,17,18,19,20,21,22,23,24,25,30,31,32,33,],[5,5,-2,5,-5,-1,-3,5,-6,-7,-9,-8,-16,-24,-25,-18,-19,-20,-21,-22,-23,-17,29,-14,-15,-13,29,]),'$end':([1,2,4,6,7,8,9,10,11,13,15,16,17,18,19,20,21,22,23,24,30,31,32,],[0,-2,-5,-1,-3,-4,-6,-7,-9,-8,-16,-24,-25,-18,-19,-20,-21,-22,-23,-17,-14,-15,-13,]),'STR':([5,10,11,13,14,15,16,17,18,19,20,21,22,23,24,26,30,31,32,34,],[12,12,-9,-8,15,-16,-24,-25,-18,-19,-20,-21,-22,-23,-17,30,-14,-15,-13,36,]),'EQ':([12,29,],[14,34,]),'FSTR':([14,],[18,]),'REGREF':([14,],[19,]),'ALIASREF':([14,],[20,]),'FUNCREF':([14,],[21,]),'LSTR':([14,],[22,]),'QSTR':([14,26,],[24,31,]),'LPAREN':([14,],[25,]),'COMMA':([15,17,24,27,28,30,31,35,36,],[-16,26,-17,33,-11,-14,-15,-12,-10,]),'RPAREN':([27,28,35,36,],[32,-11,-12,-10,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'object_def':([0,3,],[1,8,]),'param_def_line':([0,1,3,8,],[2,6,2,6,]),'param_def':([0,1,3,8,],[4,4,4,4,]),'defs_list':([5,],[10,]),'defs':([5,10,],[11,13,]),'rhs':([14,],[16,]),'comma_separated_list':([14,],[17,]),'case_cond':([14,],[23,]),'case_cond_list':([25,],[27,]),'case_cond_element':([25,33,],[28,35,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> object_def","S'",1,None,None,None),
+  ('object_def -> object_def param_def_line','object_def',2,'p_object_def1','para_parser.py',147),
+  ('object_def -> param_def_line','object_def',1,'p_object_def2','para_parser.py',161),
+  ('object_def -> object_def NEWLINE','object_def',2,'p_object_def3','para_parser.py',169),
+  ('object_def -> NEWLINE object_def','object_def',2,'p_object_def4','para_parser.py',173),
+  ('param_def_line -> param_def','param_def_line',1,'p_param_def_line','para_parser.py',177),
+  ('param_def_line -> param_def NEWLINE','param_def_line',2,'p_param_def_line','para_parser.py',178),
+  ('param_def -> ID defs_list','param_def',2,'p_param_def','para_parser.py',182),
+  ('defs_list -> defs_list defs','defs_list',2,'p_defs_list1','para_parser.py',186),
+  ('defs_list -> defs','defs_list',1,'p_defs_list2','para_parser.py',191),
+  ('case_cond_element -> ID EQ STR','case_cond_element',3,'p_case_cond_element','para_parser.py',195),
+  ('case_cond_list -> case_cond_element','case_cond_list',1,'p_case_cond_list1','para_parser.py',199),
+  ('case_cond_list -> case_cond_list COMMA case_cond_element','case_cond_list',3,'p_case_cond_list2','para_parser.py',203),
+  ('case_cond -> LPAREN case_cond_list RPAREN','case_cond',3,'p_case_cond','para_parser.py',208),
+  ('comma_separated_list -> comma_separated_list COMMA STR','comma_separated_list',3,'p_comma_separated_list1','para_parser.py',212),
+  ('comma_separated_list -> comma_separated_list COMMA QSTR','comma_separated_list',3,'p_comma_separated_list1','para_parser.py',213),
+  ('comma_separated_list -> STR','comma_separated_list',1,'p_comma_separated_list2','para_parser.py',218),
+  ('comma_separated_list -> QSTR','comma_separated_list',1,'p_comma_separated_list2','para_parser.py',219),
+  ('rhs -> FSTR','rhs',1,'p_rhs_1','para_parser.py',229),
+  ('rhs -> REGREF','rhs',1,'p_rhs_1','para_parser.py',230),
+  ('rhs -> ALIASREF','rhs',1,'p_rhs_1','para_parser.py',231),
+  ('rhs -> FUNCREF','rhs',1,'p_rhs_1','para_parser.py',232),
+  ('rhs -> LSTR','rhs',1,'p_rhs_1','para_parser.py',233),
+  ('rhs -> case_cond','rhs',1,'p_rhs_1','para_parser.py',234),
+  ('defs -> STR EQ rhs','defs',3,'p_defs_1','para_parser.py',238),
+  ('defs -> STR EQ comma_separated_list','defs',3,'p_defs_2','para_parser.py',242),
+]
@@ -0,0 +1,82 @@
+
+# ope_command_parse_tab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'opecmdleftANDORrightNOTnonassocEQNEGTGELTLEleftADDSUBleftMULDIVrightUMINUSADD ALIASREF AND ASSIGN COMMA DIV EQ EXEC GE GET_F_NO GT ID IDREF LE LPAREN LSTR LT MUL NE NOT NUM OR QSTR REGREF RPAREN SUBopecmd : dd_cmd\n                  | abs_cmd\n        abs_cmd : factor param_list param_list : emptydd_cmd : EXEC factor factor param_listparam_list : param_list key_value_pairkey_value_pair : ID ASSIGN expressionfactor : NUMfactor : IDREFfactor : ALIASREFfactor : frame_id_ref factor : ID\n                   | OR\n                   | AND\n         factor : LSTR  factor : QSTR factor : REGREFfactor2 : ADD factor %prec UMINUSdyad : expression MUL expression\n                | expression DIV expression\n                | expression ADD expression\n                | expression SUB expression\n                | expression LT expression\n                | expression GT expression\n                | expression LE expression\n                | expression GE expression\n                | expression EQ expression\n                | expression NE expression\n                | expression AND expression\n                | expression OR expression\n        monad : NOT expression\n                 | SUB expression %prec UMINUS\n        func_call : ID LPAREN arg_list RPARENproc_call : REGREF LPAREN arg_list RPARENproc_call : REGREF LPAREN RPAREN arg_list : expression_list COMMA kwd_params arg_list : expression_list arg_list : kwd_paramskwd_params : key_value_pair COMMA kwd_paramskwd_params : key_value_pairasnum : LPAREN expression RPARENexpression : monad\n                      | dyad\n                      | func_call\n                      | proc_call\n                      | asnum\n                      | factor\n                      | factor2frame_id_ref : GET_F_NO LSTRexpression_list : expressionexpression_list : expression_list COMMA expressionempty :'
+    
+_lr_action_items = {'EXEC':([0,],[4,]),'NUM':([0,4,6,7,8,9,10,11,12,13,14,15,17,20,25,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[6,6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,6,-49,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'IDREF':([0,4,6,7,8,9,10,11,12,13,14,15,17,20,25,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[7,7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,7,-49,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'ALIASREF':([0,4,6,7,8,9,10,11,12,13,14,15,17,20,25,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[8,8,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,8,-49,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'ID':([0,4,5,6,7,8,9,10,11,12,13,14,15,17,18,19,20,21,22,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,57,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,82,],[10,10,-52,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,10,23,-4,-49,-52,-6,23,26,-12,-7,-42,-43,-44,-45,-46,-47,-48,26,26,10,26,-17,58,26,26,26,26,26,26,26,26,26,26,26,26,-31,-32,-18,58,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-41,-35,-33,58,23,-34,]),'OR':([0,4,6,7,8,9,10,11,12,13,14,15,17,20,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,80,82,84,],[11,11,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,11,-49,11,-12,52,-42,-43,-44,-45,-46,-47,-48,11,11,11,11,-17,11,11,11,11,11,11,11,11,11,11,11,11,11,-31,-32,-18,52,11,-12,52,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-41,-35,-33,11,-34,52,]),'AND':([0,4,6,7,8,9,10,11,12,13,14,15,17,20,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,80,82,84,],[12,12,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,12,-49,12,-12,51,-42,-43,-44,-45,-46,-47,-48,12,12,12,12,-17,12,12,12,12,12,12,12,12,12,12,12,12,12,-31,-32,-18,51,12,-12,51,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-41,-35,-33,12,-34,51,]),'LSTR':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,20,25,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[13,13,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,20,13,-49,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'QSTR':([0,4,6,7,8,9,10,11,12,13,14,15,17,20,25,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[14,14,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,14,-49,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'REGREF':([0,4,6,7,8,9,10,11,12,13,14,15,17,20,25,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[15,15,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,15,-49,39,39,39,15,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'GET_F_NO':([0,4,6,7,8,9,10,11,12,13,14,15,17,20,25,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[16,16,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,16,-49,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'$end':([1,2,3,5,6,7,8,9,10,11,12,13,14,15,18,19,20,21,22,24,26,27,28,29,30,31,32,33,34,39,53,54,55,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,82,],[0,-1,-2,-52,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-3,-4,-49,-52,-6,-5,-12,-7,-42,-43,-44,-45,-46,-47,-48,-17,-31,-32,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-41,-35,-33,-34,]),'MUL':([6,7,8,9,10,11,12,13,14,15,20,26,27,28,29,30,31,32,33,34,39,53,54,55,56,58,62,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,82,84,],[-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-49,-12,41,-42,-43,-44,-45,-46,-47,-48,-17,41,-32,-18,41,-12,41,-19,-20,41,41,41,41,41,41,41,41,41,41,-41,-35,-33,-34,41,]),'DIV':([6,7,8,9,10,11,12,13,14,15,20,26,27,28,29,30,31,32,33,34,39,53,54,55,56,58,62,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,82,84,],[-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-49,-12,42,-42,-43,-44,-45,-46,-47,-48,-17,42,-32,-18,42,-12,42,-19,-20,42,42,42,42,42,42,42,42,42,42,-41,-35,-33,-34,42,]),'ADD':([6,7,8,9,10,11,12,13,14,15,20,25,26,27,28,29,30,31,32,33,34,35,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,80,82,84,],[-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-49,37,-12,43,-42,-43,-44,-45,-46,-47,-48,37,37,37,-17,37,37,37,37,37,37,37,37,37,37,37,37,37,43,-32,-18,43,37,-12,43,-19,-20,-21,-22,43,43,43,43,43,43,43,43,-41,-35,-33,37,-34,43,]),'SUB':([6,7,8,9,10,11,12,13,14,15,20,25,26,27,28,29,30,31,32,33,34,35,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,80,82,84,],[-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-49,36,-12,44,-42,-43,-44,-45,-46,-47,-48,36,36,36,-17,36,36,36,36,36,36,36,36,36,36,36,36,36,44,-32,-18,44,36,-12,44,-19,-20,-21,-22,44,44,44,44,44,44,44,44,-41,-35,-33,36,-34,44,]),'LT':([6,7,8,9,10,11,12,13,14,15,20,26,27,28,29,30,31,32,33,34,39,53,54,55,56,58,62,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,82,84,],[-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-49,-12,45,-42,-43,-44,-45,-46,-47,-48,-17,45,-32,-18,45,-12,45,-19,-20,-21,-22,None,None,None,None,None,None,45,45,-41,-35,-33,-34,45,]),'GT':([6,7,8,9,10,11,12,13,14,15,20,26,27,28,29,30,31,32,33,34,39,53,54,55,56,58,62,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,82,84,],[-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-49,-12,46,-42,-43,-44,-45,-46,-47,-48,-17,46,-32,-18,46,-12,46,-19,-20,-21,-22,None,None,None,None,None,None,46,46,-41,-35,-33,-34,46,]),'LE':([6,7,8,9,10,11,12,13,14,15,20,26,27,28,29,30,31,32,33,34,39,53,54,55,56,58,62,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,82,84,],[-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-49,-12,47,-42,-43,-44,-45,-46,-47,-48,-17,47,-32,-18,47,-12,47,-19,-20,-21,-22,None,None,None,None,None,None,47,47,-41,-35,-33,-34,47,]),'GE':([6,7,8,9,10,11,12,13,14,15,20,26,27,28,29,30,31,32,33,34,39,53,54,55,56,58,62,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,82,84,],[-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-49,-12,48,-42,-43,-44,-45,-46,-47,-48,-17,48,-32,-18,48,-12,48,-19,-20,-21,-22,None,None,None,None,None,None,48,48,-41,-35,-33,-34,48,]),'EQ':([6,7,8,9,10,11,12,13,14,15,20,26,27,28,29,30,31,32,33,34,39,53,54,55,56,58,62,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,82,84,],[-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-49,-12,49,-42,-43,-44,-45,-46,-47,-48,-17,49,-32,-18,49,-12,49,-19,-20,-21,-22,None,None,None,None,None,None,49,49,-41,-35,-33,-34,49,]),'NE':([6,7,8,9,10,11,12,13,14,15,20,26,27,28,29,30,31,32,33,34,39,53,54,55,56,58,62,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,82,84,],[-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-49,-12,50,-42,-43,-44,-45,-46,-47,-48,-17,50,-32,-18,50,-12,50,-19,-20,-21,-22,None,None,None,None,None,None,50,50,-41,-35,-33,-34,50,]),'COMMA':([6,7,8,9,10,11,12,13,14,15,20,26,27,28,29,30,31,32,33,34,39,53,54,55,58,60,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,82,84,],[-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-49,-12,-7,-42,-43,-44,-45,-46,-47,-48,-17,-31,-32,-18,-12,80,-50,81,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-41,-35,-33,-34,-51,]),'RPAREN':([6,7,8,9,10,11,12,13,14,15,20,26,27,28,29,30,31,32,33,34,39,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,83,84,85,],[-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-49,-12,-7,-42,-43,-44,-45,-46,-47,-48,-17,-31,-32,-18,76,78,-12,79,-37,-38,-50,-40,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-41,82,-35,-33,-34,-36,-51,-39,]),'ASSIGN':([23,58,],[25,25,]),'NOT':([25,35,36,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'LPAREN':([25,26,35,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,57,58,80,],[38,40,38,38,38,57,38,38,38,38,38,38,38,38,38,38,38,38,38,38,40,38,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'opecmd':([0,],[1,]),'dd_cmd':([0,],[2,]),'abs_cmd':([0,],[3,]),'factor':([0,4,17,25,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[5,17,21,33,33,33,55,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'frame_id_ref':([0,4,17,25,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'param_list':([5,21,],[18,24,]),'empty':([5,21,],[19,19,]),'key_value_pair':([18,24,40,57,80,81,],[22,22,63,63,63,63,]),'expression':([25,35,36,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[27,53,54,56,62,64,65,66,67,68,69,70,71,72,73,74,75,62,84,]),'monad':([25,35,36,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'dyad':([25,35,36,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'func_call':([25,35,36,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'proc_call':([25,35,36,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'asnum':([25,35,36,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'factor2':([25,35,36,38,40,41,42,43,44,45,46,47,48,49,50,51,52,57,80,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'arg_list':([40,57,],[59,77,]),'expression_list':([40,57,],[60,60,]),'kwd_params':([40,57,80,81,],[61,61,83,85,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> opecmd","S'",1,None,None,None),
+  ('opecmd -> dd_cmd','opecmd',1,'p_opecmd','sk_parser.py',53),
+  ('opecmd -> abs_cmd','opecmd',1,'p_opecmd','sk_parser.py',54),
+  ('abs_cmd -> factor param_list','abs_cmd',2,'p_abscmd','sk_parser.py',59),
+  ('param_list -> empty','param_list',1,'p_param_list1','param_parser.py',61),
+  ('dd_cmd -> EXEC factor factor param_list','dd_cmd',4,'p_ddcmd','sk_parser.py',63),
+  ('param_list -> param_list key_value_pair','param_list',2,'p_param_list2','param_parser.py',65),
+  ('key_value_pair -> ID ASSIGN expression','key_value_pair',3,'p_key_value_pair','param_parser.py',70),
+  ('factor -> NUM','factor',1,'p_factor1','param_parser.py',75),
+  ('factor -> IDREF','factor',1,'p_factor2','param_parser.py',82),
+  ('factor -> ALIASREF','factor',1,'p_factor3','param_parser.py',86),
+  ('factor -> frame_id_ref','factor',1,'p_factor4','param_parser.py',90),
+  ('factor -> ID','factor',1,'p_factor6','param_parser.py',97),
+  ('factor -> OR','factor',1,'p_factor6','param_parser.py',98),
+  ('factor -> AND','factor',1,'p_factor6','param_parser.py',99),
+  ('factor -> LSTR','factor',1,'p_factor7','param_parser.py',104),
+  ('factor -> QSTR','factor',1,'p_factor8','param_parser.py',109),
+  ('factor -> REGREF','factor',1,'p_factor9','param_parser.py',113),
+  ('factor2 -> ADD factor','factor2',2,'p_factor_2_2','param_parser.py',121),
+  ('dyad -> expression MUL expression','dyad',3,'p_dyad1','param_parser.py',129),
+  ('dyad -> expression DIV expression','dyad',3,'p_dyad1','param_parser.py',130),
+  ('dyad -> expression ADD expression','dyad',3,'p_dyad1','param_parser.py',131),
+  ('dyad -> expression SUB expression','dyad',3,'p_dyad1','param_parser.py',132),
+  ('dyad -> expression LT expression','dyad',3,'p_dyad1','param_parser.py',133),
+  ('dyad -> expression GT expression','dyad',3,'p_dyad1','param_parser.py',134),
+  ('dyad -> expression LE expression','dyad',3,'p_dyad1','param_parser.py',135),
+  ('dyad -> expression GE expression','dyad',3,'p_dyad1','param_parser.py',136),
+  ('dyad -> expression EQ expression','dyad',3,'p_dyad1','param_parser.py',137),
+  ('dyad -> expression NE expression','dyad',3,'p_dyad1','param_parser.py',138),
+  ('dyad -> expression AND expression','dyad',3,'p_dyad1','param_parser.py',139),
+  ('dyad -> expression OR expression','dyad',3,'p_dyad1','param_parser.py',140),
+  ('monad -> NOT expression','monad',2,'p_monad1','param_parser.py',145),
+  ('monad -> SUB expression','monad',2,'p_monad1','param_parser.py',146),
+  ('func_call -> ID LPAREN arg_list RPAREN','func_call',4,'p_func_call','param_parser.py',151),
+  ('proc_call -> REGREF LPAREN arg_list RPAREN','proc_call',4,'p_proc_call','param_parser.py',155),
+  ('proc_call -> REGREF LPAREN RPAREN','proc_call',3,'p_proc_call2','param_parser.py',159),
+  ('arg_list -> expression_list COMMA kwd_params','arg_list',3,'p_arg_list1','param_parser.py',163),
+  ('arg_list -> expression_list','arg_list',1,'p_arg_list2','param_parser.py',170),
+  ('arg_list -> kwd_params','arg_list',1,'p_arg_list3','param_parser.py',175),
+  ('kwd_params -> key_value_pair COMMA kwd_params','kwd_params',3,'p_kwd_params1','param_parser.py',180),
+  ('kwd_params -> key_value_pair','kwd_params',1,'p_kwd_params2','param_parser.py',185),
+  ('asnum -> LPAREN expression RPAREN','asnum',3,'p_asnum1','param_parser.py',198),
+  ('expression -> monad','expression',1,'p_expression1','param_parser.py',202),
+  ('expression -> dyad','expression',1,'p_expression1','param_parser.py',203),
+  ('expression -> func_call','expression',1,'p_expression1','param_parser.py',204),
+  ('expression -> proc_call','expression',1,'p_expression1','param_parser.py',205),
+  ('expression -> asnum','expression',1,'p_expression1','param_parser.py',206),
+  ('expression -> factor','expression',1,'p_expression1','param_parser.py',207),
+  ('expression -> factor2','expression',1,'p_expression1','param_parser.py',208),
+  ('frame_id_ref -> GET_F_NO LSTR','frame_id_ref',2,'p_frame_id_acquisition','param_parser.py',212),
+  ('expression_list -> expression','expression_list',1,'p_expression_list1','param_parser.py',216),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list2','param_parser.py',220),
+  ('empty -> <empty>','empty',0,'p_epslion','param_parser.py',225),
+]
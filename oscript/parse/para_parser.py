@@ -270,9 +270,9 @@ class paraParser(object):
         self.logger = logger
         self._debug = debug
         self._parsetab = parsetab
+        # parser is built on first use
         self.parser = None
 
-        self.build()
         self.reset()
 
 
@@ -293,6 +293,9 @@ class paraParser(object):
 
     def parse(self, buf, startline=1):
 
+        if self.parser is None:
+            self.build()
+
         # Initialize module level error variables
         self.reset(lineno=startline)
 
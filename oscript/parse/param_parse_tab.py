@@ -0,0 +1,78 @@
+
+# param_parse_tab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'param_listleftANDORrightNOTnonassocEQNEGTGELTLEleftADDSUBleftMULDIVrightUMINUSADD ALIASREF AND ASSIGN COMMA DIV EQ GE GET_F_NO GT ID IDREF LE LPAREN LSTR LT MUL NE NOT NUM OR QSTR REGREF RPAREN SUB UMINUS param_list : emptyparam_list : param_list key_value_pairkey_value_pair : ID ASSIGN expressionfactor : NUMfactor : IDREFfactor : ALIASREFfactor : frame_id_ref factor : ID\n                   | OR\n                   | AND\n         factor : LSTR  factor : QSTR factor : REGREFfactor2 : ADD factor %prec UMINUSdyad : expression MUL expression\n                | expression DIV expression\n                | expression ADD expression\n                | expression SUB expression\n                | expression LT expression\n                | expression GT expression\n                | expression LE expression\n                | expression GE expression\n                | expression EQ expression\n                | expression NE expression\n                | expression AND expression\n                | expression OR expression\n        monad : NOT expression\n                 | SUB expression %prec UMINUS\n        func_call : ID LPAREN arg_list RPARENproc_call : REGREF LPAREN arg_list RPARENproc_call : REGREF LPAREN RPAREN arg_list : expression_list COMMA kwd_params arg_list : expression_list arg_list : kwd_paramskwd_params : key_value_pair COMMA kwd_paramskwd_params : key_value_pairasnum : LPAREN expression RPARENexpression : monad\n                      | dyad\n                      | func_call\n                      | proc_call\n                      | asnum\n                      | factor\n                      | factor2frame_id_ref : GET_F_NO LSTRexpression_list : expressionexpression_list : expression_list COMMA expressionempty :'
+    
+_lr_action_items = {'ID':([0,1,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,48,49,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,72,73,74,],[-48,4,-1,-2,6,-8,-3,-38,-39,-40,-41,-42,-43,-44,6,6,45,-10,-9,6,-13,-4,-5,-6,-7,-11,-12,50,6,6,6,6,6,6,6,6,6,6,6,6,-27,-28,-14,-8,-13,50,-45,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-31,-29,50,4,-30,]),'$end':([0,1,2,3,6,7,8,9,10,11,12,13,14,18,19,21,22,23,24,25,26,27,42,43,44,45,46,49,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,74,],[-48,0,-1,-2,-8,-3,-38,-39,-40,-41,-42,-43,-44,-10,-9,-13,-4,-5,-6,-7,-11,-12,-27,-28,-14,-8,-13,-45,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-31,-29,-30,]),'ASSIGN':([4,50,],[5,5,]),'NOT':([5,15,16,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'SUB':([5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,72,74,76,],[16,-8,33,-38,-39,-40,-41,-42,-43,-44,16,16,-10,-9,16,-13,-4,-5,-6,-7,-11,-12,16,16,16,16,16,16,16,16,16,16,16,16,16,33,-28,-14,-8,-13,33,16,-45,-8,33,-15,-16,-17,-18,33,33,33,33,33,33,33,33,-37,-31,-29,16,-30,33,]),'REGREF':([5,15,16,17,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[21,21,21,46,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'LPAREN':([5,6,15,16,20,21,29,30,31,32,33,34,35,36,37,38,39,40,41,48,50,72,],[20,29,20,20,20,48,20,20,20,20,20,20,20,20,20,20,20,20,20,20,29,20,]),'NUM':([5,15,16,17,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'IDREF':([5,15,16,17,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'ALIASREF':([5,15,16,17,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'OR':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,72,74,76,],[19,-8,41,-38,-39,-40,-41,-42,-43,-44,19,19,19,-10,-9,19,-13,-4,-5,-6,-7,-11,-12,19,19,19,19,19,19,19,19,19,19,19,19,19,-27,-28,-14,-8,-13,41,19,-45,-8,41,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-31,-29,19,-30,41,]),'AND':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,72,74,76,],[18,-8,40,-38,-39,-40,-41,-42,-43,-44,18,18,18,-10,-9,18,-13,-4,-5,-6,-7,-11,-12,18,18,18,18,18,18,18,18,18,18,18,18,18,-27,-28,-14,-8,-13,40,18,-45,-8,40,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-31,-29,18,-30,40,]),'LSTR':([5,15,16,17,20,28,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[26,26,26,26,26,49,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'QSTR':([5,15,16,17,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'ADD':([5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,72,74,76,],[17,-8,32,-38,-39,-40,-41,-42,-43,-44,17,17,-10,-9,17,-13,-4,-5,-6,-7,-11,-12,17,17,17,17,17,17,17,17,17,17,17,17,17,32,-28,-14,-8,-13,32,17,-45,-8,32,-15,-16,-17,-18,32,32,32,32,32,32,32,32,-37,-31,-29,17,-30,32,]),'GET_F_NO':([5,15,16,17,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'MUL':([6,7,8,9,10,11,12,13,14,18,19,21,22,23,24,25,26,27,42,43,44,45,46,47,49,50,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,74,76,],[-8,30,-38,-39,-40,-41,-42,-43,-44,-10,-9,-13,-4,-5,-6,-7,-11,-12,30,-28,-14,-8,-13,30,-45,-8,30,-15,-16,30,30,30,30,30,30,30,30,30,30,-37,-31,-29,-30,30,]),'DIV':([6,7,8,9,10,11,12,13,14,18,19,21,22,23,24,25,26,27,42,43,44,45,46,47,49,50,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,74,76,],[-8,31,-38,-39,-40,-41,-42,-43,-44,-10,-9,-13,-4,-5,-6,-7,-11,-12,31,-28,-14,-8,-13,31,-45,-8,31,-15,-16,31,31,31,31,31,31,31,31,31,31,-37,-31,-29,-30,31,]),'LT':([6,7,8,9,10,11,12,13,14,18,19,21,22,23,24,25,26,27,42,43,44,45,46,47,49,50,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,74,76,],[-8,34,-38,-39,-40,-41,-42,-43,-44,-10,-9,-13,-4,-5,-6,-7,-11,-12,34,-28,-14,-8,-13,34,-45,-8,34,-15,-16,-17,-18,None,None,None,None,None,None,34,34,-37,-31,-29,-30,34,]),'GT':([6,7,8,9,10,11,12,13,14,18,19,21,22,23,24,25,26,27,42,43,44,45,46,47,49,50,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,74,76,],[-8,35,-38,-39,-40,-41,-42,-43,-44,-10,-9,-13,-4,-5,-6,-7,-11,-12,35,-28,-14,-8,-13,35,-45,-8,35,-15,-16,-17,-18,None,None,None,None,None,None,35,35,-37,-31,-29,-30,35,]),'LE':([6,7,8,9,10,11,12,13,14,18,19,21,22,23,24,25,26,27,42,43,44,45,46,47,49,50,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,74,76,],[-8,36,-38,-39,-40,-41,-42,-43,-44,-10,-9,-13,-4,-5,-6,-7,-11,-12,36,-28,-14,-8,-13,36,-45,-8,36,-15,-16,-17,-18,None,None,None,None,None,None,36,36,-37,-31,-29,-30,36,]),'GE':([6,7,8,9,10,11,12,13,14,18,19,21,22,23,24,25,26,27,42,43,44,45,46,47,49,50,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,74,76,],[-8,37,-38,-39,-40,-41,-42,-43,-44,-10,-9,-13,-4,-5,-6,-7,-11,-12,37,-28,-14,-8,-13,37,-45,-8,37,-15,-16,-17,-18,None,None,None,None,None,None,37,37,-37,-31,-29,-30,37,]),'EQ':([6,7,8,9,10,11,12,13,14,18,19,21,22,23,24,25,26,27,42,43,44,45,46,47,49,50,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,74,76,],[-8,38,-38,-39,-40,-41,-42,-43,-44,-10,-9,-13,-4,-5,-6,-7,-11,-12,38,-28,-14,-8,-13,38,-45,-8,38,-15,-16,-17,-18,None,None,None,None,None,None,38,38,-37,-31,-29,-30,38,]),'NE':([6,7,8,9,10,11,12,13,14,18,19,21,22,23,24,25,26,27,42,43,44,45,46,47,49,50,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,74,76,],[-8,39,-38,-39,-40,-41,-42,-43,-44,-10,-9,-13,-4,-5,-6,-7,-11,-12,39,-28,-14,-8,-13,39,-45,-8,39,-15,-16,-17,-18,None,None,None,None,None,None,39,39,-37,-31,-29,-30,39,]),'COMMA':([6,7,8,9,10,11,12,13,14,18,19,21,22,23,24,25,26,27,42,43,44,45,46,49,50,52,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,74,76,],[-8,-3,-38,-39,-40,-41,-42,-43,-44,-10,-9,-13,-4,-5,-6,-7,-11,-12,-27,-28,-14,-8,-13,-45,-8,72,-46,73,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-31,-29,-30,-47,]),'RPAREN':([6,7,8,9,10,11,12,13,14,18,19,21,22,23,24,25,26,27,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,74,75,76,77,],[-8,-3,-38,-39,-40,-41,-42,-43,-44,-10,-9,-13,-4,-5,-6,-7,-11,-12,-27,-28,-14,-8,-13,68,70,-45,-8,71,-33,-34,-46,-36,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,74,-31,-29,-30,-32,-47,-35,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'param_list':([0,],[1,]),'empty':([0,],[2,]),'key_value_pair':([1,29,48,72,73,],[3,55,55,55,55,]),'expression':([5,15,16,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[7,42,43,47,54,56,57,58,59,60,61,62,63,64,65,66,67,54,76,]),'monad':([5,15,16,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'dyad':([5,15,16,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'func_call':([5,15,16,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'proc_call':([5,15,16,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'asnum':([5,15,16,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'factor':([5,15,16,17,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[13,13,13,44,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'factor2':([5,15,16,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'frame_id_ref':([5,15,16,17,20,29,30,31,32,33,34,35,36,37,38,39,40,41,48,72,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'arg_list':([29,48,],[51,69,]),'expression_list':([29,48,],[52,52,]),'kwd_params':([29,48,72,73,],[53,53,75,77,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> param_list","S'",1,None,None,None),
+  ('param_list -> empty','param_list',1,'p_param_list1','param_parser.py',61),
+  ('param_list -> param_list key_value_pair','param_list',2,'p_param_list2','param_parser.py',65),
+  ('key_value_pair -> ID ASSIGN expression','key_value_pair',3,'p_key_value_pair','param_parser.py',70),
+  ('factor -> NUM','factor',1,'p_factor1','param_parser.py',75),
+  ('factor -> IDREF','factor',1,'p_factor2','param_parser.py',82),
+  ('factor -> ALIASREF','factor',1,'p_factor3','param_parser.py',86),
+  ('factor -> frame_id_ref','factor',1,'p_factor4','param_parser.py',90),
+  ('factor -> ID','factor',1,'p_factor6','param_parser.py',97),
+  ('factor -> OR','factor',1,'p_factor6','param_parser.py',98),
+  ('factor -> AND','factor',1,'p_factor6','param_parser.py',99),
+  ('factor -> LSTR','factor',1,'p_factor7','param_parser.py',104),
+  ('factor -> QSTR','factor',1,'p_factor8','param_parser.py',109),
+  ('factor -> REGREF','factor',1,'p_factor9','param_parser.py',113),
+  ('factor2 -> ADD factor','factor2',2,'p_factor_2_2','param_parser.py',121),
+  ('dyad -> expression MUL expression','dyad',3,'p_dyad1','param_parser.py',129),
+  ('dyad -> expression DIV expression','dyad',3,'p_dyad1','param_parser.py',130),
+  ('dyad -> expression ADD expression','dyad',3,'p_dyad1','param_parser.py',131),
+  ('dyad -> expression SUB expression','dyad',3,'p_dyad1','param_parser.py',132),
+  ('dyad -> expression LT expression','dyad',3,'p_dyad1','param_parser.py',133),
+  ('dyad -> expression GT expression','dyad',3,'p_dyad1','param_parser.py',134),
+  ('dyad -> expression LE expression','dyad',3,'p_dyad1','param_parser.py',135),
+  ('dyad -> expression GE expression','dyad',3,'p_dyad1','param_parser.py',136),
+  ('dyad -> expression EQ expression','dyad',3,'p_dyad1','param_parser.py',137),
+  ('dyad -> expression NE expression','dyad',3,'p_dyad1','param_parser.py',138),
+  ('dyad -> expression AND expression','dyad',3,'p_dyad1','param_parser.py',139),
+  ('dyad -> expression OR expression','dyad',3,'p_dyad1','param_parser.py',140),
+  ('monad -> NOT expression','monad',2,'p_monad1','param_parser.py',145),
+  ('monad -> SUB expression','monad',2,'p_monad1','param_parser.py',146),
+  ('func_call -> ID LPAREN arg_list RPAREN','func_call',4,'p_func_call','param_parser.py',151),
+  ('proc_call -> REGREF LPAREN arg_list RPAREN','proc_call',4,'p_proc_call','param_parser.py',155),
+  ('proc_call -> REGREF LPAREN RPAREN','proc_call',3,'p_proc_call2','param_parser.py',159),
+  ('arg_list -> expression_list COMMA kwd_params','arg_list',3,'p_arg_list1','param_parser.py',163),
+  ('arg_list -> expression_list','arg_list',1,'p_arg_list2','param_parser.py',170),
+  ('arg_list -> kwd_params','arg_list',1,'p_arg_list3','param_parser.py',175),
+  ('kwd_params -> key_value_pair COMMA kwd_params','kwd_params',3,'p_kwd_params1','param_parser.py',180),
+  ('kwd_params -> key_value_pair','kwd_params',1,'p_kwd_params2','param_parser.py',185),
+  ('asnum -> LPAREN expression RPAREN','asnum',3,'p_asnum1','param_parser.py',198),
+  ('expression -> monad','expression',1,'p_expression1','param_parser.py',202),
+  ('expression -> dyad','expression',1,'p_expression1','param_parser.py',203),
+  ('expression -> func_call','expression',1,'p_expression1','param_parser.py',204),
+  ('expression -> proc_call','expression',1,'p_expression1','param_parser.py',205),
+  ('expression -> asnum','expression',1,'p_expression1','param_parser.py',206),
+  ('expression -> factor','expression',1,'p_expression1','param_parser.py',207),
+  ('expression -> factor2','expression',1,'p_expression1','param_parser.py',208),
+  ('frame_id_ref -> GET_F_NO LSTR','frame_id_ref',2,'p_frame_id_acquisition','param_parser.py',212),
+  ('expression_list -> expression','expression_list',1,'p_expression_list1','param_parser.py',216),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list2','param_parser.py',220),
+  ('empty -> <empty>','empty',0,'p_epslion','param_parser.py',225),
+]
@@ -0,0 +1,310 @@
+#
+# sk_cache.py -- caching support for parsed skeleton files
+#
+"""
+Support for caching parsed skeleton (sk) files.
+
+skDiskCache keeps parse results between process restarts.  A cache entry
+is stored per skeleton file path and is only considered valid if the
+file's modification time, size and content hash, and the version of the
+parser grammar all agree with what was recorded when the entry was
+written.
+
+LRUCache is a bounded, thread-safe in-memory cache.
+"""
+import sys
+import os
+import hashlib
+import pickle
+import tempfile
+import threading
+import logging
+from collections import OrderedDict
+
+from g2base import Bunch
+
+from oscript.parse import sk_common, sk_lexer, param_parser, sk_parser
+
+# Bump this if the layout of a cache entry changes
+cache_format = 1
+
+# The skbunch fields saved in a cache entry
+skbunch_fields = ('ast', 'params', 'patterns', 'header')
+
+_grammar_version = None
+
+
+def grammar_version():
+    """Returns a string identifying the version of the skeleton file
+    parser.  It is derived from the source of the modules that determine
+    the shape of the AST, so that any change to the lexer, grammar or
+    AST classes invalidates previously cached entries.
+    """
+    global _grammar_version
+    if _grammar_version is None:
+        md = hashlib.sha1(('format=%d' % cache_format).encode())
+        for module in (sk_common, sk_lexer, param_parser, sk_parser):
+            with open(module.__file__, 'rb') as in_f:
+                md.update(in_f.read())
+        _grammar_version = md.hexdigest()
+
+    return _grammar_version
+
+
+class skDiskCache(object):
+    """A persistent, on-disk cache of parsed skeleton files.
+    Each entry is a pickled set of skbunch fields stored in (cache_dir)
+    under a name derived from the skeleton file path.
+    """
+
+    def __init__(self, cache_dir, logger=None):
+        if logger:
+            self.logger = logger
+        else:
+            self.logger = logging.getLogger('sk.diskcache')
+
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.version = grammar_version()
+
+    def identify(self, skpath):
+        """Reads the skeleton file at (skpath).  Returns a tuple of the
+        identity key of the file and its contents.
+        """
+        skpath = os.path.abspath(skpath)
+        with open(skpath, 'r') as in_f:
+            stat = os.fstat(in_f.fileno())
+            buf = in_f.read()
+
+        digest = hashlib.sha1(buf.encode('utf-8', 'surrogateescape')
+                              ).hexdigest()
+        key = (skpath, stat.st_mtime_ns, stat.st_size, digest, self.version)
+        return (key, buf)
+
+    def _entry_path(self, skpath):
+        name = hashlib.sha1(skpath.encode('utf-8', 'surrogateescape')
+                            ).hexdigest()
+        return os.path.join(self.cache_dir, name + '.skc')
+
+    def get(self, key):
+        """Returns the skbunch cached for identity (key), or None if
+        there is no valid entry.
+        """
+        entry_path = self._entry_path(key[0])
+        try:
+            with open(entry_path, 'rb') as in_f:
+                (entry_key, fields) = pickle.load(in_f)
+
+        except FileNotFoundError:
+            return None
+
+        except Exception as e:
+            self.logger.warning("Ignoring unreadable cache entry '%s': %s" % (
+                entry_path, str(e)))
+            return None
+
+        if entry_key != key:
+            # file or grammar has changed since this entry was written
+            return None
+
+        skbunch = Bunch.Bunch(errors=0, errinfo=[], filepath=key[0])
+        skbunch.update(fields)
+        return skbunch
+
+    def put(self, key, skbunch):
+        """Stores (skbunch) as the cache entry for identity (key).
+        Only error free parse results are cached.
+        """
+        if skbunch.errors > 0:
+            return
+
+        fields = { name: getattr(skbunch, name) for name in skbunch_fields }
+        entry_path = self._entry_path(key[0])
+        try:
+            # write to a temp file and rename, so that readers never see
+            # a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir,
+                                            suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as out_f:
+                    pickle.dump((key, fields), out_f,
+                                protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, entry_path)
+
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+
+        except Exception as e:
+            self.logger.warning("Failed to write cache entry for '%s': %s" % (
+                key[0], str(e)))
+
+    def clear(self):
+        """Removes all entries from the cache.
+        """
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.skc'):
+                try:
+                    os.unlink(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+
+def sizeof_ast(ast):
+    """Returns the approximate number of bytes of memory used by (ast).
+    """
+    size = sys.getsizeof(ast)
+    if isinstance(ast, sk_common.ASTNode):
+        size += sys.getsizeof(ast.items)
+        attributes = ast.get_attributes()
+        if len(attributes) > 0:
+            size += sys.getsizeof(attributes)
+        for item in ast.items:
+            size += sizeof_ast(item)
+
+    elif isinstance(ast, (list, tuple)):
+        for item in ast:
+            size += sizeof_ast(item)
+
+    return size
+
+
+def sizeof_skbunch(skbunch):
+    """Returns the approximate number of bytes of memory used by the
+    parse result (skbunch).
+    """
+    size = sizeof_ast(skbunch.ast)
+    for name in ('params', 'patterns', 'header'):
+        d = getattr(skbunch, name, {})
+        size += sys.getsizeof(d)
+        for (key, val) in d.items():
+            size += sys.getsizeof(key) + sizeof_ast(val)
+
+    return size
+
+
+class LRUCache(object):
+    """A thread-safe cache with a least recently used eviction policy.
+
+    Entries are evicted when there are more than (maxsize) of them, or
+    their total size, as computed by the function (sizeof), is more than
+    (maxbytes).  Either limit may be None for no limit.  Entries whose key
+    satisfies the predicate (is_pinned) are never evicted.
+    """
+
+    def __init__(self, maxsize=None, maxbytes=None, sizeof=None,
+                 is_pinned=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        if sizeof is None:
+            sizeof = sys.getsizeof
+        self.sizeof = sizeof
+        self.is_pinned = is_pinned
+
+        self.lock = threading.RLock()
+        # key -> (value, size), in order of least to most recently used
+        self.entries = OrderedDict()
+        self.nbytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getitem__(self, key):
+        with self.lock:
+            try:
+                (value, size) = self.entries[key]
+
+            except KeyError:
+                self.misses += 1
+                raise
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def peek(self, key, default=None):
+        """Returns the value for (key) without counting it as a use.
+        """
+        with self.lock:
+            try:
+                return self.entries[key][0]
+            except KeyError:
+                return default
+
+    def __setitem__(self, key, value):
+        if self.maxbytes is not None:
+            size = self.sizeof(value)
+        else:
+            size = 0
+
+        with self.lock:
+            if key in self.entries:
+                self.nbytes -= self.entries[key][1]
+            self.entries[key] = (value, size)
+            self.entries.move_to_end(key)
+            self.nbytes += size
+
+            self._evict()
+
+    def __delitem__(self, key):
+        with self.lock:
+            (value, size) = self.entries.pop(key)
+            self.nbytes -= size
+
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.entries
+
+    def __len__(self):
+        with self.lock:
+            return len(self.entries)
+
+    def keys(self):
+        with self.lock:
+            return list(self.entries.keys())
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+
+    def _over_budget(self):
+        return (((self.maxsize is not None) and
+                 (len(self.entries) > self.maxsize)) or
+                ((self.maxbytes is not None) and
+                 (self.nbytes > self.maxbytes)))
+
+    def _evict(self):
+        # Evict least recently used, unpinned entries until we are within
+        # budget.  Must be called with the lock held.
+        if not self._over_budget():
+            return
+
+        for key in list(self.entries.keys()):
+            if (self.is_pinned is not None) and self.is_pinned(key):
+                continue
+
+            (value, size) = self.entries.pop(key)
+            self.nbytes -= size
+            self.evictions += 1
+
+            if not self._over_budget():
+                break
+
+    def stats(self):
+        """Returns a dict of the cache statistics.
+        """
+        with self.lock:
+            return dict(hits=self.hits, misses=self.misses,
+                        evictions=self.evictions, entries=len(self.entries),
+                        bytes=self.nbytes)
+
+#END
@@ -2,7 +2,10 @@
 # support for sk interpretation -- common items
 #
 import sys, re
+import itertools
+import types
 import threading
+import weakref
 
 # top-level regular expression matching a skeleton file
 # old style
@@ -46,39 +49,93 @@ def mk_error(buf, errbnch, deltalines):
         return '\n'.join(res)
 
 def get_skparts(buf):
+    return split_skparts(match_skparts(buf))
 
-    def process_match(match):
-        # Count lines before command section to get accurate line number
-        # reporting
-        startline = len(match.group('top').split('\n')) - 1
+def split_skparts(match):
+    """Returns the parts of the sk file contents for the match object from
+    match_skparts(), as get_skparts() does.
+    """
+    # Count lines before command section to get accurate line number
+    # reporting
+    startline = len(match.group('top').split('\n')) - 1
 
-        hdrbuf = match.group('hdr').strip()
-        prmbuf = match.group('params').strip().replace('\t', ' ')
-        cmdbuf = match.group('cmd').strip()
+    hdrbuf = match.group('hdr').strip()
+    prmbuf = match.group('params').strip().replace('\t', ' ')
+    cmdbuf = match.group('cmd').strip()
 
-        return (hdrbuf, prmbuf, cmdbuf, startline)
+    return (hdrbuf, prmbuf, cmdbuf, startline)
 
+def match_skparts(buf):
+    """Returns the match object of the regex splitting the sk file
+    contents (buf) into its parts.
+    """
     match = sk_regex1.match(buf)
     if match:
-        return process_match(match)
+        return match
 
     match = sk_regex2.match(buf)
     if match:
-        return process_match(match)
+        return match
 
     raise skError("sk file contents do not match expected format")
 
+def get_cmd_offset(match):
+    """Returns the offset in the sk file contents of the command part
+    returned by get_skparts(), given the match object from
+    match_skparts().
+    """
+    cmd = match.group('cmd')
+    return match.start('cmd') + len(cmd) - len(cmd.lstrip())
+
+
+# Shared, read-only attributes of nodes that have none
+no_attributes = types.MappingProxyType({})
 
 class ASTNode(object):
+    # Large numbers of these are created, so keep them compact.
+    # (cls) may be set by the interpreter; it is not set by default.
+    # (compiled) is set by the evaluator to the compiled form of an
+    # expression node.
+    __slots__ = ('serial_num', 'tag', 'name', 'items', '_attributes', 'cls',
+                 'compiled', '__weakref__')
 
     def __init__(self, tag, *args, **kwargs):
         self.serial_num = seq_num.bump()
+        if type(tag) is str:
+            tag = sys.intern(tag)
         self.tag = tag
         self.name = tag
-        self.items = []
-        for anItem in args:
-            self.items.append(anItem)
-        self.attributes = kwargs
+        self.items = list(args)
+        # attributes dict is allocated only if needed
+        self._attributes = kwargs or None
+
+    @property
+    def attributes(self):
+        if self._attributes is None:
+            self._attributes = {}
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, attributes):
+        self._attributes = attributes
+
+    def get_attributes(self):
+        """Returns the attributes of this node without allocating a dict
+        for them if there are none.  The result must not be modified.
+        """
+        if self._attributes is None:
+            return no_attributes
+        return self._attributes
+
+    def __getstate__(self):
+        # compiled expressions cannot be pickled, and are rebuilt as needed
+        state = {}
+        for name in self.__slots__:
+            if name in ('compiled', '__weakref__'):
+                continue
+            if hasattr(self, name):
+                state[name] = getattr(self, name)
+        return (None, state)
 
     def append(self, item):
         self.items.append(item)
@@ -115,16 +172,208 @@ class ASTNode(object):
         return "ASTNode('%s', %s)" % (self.tag, ", ".join([repr(i) for i in self.items]))
 
 
+# Kinds of expressions closed over, from the most to the least cacheable
+# (see classify_expr())
+EXPR_PURE = 0
+EXPR_STATUS = 1
+EXPR_FRAME = 2
+EXPR_VOLATILE = 3
+
+# Expression nodes whose values depend only on their items
+pure_expr_tags = frozenset(['number', 'string', 'id_ref', 'dyad', 'monad',
+                            'asnum', 'expression_list', 'arg_list',
+                            'key_value_pair'])
+# Built in functions returning new immutable values
+pure_funcs = frozenset(['sin', 'cos', 'tan', 'int', 'float', 'format'])
+
+# Kinds of expression ASTs, for classify_expr()
+expr_kinds = weakref.WeakKeyDictionary()
+
+def classify_expr(ast):
+    """Returns the kind of the expression (ast): EXPR_PURE if it consists
+    of literals and $ variables only, EXPR_STATUS if it also reads status
+    aliases, EXPR_FRAME if it allocates frames and EXPR_VOLATILE if it
+    depends on anything else (registers, procedures...).
+    """
+    if isinstance(ast, ASTNode):
+        try:
+            return expr_kinds[ast]
+
+        except KeyError:
+            pass
+
+    res = EXPR_PURE
+    todo = [ast]
+    while (len(todo) > 0) and (res < EXPR_VOLATILE):
+        node = todo.pop()
+        if isinstance(node, ASTNode):
+            tag = node.tag
+            if tag in pure_expr_tags:
+                todo.extend(node.items)
+            elif tag == 'alias_ref':
+                res = max(res, EXPR_STATUS)
+            elif tag == 'frame_id_ref':
+                res = max(res, EXPR_FRAME)
+            elif tag in ('qstring', 'lstring', 'list'):
+                # references interpolated into the string
+                stg = node.items[0]
+                if '@' in stg:
+                    res = EXPR_VOLATILE
+                elif '&' in stg:
+                    res = max(res, EXPR_FRAME)
+                elif '!' in stg:
+                    res = max(res, EXPR_STATUS)
+            elif tag == 'func_call':
+                func_name = node.items[0].lower()
+                if func_name in pure_funcs:
+                    todo.extend(node.items[1:])
+                elif func_name == 'frame':
+                    res = max(res, EXPR_FRAME)
+                else:
+                    res = EXPR_VOLATILE
+            else:
+                res = EXPR_VOLATILE
+
+        elif isinstance(node, Closure):
+            res = max(res, node.kind)
+
+        elif not isinstance(node, (str, int, float, type(None))):
+            res = EXPR_VOLATILE
+
+    if isinstance(ast, ASTNode):
+        expr_kinds[ast] = res
+    return res
+
+
+# Dependencies of the values of the closures being thawed, per thread
+memo_local = threading.local()
+
+def note_dependency(obj, token):
+    """Records that the values of the closures being thawed in this
+    thread depend on (obj), and remain valid only as long as
+    obj.memo_token() is (token).  (obj) None means they cannot be
+    memoized.
+    """
+    stack = getattr(memo_local, 'stack', None)
+    if stack:
+        stack[-1].append((obj, token))
+
+def note_volatile():
+    note_dependency(None, None)
+
+
 class Closure(object):
+    """An expression (ast) closed over the evaluator (eval).
+
+    Closures over pure and status dependent expressions memoize their
+    value, along with the variable resolvers and status snapshot it was
+    computed from (see note_dependency()); the value is reused while none
+    of them has changed.  Status dependent values are therefore only
+    reused within the status snapshot scope of the evaluator, if any (see
+    the status_scope setting of skBank).
+    """
     def __init__(self, ast, eval):
         self.ast = ast
         self.eval = eval
+        self.kind = classify_expr(ast)
+        # (value, dependencies) if memoized
+        self.memo = None
 
     def thaw(self):
-        return self.eval.eval(self.ast)
+        memo = self.memo
+        if memo is not None:
+            (val, deps) = memo
+            for (obj, token) in deps:
+                if obj.memo_token() is not token:
+                    break
+            else:
+                for (obj, token) in deps:
+                    note_dependency(obj, token)
+                return val
+
+        if self.kind >= EXPR_FRAME:
+            note_volatile()
+            return self.eval.eval(self.ast)
+
+        stack = getattr(memo_local, 'stack', None)
+        if stack is None:
+            stack = memo_local.stack = []
+        deps = []
+        stack.append(deps)
+        try:
+            val = self.eval.eval(self.ast)
+
+        finally:
+            stack.pop()
+
+        # memoize unless it depends on anything volatile
+        deps = tuple(dict([((id(obj), id(token)), (obj, token))
+                           for (obj, token) in deps]).values())
+        for (obj, token) in deps:
+            note_dependency(obj, token)
+        if (None, None) not in deps:
+            self.memo = (val, deps)
+        return val
+
+
+# Tables of the methods of ASTVisitor classes: class -> (dict of the
+# methods by tag, default method)
+visit_tables = {}
+
+class ASTVisitor(object):
+    """Mixin for the classes walking ASTs, that handle the nodes tagged
+    <tag> with their method named (visit_prefix) + <tag>, and the others
+    with their method named (visit_default), if it is set.
+
+    visit_method() looks methods up in a table built once per class, on
+    first use.  The methods it returns are plain functions, to be called
+    with the instance as first argument.
+    """
+
+    visit_prefix = None
+    visit_default = None
+
+    @classmethod
+    def visit_table(cls):
+        """Returns the table of the methods of this class, building it
+        if needed.
+        """
+        try:
+            return visit_tables[cls]
+
+        except KeyError:
+            pass
+
+        methods = {}
+        prefix = cls.visit_prefix
+        for name in dir(cls):
+            if name.startswith(prefix):
+                method = getattr(cls, name)
+                if callable(method):
+                    methods[name[len(prefix):]] = method
+
+        default = None
+        if cls.visit_default is not None:
+            default = getattr(cls, cls.visit_default)
+
+        res = (methods, default)
+        visit_tables[cls] = res
+        return res
+
+    def visit_method(self, tag):
+        """Returns the method handling the nodes tagged (tag), or None if
+        there is none.
+        """
+        try:
+            (methods, default) = visit_tables[self.__class__]
+
+        except KeyError:
+            (methods, default) = self.visit_table()
+
+        return methods.get(tag, default)
 
 
-class IssueAST(object):
+class IssueAST(ASTVisitor):
     """Take an AST and turn it back into a textual string representing
     the code.
     !!!NOTE!!!
@@ -132,16 +381,13 @@ class IssueAST(object):
          accordingly!! ***
     """
 
+    visit_prefix = 'issue_'
+    visit_default = 'issue_default'
+
     def issue(self, ast):
         if isinstance(ast, ASTNode):
-            try:
-                #print "issue_%s" % ast.tag
-                method = getattr(self, 'issue_%s' % ast.tag)
-
-            except AttributeError:
-                method = self.issue_default
-
-            return method(ast)
+            method = self.visit_method(ast.tag)
+            return method(self, ast)
 
         elif isinstance(ast, Closure):
             return '~' + self.issue(ast.ast)
@@ -317,6 +563,15 @@ class IssueAST(object):
         params = self.issue(ast.items[0])
         return 'ASN %s' % (params)
 
+    def issue_deferred_for(self, ast):
+        # the body is issued as it was before decoding, as its iterations
+        # are decoded only as they are executed
+        (body_ast, loop_count, var_lst, val_lst) = ast.items[:4]
+        return '*FOR %d %s IN "%s"\n%s\n*ENDFOR' % (
+            loop_count, ' '.join(var_lst),
+            ' '.join([str(val) for val in val_lst]),
+            SourceAST().issue(body_ast))
+
     def issue_abscmd(self, ast):
         (cmd, params) = [self.issue(x) for x in ast.items]
         return '%s %s' % (cmd, params)
@@ -330,21 +585,68 @@ class IssueAST(object):
             return "AST(%s:[%s])" % (ast.tag, ' '.join(params))
 
 
+class SourceAST(IssueAST):
+    """Like IssueAST, but the text of the statements that may be left
+    undecoded in a decoded AST (the bodies of deferred *FOR loops) is in
+    the syntax of sk files, so that it parses back to the same AST.
+    """
+
+    def issue_cmdlist(self, ast):
+        stmts = [self.issue(a) for a in ast.items]
+        return '\n'.join(stmts)
+
+    def issue_nop(self, ast):
+        return ''
+
+    def issue_frame_id_ref(self, ast):
+        return "&GET_F_NO[%s]" % (ast.items[0])
+
+    def issue_arg_list(self, ast):
+        args = [self.issue(a) for a in ast.items]
+        return ', '.join(args)
+
+    def issue_proc_call(self, ast):
+        # (the name keeps its '@')
+        if ast.items[1] is None:
+            return "%s()" % (ast.items[0])
+        return "%s(%s)" % (ast.items[0], self.issue(ast.items[1]))
+
+    def issue_let(self, ast):
+        p = [self.issue(a) for a in ast.items]
+        return "LET %s IN %s" % (p[0], p[1])
+
+    def _issue_conds(self, ast, prefix):
+        res = []
+        for idx in range(len(ast.items)):
+            (pred_ast, body_ast) = ast.items[idx].items
+            if pred_ast is True:
+                res.append("%sELSE" % (prefix))
+            elif idx == 0:
+                res.append("%sIF %s" % (prefix, self.issue(pred_ast)))
+            else:
+                res.append("%sELIF %s" % (prefix, self.issue(pred_ast)))
+            res.append(self.issue(body_ast))
+
+        res.append("%sENDIF" % (prefix))
+        return '\n'.join(res)
+
+    def issue_if_list(self, ast):
+        return self._issue_conds(ast, '')
+
+    def issue_star_if(self, ast):
+        return self._issue_conds(ast, '*')
+
+
 class SequenceNumber(object):
     def __init__(self, seq_num=0):
-        self.seq_num = seq_num
-        self.lock = threading.RLock()
+        # next() on an itertools.count is atomic, so no lock is needed
+        self.counter = itertools.count(seq_num)
 
     def reset(self, seq_num):
-        with self.lock:
-            self.seq_num = seq_num
+        self.counter = itertools.count(seq_num)
 
     def bump(self):
-        with self.lock:
-            seq_num = self.seq_num
-            self.seq_num += 1
-
-            return seq_num
+        return next(self.counter)
 
 # For generating serial numbers, an atomic bump-type counter
 seq_num = SequenceNumber(0)
@@ -7,7 +7,7 @@ import io
 
 from g2base import Bunch, ssdlog
 
-from oscript.parse.sk_common import ASTNode, skError
+from oscript.parse.sk_common import ASTNode, ASTVisitor, skError
 from oscript.parse import sk_interp
 
 class SkCompileError(skError):
@@ -24,9 +24,12 @@ def get_subsys(obe_id, obe_mode):
 # COMPILER
 ##############################################################
 
-class SkCompiler(object):
+class SkCompiler(ASTVisitor):
     """
     """
+
+    visit_prefix = 'skcompile_'
+
     def __init__(self, sk_bank, logger, append_mode=False):
         """SkCompiler constructor.  (params) is a dict of the initial
         environment (variables & values) of the skcompiler.  (sk_bank) is
@@ -79,18 +82,13 @@ class SkCompiler(object):
             raise SkCompileError("Unexpected type in compiling: %s (%s)" % (
                 str(ast), str(type(ast))))
 
-        try:
-            skcompile_method = getattr(self, 'skcompile_%s' % ast.tag)
-
-            if not callable(skcompile_method):
-                raise SkCompileError("Not a valid skcompile method '%s'" % ast.tag)
-
-        except AttributeError:
+        skcompile_method = self.visit_method(ast.tag)
+        if skcompile_method is None:
             # ==> There is no function "skcompile_XXX" for the tag XXX of the ast.
             raise SkCompileError("No compilation method for AST=%s" % (str(ast)))
 
         try:
-            return skcompile_method(ast, indent=indent)
+            return skcompile_method(self, ast, indent=indent)
 
         except AssertionError as e:
             raise SkCompileError(str(e))
@@ -5,15 +5,23 @@ oscript ("skeleton") file decoding and interpretation routines.
 
 import sys, os, glob
 import math, re
+import operator
+import time
+import itertools
+import threading
+import weakref
+import contextlib
 import logging
+import concurrent.futures
 
 from g2base import Bunch
-from g2cam.INS import INSdata as INSconfig
 
 from oscript.parse import sk_lexer
 from oscript.parse import sk_parser
 from oscript.parse import sk_common
-from oscript.parse.sk_common import ASTNode, skError, Closure
+from oscript.parse import sk_cache
+from oscript.parse.sk_common import ASTNode, skError, Closure, \
+     note_dependency, note_volatile
 
 strtype = str
 
@@ -37,9 +45,68 @@ def get_subsys(obe_id, obe_mode):
 class skBank(object):
     """This kind of object abstracts the lookup and creation of the
     skeleton files ASTs.
+
+    If (cache_dir) is given, parse results are also kept in a persistent
+    cache in that directory, so that unchanged files do not need to be
+    parsed again after a restart.
+
+    If (check_ttl) is given, lookup() checks whether a cached sk file
+    has been modified if it has not done so in the last (check_ttl)
+    seconds, and reparses it if it has.  Every parse result gets a new
+    (version) number; a reload never modifies the result that was handed
+    out previously, so tasks keep running with the version they started
+    with.
+
+    The number of parse results kept in memory may be limited with
+    (cache_maxsize), and their approximate total size in bytes with
+    (cache_maxbytes); the least recently used ones are discarded first.
+    See pin() for exempting the modes of an instrument.
+
+    The bank may be used from several threads at once.  Each thread gets
+    its own parsers, and concurrent lookups of an sk file that is not yet
+    cached wait for a single parse of it.  prefetch() parses an sk file in
+    the background with up to (prefetch_workers) threads.
+
+    The bank records which abstract commands each sk file calls with a
+    *SUB whose command name is a constant.  If (prefetch_subs) is True,
+    these are prefetched in the background when the calling file is
+    loaded.  Invalidating
+    or reloading an sk file also invalidates the files that call it,
+    transitively.
+
+    If (memo_decode) is True, tasks may reuse the result of an earlier
+    decoding of the same abstract command; see DecodeCache.
+
+    If (fast_scan) is True, the parsers use sk_lexer.skFastScanner,
+    which produces the same tokens as the ply based scanner, faster.
+
+    parse_params() and parse_opecmd() keep the ASTs of up to
+    (parse_cache_maxsize) recently parsed strings, for commands that are
+    sent repeatedly.
+
+    If (optimize) is True, the ASTs of sk files are simplified by an
+    Optimizer when they are cached, so that their constant parts are not
+    worked out again by every decoding.
+
+    (status_scope) is the scope of the status snapshots of tasks: with
+    'statement', the status values read while decoding, and while
+    evaluating each statement, come from a single snapshot, fetched
+    together, within which closures over status are memoized.  With None
+    (the default), status is fetched each time it is read.
+
+    If (lazy_for) is True, tasks decode the iterations of *FOR loops as
+    they execute them, rather than unrolling the loops up front; see
+    Decoder.  The commands of these iterations are not in the AST sent
+    to the command monitor, which therefore shows the loops but does not
+    track their commands.
     """
 
-    def __init__(self, sk_basedir, logger=None):
+    def __init__(self, sk_basedir, logger=None, cache_dir=None,
+                 check_ttl=None, cache_maxsize=None, cache_maxbytes=None,
+                 prefetch_workers=2, prefetch_subs=False, memo_decode=False,
+                 decode_cache_maxsize=256, fast_scan=False,
+                 parse_cache_maxsize=1024, optimize=False, lazy_for=False,
+                 status_scope=None):
         if logger:
             self.logger = logger
         else:
@@ -47,33 +114,242 @@ class skBank(object):
 
         # Base directory of sk files
         self.sk_basedir = sk_basedir
-        self.cache = Bunch.threadSafeBunch()
+        # Set of (obe_id, obe_mode) whose entries are never evicted;
+        # obe_mode of None pins all modes of obe_id
+        self.pinned = set()
+        self.cache = sk_cache.LRUCache(maxsize=cache_maxsize,
+                                       maxbytes=cache_maxbytes,
+                                       sizeof=sk_cache.sizeof_skbunch,
+                                       is_pinned=self._is_pinned)
+
+        # Interval for checking cached sk files for modifications
+        self.check_ttl = check_ttl
+        # For numbering the versions of parsed sk files
+        self._versions = itertools.count(1)
+
+        # Optional persistent cache of parsed sk files
+        if cache_dir:
+            self.disk_cache = sk_cache.skDiskCache(cache_dir,
+                                                   logger=self.logger)
+        else:
+            self.disk_cache = None
+
+        # Parsers are not reentrant, so each thread has its own set
+        self._local = threading.local()
+
+        # Keys of sk files being loaded -> future for the parse result
+        self._loading = {}
+        self._lock = threading.RLock()
 
-        lexer = sk_lexer.skScanner(logger=self.logger, debug=False,
-                                   lextab='scan1_tab')
-        self.param_parser = sk_parser.paramParser(lexer, logger=self.logger)
-        self.param_parser.build()
-        self.param_parser.reset()
+        self.prefetch_workers = prefetch_workers
+        self._executor = None
 
-        lexer = sk_lexer.skScanner(logger=self.logger, debug=False,
-                                   lextab='scan2_tab')
-        self.ope_parser = sk_parser.opeParser(lexer, logger=self.logger)
-        self.ope_parser.build()
-        self.ope_parser.reset()
+        # *SUB dependency graph: key -> set of keys it calls, and
+        # key -> set of keys calling it
+        self.prefetch_subs = prefetch_subs
+        self.deps = {}
+        self.rdeps = {}
 
-        lexer = sk_lexer.skScanner(logger=self.logger, debug=False,
-                                   lextab='scan3_tab')
-        self.sk_parser = sk_parser.skParser(lexer, logger=self.logger)
-        self.sk_parser.build()
-        self.sk_parser.reset()
+        # Cache of decoding results
+        self.memo_decode = memo_decode
+        self.decode_cache = DecodeCache(self, maxsize=decode_cache_maxsize,
+                                        logger=self.logger)
+        self.lazy_for = lazy_for
+
+        if status_scope not in status_scopes:
+            raise skError("Bad status snapshot scope: %s" % str(status_scope))
+        self.status_scope = status_scope
+
+        self.fast_scan = fast_scan
+        if fast_scan:
+            self.scanner_class = sk_lexer.skFastScanner
+        else:
+            self.scanner_class = sk_lexer.skScanner
+
+        # Cache of parsed parameter and command strings:
+        # (kind, normalized string) -> AST
+        self.parse_cache = sk_cache.LRUCache(maxsize=parse_cache_maxsize)
+
+        # Simplifies the ASTs of sk files as they are cached
+        if optimize:
+            self.optimizer = Optimizer()
+        else:
+            self.optimizer = None
+
+
+    def _get_parser(self, name, klass, lextab):
+        parser = getattr(self._local, name, None)
+        if parser is None:
+            lexer = self.scanner_class(logger=self.logger, debug=False,
+                                       lextab=lextab)
+            parser = klass(lexer, logger=self.logger)
+            parser.build()
+            parser.reset()
+            setattr(self._local, name, parser)
+
+        return parser
+
+    @property
+    def param_parser(self):
+        return self._get_parser('param_parser', sk_parser.paramParser,
+                                'scan1_tab')
+
+    @property
+    def ope_parser(self):
+        return self._get_parser('ope_parser', sk_parser.opeParser,
+                                'scan2_tab')
+
+    @property
+    def sk_parser(self):
+        return self._get_parser('sk_parser', sk_parser.skParser,
+                                'scan3_tab')
+
+
+    def _parse_cached(self, kind, buf, parse):
+        # Blanks around the string do not change the parse
+        key = (kind, buf.strip(' \t\n'))
+        ast = self.parse_cache.get(key)
+        if ast is None:
+            (errors, ast, errinfo) = parse(buf)
+            if errors > 0:
+                # Errors are not cached
+                return (errors, ast, errinfo)
+            self.parse_cache[key] = ast
+
+        # The cached AST is never handed out, as decoding may modify it
+        return (0, copy_ast(ast), [])
+
+    def parse_params(self, buf):
+        """Like paramParser.parse_params(), but cached.  Returns a tuple
+        of the number of errors, the AST and the error info; the AST is
+        the caller's own copy.
+        """
+        return self._parse_cached('params', buf,
+                                  self.param_parser.parse_params)
+
+    def parse_opecmd(self, buf):
+        """Like opeParser.parse_opecmd(), but cached.  Returns a tuple
+        of the number of errors, the AST and the error info; the AST is
+        the caller's own copy.
+        """
+        return self._parse_cached('opecmd', buf,
+                                  self.ope_parser.parse_opecmd)
 
 
     def preload_skfiles(self, obe_id, obe_mode):
         for skfile in glob.glob('%s/%s/sk/%s/*.sk' % (self.sk_basedir,
                                                       obe_id.upper(),
                                                       obe_mode.upper())):
-            (abscmd, ext) = os.path.splitext(skfile)
-            self.load_skfile(obe_id, obe_mode, abscmd)
+            (abscmd, ext) = os.path.splitext(os.path.basename(skfile))
+            # waits for, rather than repeats, a load of the same file by
+            # another thread
+            self._load_once((obe_id.upper(), obe_mode.upper(),
+                             abscmd.upper()))
+
+
+    def preload_all(self, obe_list, workers=None):
+        """Parses all the sk files of every mode of the instruments in
+        (obe_list), spreading the work over (workers) processes (defaults
+        to the number of CPUs).  The results are cached for future lookups.
+
+        Returns a dict, indexed by (obe_id, obe_mode, abscmd), of error
+        messages for the files that could not be parsed cleanly; parse
+        errors are not logged otherwise.
+        """
+        # Make sure the parse tables are up to date before any worker
+        # processes are started, so that they don't all try to write them
+        self.sk_parser
+
+        jobs = []
+        for obe_id in obe_list:
+            for modepath in glob.glob('%s/%s/sk/*' % (self.sk_basedir,
+                                                      obe_id.upper())):
+                # skip things that aren't folders
+                if not os.path.isdir(modepath):
+                    continue
+                obe_mode = os.path.basename(modepath)
+
+                for skpath in glob.glob('%s/*.sk' % (modepath)):
+                    (abscmd, ext) = os.path.splitext(
+                        os.path.basename(skpath))
+                    key = (obe_id.upper(), obe_mode.upper(), abscmd.upper())
+                    jobs.append((key, skpath))
+
+        report = {}
+        pending = []
+        stamps = {}
+        for (key, skpath) in jobs:
+            stamps[key] = self._file_stamp(skpath)
+
+            if self.disk_cache is None:
+                pending.append((key, skpath, None, None))
+                continue
+
+            try:
+                (diskkey, buf) = self.disk_cache.identify(skpath)
+
+            except Exception as e:
+                report[key] = str(e)
+                continue
+
+            skbunch = self.disk_cache.get(diskkey)
+            if skbunch is not None:
+                skbunch.filepath = skpath
+                self._add_to_cache(key, skbunch, stamps[key])
+            else:
+                pending.append((key, skpath, diskkey, buf))
+
+        def add_result(key, skpath, diskkey, res):
+            errinfo = [Bunch.Bunch(**d) for d in res.pop('errinfo')]
+            skbunch = Bunch.Bunch(errinfo=errinfo, **res)
+            # serial numbers assigned in the workers overlap each other
+            renumber_ast(skbunch.ast)
+            skbunch.filepath = skpath
+
+            if diskkey is not None:
+                self.disk_cache.put(diskkey, skbunch)
+            self._add_to_cache(key, skbunch, stamps[key])
+
+            if skbunch.errors > 0:
+                report[key] = "%d errors parsing skeleton file '%s':\n%s" % (
+                    skbunch.errors, skpath,
+                    '\n'.join([d.verbose or d.errstr for d in errinfo]))
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if (workers <= 1) or (len(pending) <= 1):
+            for (key, skpath, diskkey, buf) in pending:
+                try:
+                    res = preload_parse_skfile(skpath, buf,
+                                               fast_scan=self.fast_scan)
+                except Exception as e:
+                    report[key] = str(e)
+                    continue
+                add_result(key, skpath, diskkey, res)
+
+        else:
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=workers) as executor:
+                futures = {}
+                for job in pending:
+                    (key, skpath, diskkey, buf) = job
+                    future = executor.submit(preload_parse_skfile, skpath,
+                                             buf, fast_scan=self.fast_scan)
+                    futures[future] = job
+
+                for future in concurrent.futures.as_completed(futures):
+                    (key, skpath, diskkey, buf) = futures[future]
+                    try:
+                        res = future.result()
+                    except Exception as e:
+                        report[key] = str(e)
+                        continue
+                    add_result(key, skpath, diskkey, res)
+
+        self.logger.info("preloaded %d sk files (%d with errors)" % (
+            len(jobs), len(report)))
+        return report
 
 
     def load_skfile(self, obe_id, obe_mode, abscmd):
@@ -88,12 +364,130 @@ class skBank(object):
         skpath = '%s/%s/sk/%s/%s.sk' % (
             self.sk_basedir, obe_id, obe_mode, abscmd)
 
-        # may raise skParseError or skLexError
-        skbunch = self.sk_parser.parse_skfile(skpath)
+        # note the file's state before reading it, so that a modification
+        # made while we are parsing is picked up by the next check
+        stamp = self._file_stamp(skpath)
+
+        if self.disk_cache is None:
+            # may raise skParseError or skLexError
+            skbunch = self.sk_parser.parse_skfile(skpath)
+
+        else:
+            skbunch = self._load_cached_skfile(skpath)
 
         # cache it
-        self.cache[(obe_id, obe_mode, abscmd)] = skbunch
+        key = (obe_id, obe_mode, abscmd)
+        self._add_to_cache(key, skbunch, stamp)
+
+        if self.prefetch_subs:
+            self._prefetch_deps(key)
+
+        return skbunch
+
+
+    def _file_stamp(self, skpath):
+        """Returns a value that changes whenever the file at (skpath) is
+        modified, or None if the file cannot be accessed.
+        """
+        try:
+            stat = os.stat(skpath)
+        except OSError:
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size)
+
+
+    def _add_to_cache(self, key, skbunch, stamp):
+        skbunch.version = next(self._versions)
+        skbunch.stamp = stamp
+        skbunch.checked = time.monotonic()
+
+        if (self.optimizer is not None) and (skbunch.errors == 0):
+            skbunch.ast = self.optimizer.optimize(skbunch.ast)
+
+        self.cache[key] = skbunch
+        self._set_deps(key, get_sub_deps(key, skbunch.ast))
+
+
+    def _set_deps(self, key, deps):
+        with self._lock:
+            for dep in self.deps.get(key, ()):
+                self.rdeps[dep].discard(key)
+
+            self.deps[key] = deps
+            for dep in deps:
+                self.rdeps.setdefault(dep, set()).add(key)
+
+
+    def _prefetch_deps(self, key):
+        """Starts loading the sk files called by the sk file identified by
+        (key) that are not already cached or being loaded.
+        """
+        with self._lock:
+            deps = [dep for dep in self.deps.get(key, ())
+                    if (dep not in self.cache) and (dep not in self._loading)]
+
+        for dep in deps:
+            future = self.prefetch(*dep)
+            future.add_done_callback(self._prefetch_done)
+
+    def _prefetch_done(self, future):
+        # No one waits for the result of prefetching a dependency, so its
+        # errors are logged here; lookup() raises them again
+        e = future.exception()
+        if e is not None:
+            self.logger.warning("Error prefetching sk file: %s" % (str(e)))
+
+
+    def dependents(self, obe_id, obe_mode, abscmd):
+        """Returns the set of keys of the sk files known to call the one
+        identified by (obe_id), (obe_mode) and (abscmd), directly or
+        indirectly.
+        """
+        key = (obe_id.upper(), obe_mode.upper(), abscmd.upper())
+        res = set()
+        with self._lock:
+            todo = [key]
+            while len(todo) > 0:
+                for parent in self.rdeps.get(todo.pop(), ()):
+                    if parent not in res:
+                        res.add(parent)
+                        todo.append(parent)
+
+        res.discard(key)
+        return res
+
+
+    def _is_stale(self, skbunch):
+        """Returns True if the sk file of the cached (skbunch) has been
+        modified since it was parsed.  The file is checked at most once per
+        (check_ttl) seconds.
+        """
+        now = time.monotonic()
+        if now - skbunch.checked < self.check_ttl:
+            return False
+        skbunch.checked = now
+
+        return self._file_stamp(skbunch.filepath) != skbunch.stamp
+
+
+    def _load_cached_skfile(self, skpath):
+        """Gets the parse result for the sk file at (skpath) from the
+        persistent cache if the file is unchanged, otherwise parses the
+        file and updates the persistent cache.
+        """
+        (key, buf) = self.disk_cache.identify(skpath)
+
+        skbunch = self.disk_cache.get(key)
+        if skbunch is not None:
+            skbunch.filepath = skpath
+            return skbunch
+
+        # may raise skParseError or skLexError
+        skbunch = self.sk_parser.parse_skbuf(buf)
+        skbunch.filepath = skpath
 
+        self.disk_cache.put(key, skbunch)
         return skbunch
 
 
@@ -105,28 +499,263 @@ class skBank(object):
         obe_mode = obe_mode.upper()
         abscmd = abscmd.upper()
 
+        key = (obe_id, obe_mode, abscmd)
         try:
-            skbunch = self.cache[(obe_id, obe_mode, abscmd)]
+            skbunch = self.cache[key]
 
         except KeyError:
-            skbunch = self.load_skfile(obe_id, obe_mode, abscmd)
+            return self._load_once(key)
+
+        if (self.check_ttl is not None) and self._is_stale(skbunch):
+            self.logger.info("sk file '%s' has changed (version %d)--reloading" % (
+                skbunch.filepath, skbunch.version))
+            # the old parse result is left as is for any tasks using it
+            skbunch = self._load_once(key, stale=skbunch)
+            self._invalidate_keys(self.dependents(*key))
 
         return skbunch
 
 
+    def _load_once(self, key, stale=None):
+        """Loads the sk file identified by (key), unless another thread is
+        already doing so, in which case its result is awaited and shared.
+        (stale) is the cache entry being replaced, if any.
+        """
+        with self._lock:
+            future = self._loading.get(key, None)
+            if future is None:
+                # check whether a load finished since our lookup missed
+                skbunch = self.cache.peek(key)
+                if (skbunch is not None) and (skbunch is not stale):
+                    return skbunch
+
+                future = concurrent.futures.Future()
+                self._loading[key] = future
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            # may raise skParseError or skLexError
+            return future.result()
+
+        try:
+            skbunch = self.load_skfile(*key)
+            future.set_result(skbunch)
+            return skbunch
+
+        except Exception as e:
+            future.set_exception(e)
+            raise
+
+        finally:
+            with self._lock:
+                del self._loading[key]
+
+
+    def prefetch(self, obe_id, obe_mode, abscmd):
+        """Starts looking up the sk file identified by (obe_id),
+        (obe_mode) and (abscmd) in the background.  Returns a
+        concurrent.futures.Future for the result of lookup().
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.prefetch_workers)
+            executor = self._executor
+
+        return executor.submit(self.lookup, obe_id, obe_mode, abscmd)
+
+
+    def pin(self, obe_id, obe_mode=None):
+        """Exempts the cached parse results of the sk files of instrument
+        (obe_id) from eviction.  If (obe_mode) is given, only those of that
+        mode are pinned.
+        """
+        if obe_mode is not None:
+            obe_mode = obe_mode.upper()
+        self.pinned.add((obe_id.upper(), obe_mode))
+
+
+    def unpin(self, obe_id, obe_mode=None):
+        """Undoes a previous pin() call with the same arguments.
+        """
+        if obe_mode is not None:
+            obe_mode = obe_mode.upper()
+        self.pinned.discard((obe_id.upper(), obe_mode))
+
+
+    def _is_pinned(self, key):
+        (obe_id, obe_mode, abscmd) = key
+        return (((obe_id, obe_mode) in self.pinned) or
+                ((obe_id, None) in self.pinned))
+
+
+    def cache_stats(self):
+        """Returns a dict of statistics (hits, misses, evictions, number
+        of entries and approximate size in bytes) of the in-memory cache.
+        """
+        return self.cache.stats()
+
+
     def invalidate(self, obe_id, obe_mode, abscmd):
-        """Invalidates the cache entry for abscmd.
+        """Invalidates the cache entry for abscmd, and those of the sk
+        files that call it.
         """
         obe_id = obe_id.upper()
         obe_mode = obe_mode.upper()
         abscmd = abscmd.upper()
 
-        try:
-            del self.cache[(obe_id, obe_mode, abscmd)]
+        keys = self.dependents(obe_id, obe_mode, abscmd)
+        keys.add((obe_id, obe_mode, abscmd))
+        self._invalidate_keys(keys)
 
-        except KeyError:
-            # was not in the cache, apparently
-            pass
+
+    def _invalidate_keys(self, keys):
+        for key in keys:
+            try:
+                del self.cache[key]
+
+            except KeyError:
+                # was not in the cache, apparently
+                pass
+
+
+def get_sub_deps(key, ast):
+    """Returns the set of keys (obe_id, obe_mode, abscmd) of the abstract
+    commands called by *SUB in the skeleton (ast) of the sk file identified
+    by (key).  Calls whose command name is not a constant are ignored.
+    OBE_ID and OBE_MODE parameters that are not constants are assumed to
+    be those of the default parameters of the file, or failing that,
+    those of (key).
+    """
+    (obe_id, obe_mode, abscmd) = key
+    defaults = {}
+    if isinstance(ast, ASTNode) and (ast.tag == 'skeleton'):
+        for keyval in ast.items[0].items:
+            (var, val_ast) = keyval.items
+            if val_ast.tag == 'string':
+                defaults[var] = val_ast.items[0]
+
+    def get_const(val_ast, default):
+        if val_ast is None:
+            return None
+        if val_ast.tag == 'string':
+            return val_ast.items[0]
+        if val_ast.tag == 'id_ref':
+            return defaults.get(val_ast.items[0].lower(), default)
+        return None
+
+    res = set()
+    todo = [ast]
+    while len(todo) > 0:
+        node = todo.pop()
+        if not isinstance(node, ASTNode):
+            continue
+
+        if node.tag == 'star_sub':
+            (ast_cmd_exp, ast_params) = node.items
+            if ast_cmd_exp.tag != 'string':
+                continue
+
+            actuals = dict([keyval.items for keyval in ast_params.items])
+            sub_obe_id = get_const(actuals.get('obe_id', None), obe_id)
+            sub_obe_mode = get_const(actuals.get('obe_mode', None), obe_mode)
+            if (sub_obe_id is None) or (sub_obe_mode is None):
+                continue
+
+            res.add((sub_obe_id.upper(), sub_obe_mode.upper(),
+                     ast_cmd_exp.items[0].upper()))
+            continue
+
+        todo.extend(node.items)
+
+    return res
+
+
+def contains_tags(ast, tags):
+    """Returns True if (ast) has a node with one of the tags in (tags).
+    """
+    todo = [ast]
+    while len(todo) > 0:
+        node = todo.pop()
+        if isinstance(node, ASTNode):
+            if node.tag in tags:
+                return True
+            todo.extend(node.items)
+
+    return False
+
+
+def renumber_ast(ast):
+    """Gives fresh serial numbers to all the nodes of (ast), e.g. an AST
+    that was created in another process.
+    """
+    if isinstance(ast, ASTNode):
+        ast.serial_num = sk_common.seq_num.bump()
+        for item in ast.items:
+            renumber_ast(item)
+
+
+def copy_ast(ast):
+    """Returns a copy of (ast), with fresh nodes as if it had been parsed
+    again.
+    """
+    if isinstance(ast, ASTNode):
+        attrs = dict([(name, copy_ast(val))
+                      for (name, val) in ast.get_attributes().items()])
+        res = ASTNode(ast.tag, *[copy_ast(item) for item in ast.items],
+                      **attrs)
+        res.name = ast.name
+        return res
+
+    elif isinstance(ast, list):
+        return [copy_ast(item) for item in ast]
+
+    return ast
+
+
+# Parsers used in the worker processes of skBank.preload_all(), by
+# whether they use the fast scanner
+_preload_parsers = {}
+
+def preload_parse_skfile(skpath, buf=None, fast_scan=False):
+    """Parses the sk file at (skpath), or the contents (buf) of it if
+    given, with the scanner skBank(fast_scan) selects.  Used by
+    skBank.preload_all() in its worker processes; the result is a dict of
+    the skbunch fields, which can be pickled back to the parent process.
+    """
+    parser = _preload_parsers.get(fast_scan)
+    if parser is None:
+        # parse errors are returned in the error info, for the caller to
+        # report, rather than logged
+        logger = logging.Logger('sk.preload')
+        logger.addHandler(logging.NullHandler())
+        if fast_scan:
+            scanner_class = sk_lexer.skFastScanner
+        else:
+            scanner_class = sk_lexer.skScanner
+        lexer = scanner_class(logger=logger, debug=False, lextab='scan3_tab')
+        parser = sk_parser.skParser(lexer, logger=logger)
+        parser.build()
+        _preload_parsers[fast_scan] = parser
+
+    if buf is None:
+        skbunch = parser.parse_skfile(skpath)
+    else:
+        skbunch = parser.parse_skbuf(buf)
+
+    # Lexer tokens in the error info refer back to the lexer, and so
+    # cannot be pickled; keep only their string representation
+    errinfo = []
+    for errbnch in skbunch.errinfo:
+        errinfo.append(dict(lineno=errbnch.lineno, errstr=errbnch.errstr,
+                            verbose=getattr(errbnch, 'verbose', None),
+                            token=str(errbnch.token)))
+
+    return dict(ast=skbunch.ast, params=skbunch.params,
+                patterns=skbunch.patterns, header=skbunch.header,
+                errors=skbunch.errors, errinfo=errinfo)
 
 
 ##############################################################
@@ -154,18 +783,393 @@ class LazyDict(dict):
             return val
 
 
+def _num_op(op):
+    return lambda val1, val2: op(float(val1), float(val2))
+
+def _trig_fn(fn):
+    def _trig(eval, explst, kwdargs):
+        tmp_vals = [float(x) for x in explst]
+        return fn(math.radians(tmp_vals[0]))
+    return _trig
+
+# Binary operators of expressions, other than AND and OR
+dyad_ops = {
+    '+': _num_op(operator.add),
+    '-': _num_op(operator.sub),
+    '*': _num_op(operator.mul),
+    '/': _num_op(operator.truediv),
+    '==': operator.eq,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '!=': operator.ne,
+    }
+
+# Built in functions, called with the evaluator, the positional and the
+# keyword arguments
+builtin_funcs = {
+    'idx': lambda eval, explst, kwdargs: explst[0][explst[1]],
+    'attr': lambda eval, explst, kwdargs: getattr(explst[0], explst[1]),
+    'apply': lambda eval, explst, kwdargs: (explst[0])(*explst[1:],
+                                                       **kwdargs),
+    'list': lambda eval, explst, kwdargs: list(explst),
+    'dict': lambda eval, explst, kwdargs: dict(kwdargs),
+    'sin': _trig_fn(math.sin),
+    'cos': _trig_fn(math.cos),
+    'tan': _trig_fn(math.tan),
+    'int': lambda eval, explst, kwdargs: int(explst[0]),
+    'float': lambda eval, explst, kwdargs: float(explst[0]),
+    'frame': lambda eval, explst, kwdargs: eval.frame_id_source.get(*explst),
+    'format': lambda eval, explst, kwdargs: explst[0] % tuple(explst[1:]),
+    }
+
+
+def compile_expr(ast):
+    """Compiles the expression (ast) into a function of an Evaluator,
+    which returns the value Evaluator.interpret() would.  Variables,
+    registers, status aliases and frames are resolved through the
+    evaluator when the function is called, so it can be used with any
+    evaluator.  The result is cached in the node.
+    """
+    if isinstance(ast, Closure):
+        return lambda eval: ast.thaw()
+
+    if not isinstance(ast, ASTNode):
+        return lambda eval: ast
+
+    try:
+        return ast.compiled
+
+    except AttributeError:
+        pass
+
+    method = expr_compilers.get(ast.tag, None)
+    if method is None:
+        # Everything else evaluates to itself
+        fn = lambda eval: ast
+    else:
+        fn = method(ast)
+
+    if fn is None:
+        # not in the expected format; leave it to the interpreter to
+        # raise the error when evaluated
+        fn = lambda eval: eval.interpret(ast)
+
+    ast.compiled = fn
+    return fn
+
+def _compile_dyad(ast):
+    if len(ast.items) != 3:
+        return None
+    (exp1, opr, exp2) = ast.items
+    fn1 = compile_expr(exp1)
+    fn2 = compile_expr(exp2)
+
+    if opr == 'AND':
+        def _and(eval):
+            val1 = fn1(eval)
+            val2 = fn2(eval)
+            return (eval.isTrue(val1) and eval.isTrue(val2))
+        return _and
+
+    elif opr == 'OR':
+        def _or(eval):
+            val1 = fn1(eval)
+            val2 = fn2(eval)
+            return (eval.isTrue(val1) or eval.isTrue(val2))
+        return _or
+
+    try:
+        op = dyad_ops[opr]
+
+    except (KeyError, TypeError):
+        return None
+    return lambda eval: op(fn1(eval), fn2(eval))
+
+def _compile_monad(ast):
+    if len(ast.items) != 2:
+        return None
+    (opr, exp1) = ast.items
+    fn1 = compile_expr(exp1)
+
+    if opr == '-':
+        return lambda eval: -(float(fn1(eval)))
+    elif opr == 'NOT':
+        return lambda eval: (not eval.isTrue(fn1(eval)))
+    return None
+
+def _compile_args(ast):
+    # Returns a function of an evaluator returning the positional and
+    # keyword arguments of the argument list (ast)
+    if not (isinstance(ast, ASTNode) and (ast.tag == 'arg_list')):
+        return None
+
+    fns = []
+    for subast in ast.items:
+        if not isinstance(subast, ASTNode):
+            return None
+        if subast.tag == 'key_value_pair':
+            (var, val_ast) = subast.items
+            if type(var) != strtype:
+                return None
+            fns.append((var, compile_expr(val_ast)))
+        else:
+            fns.append((None, compile_expr(subast)))
+
+    if not [var for (var, fn) in fns if var is not None]:
+        fns = [fn for (var, fn) in fns]
+        return lambda eval: ([fn(eval) for fn in fns], {})
+
+    def _args(eval):
+        resList = []
+        resDict = {}
+        for (var, fn) in fns:
+            if var is None:
+                resList.append(fn(eval))
+            else:
+                resDict[var] = fn(eval)
+        return resList, resDict
+    return _args
+
+def _compile_func_call(ast):
+    try:
+        builtin = builtin_funcs[ast.items[0].lower()]
+
+    except KeyError:
+        return None
+    args_fn = _compile_args(ast.items[1])
+    if args_fn is None:
+        return None
+
+    def _func_call(eval):
+        explst, kwdargs = args_fn(eval)
+        return builtin(eval, explst, kwdargs)
+    return _func_call
+
+def _compile_proc_call(ast):
+    regref, args_ast = ast.items
+    key = regref[1:]
+    if args_ast is None:
+        return lambda eval: eval.registers.get(key)()
+    args_fn = _compile_args(args_ast)
+    if args_fn is None:
+        return None
+
+    def _proc_call(eval):
+        fn = eval.registers.get(key)
+        args, kwdargs = args_fn(eval)
+        return fn(*args, **kwdargs)
+    return _proc_call
+
+def _compile_frame_id_ref(ast):
+    stg = ast.items[0]
+    def _frame_id_ref(eval):
+        s = eval.eval_string_interpolate(stg)
+        return eval.frame_id_source.get(*s.split())
+    return _frame_id_ref
+
+def _compile_asnum(ast):
+    fn1 = compile_expr(ast.items[0])
+    return lambda eval: float(fn1(eval))
+
+def _compile_expression_list(ast):
+    fns = [compile_expr(exp) for exp in ast.items]
+    return lambda eval: [fn(eval) for fn in fns]
+
+def _compile_list(ast):
+    stg = ast.items[0]
+    return lambda eval: eval.eval_string_interpolate(stg)
+
+def _compile_constant(ast):
+    val = ast.items[0]
+    return lambda eval: val
+
+def _compile_qstring(ast):
+    stg = ast.items[0]
+    def _qstring(eval):
+        # (cls) may be set after the node is compiled
+        if hasattr(ast, 'cls'):
+            return ast.cls.thaw()
+        return eval.eval_string_interpolate(stg)
+    return _qstring
+
+def _compile_alias_ref(ast):
+    alias = ast.items[0]
+    return lambda eval: eval.status.get(alias)
+
+def _compile_id_ref(ast):
+    var = ast.items[0]
+    return lambda eval: eval.variables.get(var)
+
+def _compile_reg_ref(ast):
+    key = ast.items[0]
+    return lambda eval: eval.registers.get(key)
+
+expr_compilers = {
+    'dyad': _compile_dyad,
+    'monad': _compile_monad,
+    'func_call': _compile_func_call,
+    'proc_call': _compile_proc_call,
+    'frame_id_ref': _compile_frame_id_ref,
+    'asnum': _compile_asnum,
+    'expression_list': _compile_expression_list,
+    'list': _compile_list,
+    'number': _compile_constant,
+    'string': _compile_constant,
+    'qstring': _compile_qstring,
+    'lstring': _compile_qstring,
+    'alias_ref': _compile_alias_ref,
+    'id_ref': _compile_id_ref,
+    'reg_ref': _compile_reg_ref,
+    }
+
+
+# Patterns of the references interpolated into strings, after their
+# special character
+template_patterns = {
+    '&': re.compile(r'GET_F_NO\[([\w_][\w\d_\.]*)\s*([\w][789]?)\s*(\d+)?\s*\]',
+                    re.IGNORECASE),
+    '!': re.compile(r'([\w_][\w\d_\.]*)'),
+    '$': re.compile(r'([\w_][\w\d_\.]*)'),
+    '@': re.compile(r'([\w_][\w\d_\.]*)'),
+    }
+template_specials = {
+    False: re.compile(r'[\\&!$@]'),
+    True: re.compile(r'[\\&$]'),
+    }
+
+# Templates of the strings interpolated by evaluators
+template_cache = sk_cache.LRUCache(maxsize=4096)
+
+def parse_template(stg, vars_only=False):
+    """Parses the string (stg) for interpolation into a template: a list
+    of literal strings and (special character, args) tuples for the
+    references to interpolate.  If (vars_only) is True, only variable and
+    frame references are interpolated.  A malformed reference ends the
+    template with a (None, rest of string) tuple.
+    """
+    regex = template_specials[vars_only]
+    res = []
+    literal = []
+    start = 0
+    end = len(stg)
+    while start < end:
+        match = regex.search(stg, start, end)
+        if not match:
+            literal.append(stg[start:end])
+            break
+
+        pos = match.start()
+        literal.append(stg[start:pos])
+        c = stg[pos]
+
+        # Handle escaped specials.
+        # TODO: is there a SOSS string escape char?
+        if c == '\\':
+            literal.append(stg[pos+1:min(pos+2, end)])
+            start = pos + 2
+            continue
+
+        # Scan the special token.  The rest of the string after it must
+        # be a single line, and loses its trailing newline.
+        match = template_patterns[c].match(stg, pos+1, end)
+        if match:
+            nl = stg.find('\n', match.end(), end)
+            if nl == end - 1:
+                end = nl
+            elif nl >= 0:
+                match = None
+
+        if literal:
+            res.append(''.join(literal))
+            literal = []
+        if not match:
+            res.append((None, stg[pos+1:end]))
+            return res
+
+        res.append((c, match.groups()))
+        start = match.end()
+
+    if literal or not res:
+        res.append(''.join(literal))
+    return res
+
+
+# Status aliases referenced by ASTs, for collect_aliases()
+alias_cache = weakref.WeakKeyDictionary()
+
+def collect_aliases(ast):
+    """Returns a tuple of the status aliases referenced by the expressions
+    in (ast), including those interpolated into strings, in order of
+    first reference.
+    """
+    if isinstance(ast, ASTNode):
+        try:
+            return alias_cache[ast]
+
+        except KeyError:
+            pass
+
+    res = {}
+    todo = [ast]
+    while len(todo) > 0:
+        node = todo.pop()
+        if isinstance(node, ASTNode):
+            if node.tag == 'alias_ref':
+                res.setdefault(node.items[0], None)
+
+            elif node.tag in ('qstring', 'lstring', 'list', 'frame_id_ref'):
+                for item in parse_template(node.items[0]):
+                    if (type(item) is tuple) and (item[0] == '!'):
+                        res.setdefault(item[1][0], None)
+
+            else:
+                todo.extend(reversed(node.items))
+
+        elif isinstance(node, Closure):
+            todo.append(node.ast)
+
+        elif isinstance(node, (list, tuple)):
+            todo.extend(reversed(node))
+
+    res = tuple(res.keys())
+    if isinstance(ast, ASTNode):
+        alias_cache[ast] = res
+    return res
+
+
 count = 1
 class VariableResolver(object):
+    """Variables of an evaluator.  A clone shares the variable map of the
+    resolver it is made from until either of them sets a variable, which
+    first gets a copy of its own (copy on write).  So cloning takes
+    constant time, and each keeps seeing only its own assignments.
+    """
     def __init__(self, params):
         global count
         self.variable_map = Bunch.caselessDict(params)
+        # True if variable_map may be shared with clones
+        self.shared = False
         self.count = count
         count += 1
+        # replaced whenever a variable is set, for memoized closures
+        self.token = object()
+
+    def memo_token(self):
+        return self.token
+
+    def _unshare(self):
+        if self.shared:
+            self.variable_map = Bunch.caselessDict(self.variable_map)
+            self.shared = False
 
     def set(self, var, val, nonew=False):
         if nonew and (var not in self.variable_map):
             raise skError("Variable does not exist in scope: '%s'" % (var))
+        self._unshare()
         self.variable_map[var] = val
+        self.token = object()
 
     def setAll(self, varDict, nonew=False):
         if nonew:
@@ -174,7 +1178,9 @@ class VariableResolver(object):
                 raise skError("Variables do not exist in scope: %s" % (
                         str(list(diff))))
 
+        self._unshare()
         self.variable_map.update(varDict)
+        self.token = object()
 
     def get(self, var):
         try:
@@ -183,6 +1189,8 @@ class VariableResolver(object):
         except KeyError:
             raise skError("Variable does not exist in scope: '%s'" % var)
 
+        note_dependency(self, self.token)
+
         if not isinstance(val, Closure):
             return val
 
@@ -206,57 +1214,191 @@ class VariableResolver(object):
         return val
 
     def clone(self):
-        return VariableResolver(self.variable_map)
+        vr = VariableResolver({})
+        vr.variable_map = self.variable_map
+        vr.shared = self.shared = True
+        return vr
+
+
+class RegisterRib(object):
+    """A scope of registers, linked to the enclosing one.  (rib) maps the
+    registers defined in this scope to their cells, one item lists
+    holding their values.  (index) maps the registers found so far from
+    this scope to the cells visible from it.
+    """
+    __slots__ = ('rib', 'parent', 'index')
+
+    def __init__(self, params, parent):
+        self.rib = Bunch.caselessDict()
+        for key, val in params.items():
+            self.rib[key] = [val]
+        self.parent = parent
+        self.index = Bunch.caselessDict(self.rib)
 
 
 class RegisterResolver(object):
-    def __init__(self):
-        self.special_keys = ['SYSTEM', 'USER', 'COMMAND', 'STATUS']
-        rib = Bunch.caselessDict()
-        self.ribs = [ rib ]
+    """Registers, in a chain of RegisterRibs.  push() starts a new scope,
+    whose registers shadow those of the same names in the enclosing
+    scopes until it is pop()ed.  set() assigns a register in the innermost
+    scope defining it, and defines it in the current scope if none does.
+
+    A clone shares the scopes of the resolver it is made from, so that
+    both see the assignments of either, but the scopes it pushes are its
+    own.
+
+    Lookups are indexed: a register found in a scope is recorded in the
+    index of each scope walked through to it, so later lookups from these
+    scopes, or from scopes pushed onto them, take constant time.  Indexes
+    never need invalidating, as a register is only ever defined in a scope
+    from which no definition of it is visible, and a scope does not index
+    registers it does not see.
+    """
+
+    # These eventually get resolved in the ParaValidator
+    special_keys = frozenset(['SYSTEM', 'USER', 'COMMAND', 'STATUS'])
+
+    def __init__(self, ribs=None):
+        if ribs is None:
+            ribs = RegisterRib({}, None)
+        self.ribs = ribs
+
+    def _find(self, key):
+        # Returns the cell of register (key) visible from the current
+        # scope, or None if it is not defined.
+        try:
+            return self.ribs.index[key]
+
+        except KeyError:
+            pass
+
+        walked = []
+        ribs = self.ribs
+        while ribs is not None:
+            try:
+                cell = ribs.index[key]
+                break
+
+            except KeyError:
+                pass
+            walked.append(ribs)
+            ribs = ribs.parent
+        else:
+            return None
+
+        for rib in walked:
+            rib.index[key] = cell
+        return cell
 
     def get(self, key):
         if key in self.special_keys:
-            # These eventually get resolved in the ParaValidator
             return '@' + key
 
-        for rib in self.ribs:
-            if key in rib:
-                return rib[key]
-
-        raise skError("Variable accessed before assignment: '@%s'" % (key))
+        cell = self._find(key)
+        if cell is None:
+            raise skError("Variable accessed before assignment: '@%s'" % (
+                key))
+        return cell[0]
 
     def set(self, **kwdargs):
         for key, val in kwdargs.items():
-            for rib in self.ribs:
-                if key in rib:
-                    rib[key] = val
-                    continue
-            rib = self.ribs[0]
-            rib[key] = val
+            cell = self._find(key)
+            if cell is not None:
+                cell[0] = val
+            else:
+                cell = [val]
+                self.ribs.rib[key] = cell
+                self.ribs.index[key] = cell
 
     def push(self, params):
-        rib = Bunch.caselessDict(params)
-        self.ribs.insert(0, rib)
+        self.ribs = RegisterRib(params, self.ribs)
 
     def pop(self):
-        self.ribs.pop(0)
+        self.ribs = self.ribs.parent
 
     def clone(self):
-        rr = RegisterResolver()
-        rr.ribs = list(self.ribs)
-        return rr
+        return RegisterResolver(ribs=self.ribs)
 
 class StatusResolver(object):
     def __init__(self, statusObj):
         self.statusObj = statusObj
+        # If set to a dict, the first value read for each alias is
+        # recorded in it
+        self.record = None
+        # Stacks of snapshots of status values, per thread (see push())
+        self.local = threading.local()
 
     def get(self, alias):
-        return self.statusObj.fetchOne(alias)
+        snapshots = getattr(self.local, 'snapshots', None)
+        if snapshots:
+            # values read within a snapshot are kept in it
+            snapshot = snapshots[0]
+            try:
+                val = snapshot[alias]
+
+            except KeyError:
+                val = snapshot[alias] = self.statusObj.fetchOne(alias)
+            note_dependency(self, snapshot)
+        else:
+            val = self.statusObj.fetchOne(alias)
+            note_volatile()
+        if (self.record is not None) and (alias not in self.record):
+            self.record[alias] = val
+        return val
+
+    def memo_token(self):
+        # values are memoized within the current snapshot only
+        snapshots = getattr(self.local, 'snapshots', None)
+        if snapshots:
+            return snapshots[0]
+        return None
+
+    def push(self, aliases=()):
+        """Starts a status snapshot scope in this thread, until the
+        matching pop().  Within it, each alias is read only once, and the
+        status (aliases) are fetched together on entry, in a single call.
+        """
+        snapshots = getattr(self.local, 'snapshots', None)
+        if snapshots is None:
+            snapshots = self.local.snapshots = []
+
+        if len(snapshots) > 0:
+            snapshot = dict(snapshots[0])
+        else:
+            snapshot = {}
+        aliases = [alias for alias in aliases if alias not in snapshot]
+        if len(aliases) > 0:
+            snapshot.update(self.statusObj.fetch(dict.fromkeys(aliases, 0)))
+        snapshots.insert(0, snapshot)
+
+    def pop(self):
+        self.local.snapshots.pop(0)
+
+
+# Scopes of status snapshots for the status_scope setting of skBank
+status_scopes = (None, 'statement')
+
+@contextlib.contextmanager
+def status_snapshot(status, scope, aliases=()):
+    """Runs the body of the with statement in a snapshot scope of the
+    status resolver (status), fetching (aliases) on entry, unless (scope)
+    is None.
+    """
+    if scope is None:
+        yield
+        return
+
+    status.push(aliases)
+    try:
+        yield
+
+    finally:
+        status.pop()
 
 class FrameSource(object):
     def __init__(self, frameObj):
         self.frameObj = frameObj
+        # number of frames allocated so far
+        self.allocated = 0
 
     def get(self, *args):
 
@@ -276,9 +1418,11 @@ class FrameSource(object):
         if count == None:
             # Should return one frame
             frames = self.frameObj.getFrames(instname, frametype, 1)
+            self.allocated += len(frames)
             return frames[0]
         else:
             frames = self.frameObj.getFrames(instname, frametype, count)
+            self.allocated += len(frames)
             return '%s:%04d' % (frames[0], len(frames))
 
 class MockRegisterResolver(object):
@@ -287,6 +1431,9 @@ class MockRegisterResolver(object):
 
 class MockFrameSource(object):
     def __init__(self):
+        # deferred, as it is only needed for offline decoding
+        from g2cam.INS import INSdata as INSconfig
+
         self.count = 1
         self.insconfig = INSconfig()
 
@@ -314,16 +1461,32 @@ class MockStatusResolver(object):
         self.statusDict = statusDict
     def get(self, alias):
         try:
-            return self.statusDict[alias]
+            val = self.statusDict[alias]
         except KeyError:
             raise skError("Illegal status fetch (%s) in decoding!" % (
                 alias))
+        note_dependency(self, self.statusDict)
+        return val
+    def memo_token(self):
+        return self.statusDict
+    def push(self, aliases=()):
+        pass
+    def pop(self):
+        pass
 
 
 class Evaluator(object):
     """Expressions need to be evaluated run time.  This class is a utility
     to evaluate the expression ast and return the value.
     """
+
+    # Attributes of the resolvers of the references interpolated into
+    # strings, by their special character
+    spc_resolvers = { '&': 'frame_id_source',
+                      '!': 'status',
+                      '$': 'variables',
+                      '@': 'registers',
+                      }
     def __init__(self, variable_resolver, register_resolver, status_resolver,
                  frame_id_source, logger):
         self.variables = variable_resolver
@@ -332,16 +1495,6 @@ class Evaluator(object):
         self.frame_id_source = frame_id_source
         self.logger = logger
 
-        re_token = re.compile(r'^([\w_][\w\d_\.]*)(.*)$')
-        re_frame = re.compile(r'^GET_F_NO\[([\w_][\w\d_\.]*)\s*([\w][789]?)\s*(\d+)?\s*\](.*)$',
-                              re.IGNORECASE)
-
-        self.spc_dict = { '&': (re_frame, self.frame_id_source.get),
-                          '!': (re_token, self.status.get),
-                          '$': (re_token, self.variables.get),
-                          '@': (re_token, self.registers.get),
-                          }
-
     def set_var(self, var, val, nonew=False):
         #self.logger.debug("set %s=%s" % (var, str(val)))
         self.variables.set(var, val, nonew=nonew)
@@ -357,6 +1510,24 @@ class Evaluator(object):
         return val
 
     def eval(self, ast):
+        """Evaluates the expression (ast), by way of its compiled form.
+        """
+        if isinstance(ast, ASTNode):
+            try:
+                fn = ast.compiled
+
+            except AttributeError:
+                fn = compile_expr(ast)
+            return fn(self)
+
+        if isinstance(ast, Closure):
+            return ast.thaw()
+
+        return ast
+
+    def interpret(self, ast):
+        """Evaluates the expression (ast) by walking the tree.
+        """
         self.logger.debug("eval: ast=%s" % str(ast))
         if isinstance(ast, Closure):
             return ast.thaw()
@@ -371,30 +1542,12 @@ class Evaluator(object):
             val2 = self.eval(ast.items[2])
             opr = ast.items[1]
 
-            if opr == '+':
-                return (float(val1) + float(val2))
-            elif opr == '-':
-                return (float(val1) - float(val2))
-            elif opr == '*':
-                return (float(val1) * float(val2))
-            elif opr == '/':
-                return (float(val1) / float(val2))
-            elif opr == '==':
-                return (val1 == val2)
-            elif opr == '>':
-                return (val1 > val2)
-            elif opr == '<':
-                return (val1 < val2)
-            elif opr == '>=':
-                return (val1 >= val2)
-            elif opr == '<=':
-                return (val1 <= val2)
-            elif opr == '!=':
-                return (val1 != val2)
-            elif opr == 'AND':
+            if opr == 'AND':
                 return (self.isTrue(val1) and self.isTrue(val2))
             elif opr == 'OR':
                 return (self.isTrue(val1) or self.isTrue(val2))
+            elif opr in dyad_ops:
+                return dyad_ops[opr](val1, val2)
             else:
                 raise skError("Unrecognized expression operator: '%s'" % opr)
 
@@ -420,33 +1573,8 @@ class Evaluator(object):
         elif ast.tag == 'func_call':
             func_name = ast.items[0].lower()
             explst, kwdargs = self.eval_args(ast.items[1])
-            if func_name == 'idx':
-                return explst[0][explst[1]]
-            elif func_name == 'attr':
-                return getattr(explst[0], explst[1])
-            elif func_name == 'apply':
-                return (explst[0])(*explst[1:], **kwdargs)
-            elif func_name == 'list':
-                return list(explst)
-            elif func_name == 'dict':
-                return dict(kwdargs)
-            elif func_name == 'sin':
-                tmp_vals = [float(x) for x in explst]
-                return math.sin(math.radians(tmp_vals[0]))
-            elif func_name == 'cos':
-                tmp_vals = [float(x) for x in explst]
-                return math.cos(math.radians(tmp_vals[0]))
-            elif func_name == 'tan':
-                tmp_vals = [float(x) for x in explst]
-                return math.tan(math.radians(tmp_vals[0]))
-            elif func_name == 'int':
-                return int(explst[0])
-            elif func_name == 'float':
-                return float(explst[0])
-            elif func_name == 'frame':
-                return self.frame_id_source.get(*explst)
-            elif func_name == 'format':
-                return explst[0] % tuple(explst[1:])
+            if func_name in builtin_funcs:
+                return builtin_funcs[func_name](self, explst, kwdargs)
             raise skError("Unrecognized built in function: '%s'" % func_name)
 
         elif ast.tag == 'frame_id_ref':
@@ -511,57 +1639,36 @@ class Evaluator(object):
         return _foo
 
 
-    def _scan_special(self, buf, regex):
-        match = regex.match(buf)
-        if match:
-            args = list(match.groups())
-            buf = args.pop()
-            return (buf, args)
-
-        raise skError("Malformed string (interpolation): '%s'" % (buf))
-
     def eval_string_interpolate(self, stg, vars_only=False):
         """Evaluate a string ast in the current environment.
         Returns a python string with values interpolated.
         """
+        key = (stg, vars_only)
+        template = template_cache.get(key)
+        if template is None:
+            template = parse_template(stg, vars_only=vars_only)
+            template_cache[key] = template
 
-        if vars_only:
-            specials = ['$', '&']
-        else:
-            specials = list(self.spc_dict.keys())
+        # Nothing to interpolate
+        if (len(template) == 1) and (type(template[0]) is str):
+            return template[0]
 
         res = []
-        buf = stg
-
         try:
-            # Iterate over buffer.  If a character is not a special one, just
-            # append it to the output buffer.  Otherwise, scan the token and
-            # call the "getter" function on it, appending the results to the
-            # buffer.
-            while len(buf) > 0:
-                c = buf[0]
-                buf = buf[1:]
-
-                # Handle escaped specials.
-                # TODO: is there a SOSS string escape char?
-                if c == '\\':
-                    if len(buf) > 0:
-                        res.append(buf[0])
-                        buf = buf[1:]
+            # Literal segments are appended as they are.  For references,
+            # call the "getter" function for this kind of token, convert to
+            # a string and append to the result list
+            for item in template:
+                if type(item) is str:
+                    res.append(item)
                     continue
 
-                # If not a special character, then append to buffer and carry on
-                if not c in specials:
-                    res.append(c)
-                    continue
-
-                # Scan the special token and deal with it
-                (regex, get_fn) = self.spc_dict[c]
-                buf, args = self._scan_special(buf, regex)
-
-                # Call the getter for this kind of token, convert to
-                # a string and append to the result list
-                val = get_fn(*args)
+                (c, args) = item
+                if c is None:
+                    raise skError("Malformed string (interpolation): '%s'" % (
+                        args))
+                resolver = getattr(self, self.spc_resolvers[c])
+                val = resolver.get(*args)
                 res.append(str(val))
 
         except Exception as e:
@@ -698,20 +1805,37 @@ class Evaluator(object):
 # DECODER
 ##############################################################
 
-class Decoder(object):
+class Decoder(sk_common.ASTVisitor):
     """
     NOTES.
     [1] This should expand to nothing, but our decoder design always returns
     an ast, so NOP is used.
+    [2] Subtrees that are unchanged by decoding are not copied: the
+    decoded AST shares them with the AST decoded, which must therefore
+    not be modified.  Nodes tagged in (fresh_tags), whose serial numbers
+    identify each execution of a command (see skTask.myIssueAST), are
+    always copied.
+    [3] If (lazy_for) is True, *FOR loops whose bodies do not set
+    variables (with *SET or nested *FOR) decode to a 'deferred_for' node
+    instead of being unrolled.  expand() decodes their iterations one at
+    a time, as the statements are reached, so the frame ids and status
+    values read by an iteration are those of when it is executed.  The
+    sk files called by *SUB are not: a decoder uses a single version of
+    each sk file, looked up when the loop is decoded if possible (see
+    _lookup() and _pin_subs()).  The commands of the iterations are made
+    after the decoded AST has been issued to the command monitor, so
+    their serial numbers are unknown to it: lazy decoding gives up the
+    monitoring of the commands in deferred loops.
 
     TODO.
     [ ] Currently the <Header>...</Header> area is ignored.
 
     """
-    def __init__(self, evaluator, sk_bank, logger):
+    def __init__(self, evaluator, sk_bank, logger, lazy_for=False):
         """Decoder constructor.  (params) is a dict of the initial
         environment (variables & values) of the decoder.  (sk_bank) is
-        used to lookup sk file ASTs and default parameters.
+        used to lookup sk file ASTs and default parameters.  (lazy_for)
+        defers the unrolling of *FOR loops, see Note [3].
         """
 
         # Evaluator for all external entities
@@ -722,10 +1846,43 @@ class Decoder(object):
 
         self.nop = ASTNode('nop')
 
+        # If set to a dict, the versions of the sk files looked up by *SUB
+        # are recorded in it
+        self.sk_lookups = None
+
+        self.lazy_for = lazy_for
+        # number of deferred_for nodes made
+        self.deferred = 0
+
+        # sk files looked up by *SUB: (obe_id, obe_mode, cmdname) -> the
+        # skbunch used for all of the decoding, see _lookup()
+        self.sk_pins = {}
+
         super(Decoder, self).__init__()
 
+    visit_prefix = 'decode_'
+    visit_default = 'recode'
+
+    # Tags of the nodes that are copied even if decoding leaves them
+    # unchanged.  See Note [2]
+    fresh_tags = frozenset(['exec'])
+
 
     def decode(self, ast, eval):
+        """Decodes (ast) in the environment of (eval).  The root of the
+        result is always a new node, even if decoding left (ast) unchanged,
+        so that its serial number identifies this decoding.
+        """
+        new_ast = self._decode(ast, eval)
+
+        if (new_ast is ast) and isinstance(ast, ASTNode):
+            new_ast = ASTNode(ast.tag, *ast.items, **ast.get_attributes())
+            new_ast.name = ast.name
+
+        return new_ast
+
+
+    def _decode(self, ast, eval):
         """Generic decode method.  Looks up the specific decoder for the
         ast and calls it.  If it does not have it's own special decoder
         then it is a generic ast.  Recurse through it and reconstruct the
@@ -739,24 +1896,13 @@ class Decoder(object):
             raise DecodeError("Unexpected type in decoding: %s (%s)" % (
                 str(ast), str(type(ast))))
 
-        try:
-            decode_method = getattr(self, 'decode_%s' % ast.tag)
-
-            if not callable(decode_method):
-                raise DecodeError("Not a valid decode method '%s'" % ast.tag)
-
-        except AttributeError:
-            # ==> There is no function "decode_XXX" for the tag XXX of the ast.
-            # Therefore, simply recurse over the subtrees and reconsitute the
-            # results.
-            try:
-                return self.recode(ast, eval)
-
-            except AssertionError as e:
-                raise DecodeError(str(e))
+        # If there is no method "decode_XXX" for the tag XXX of the ast,
+        # this is recode(), which simply recurses over the subtrees and
+        # reconstitutes the results.
+        decode_method = self.visit_method(ast.tag)
 
         try:
-            return decode_method(ast, eval)
+            return decode_method(self, ast, eval)
 
         except AssertionError as e:
             raise DecodeError(str(e))
@@ -766,19 +1912,7 @@ class Decoder(object):
 
         newitems = []
         for item in astlist:
-            if type(item) != ASTNode:
-                newitems.append(item)
-
-            else:
-                if item.tag == 'block_merge':
-                    newitems.extend(item.items)
-                else:
-                    if (item.tag in ('async', 'sync', 'block',
-                                     'block_merge', 'cmdlist')
-                        ) and (len(item.items) == 0):
-                        pass
-                    else:
-                        newitems.append(item)
+            self._merge_item(newitems, item)
 
         # if new item is a code block of some kind, but contains no
         # statements, then change it to a block_merge to be merged
@@ -787,30 +1921,67 @@ class Decoder(object):
                (len(newitems) == 0):
             return ASTNode('block_merge')
 
-        return ASTNode(tag, *newitems, **astattrs)
+        new_ast = ASTNode(tag, **astattrs)
+        new_ast.items = newitems
+        return new_ast
+
+
+    def _merge_item(self, newitems, item):
+        """Appends (item) to (newitems), splicing the items of a block_merge
+        and dropping empty code blocks.
+        """
+        if type(item) != ASTNode:
+            newitems.append(item)
+
+        elif item.tag == 'block_merge':
+            newitems.extend(item.items)
+
+        elif (item.tag in ('async', 'sync', 'block', 'cmdlist')) and \
+                 (len(item.items) == 0):
+            pass
+
+        else:
+            newitems.append(item)
 
 
     def recode(self, ast, eval):
         """Iterate over items in this ast.  For each sub-ast, decode it;
-        other items are taken verbatim.  Form a new item list and use
-        it to recreate an ASTNode of the original type.
+        other items are taken verbatim.  If any sub-ast changed, form a
+        new item list and use it to recreate an ASTNode of the original
+        type; otherwise the ast itself is the result (see Note [2]).
         """
         #self.logger.debug("RECODE: tag=%s" % ast.tag)
 
         merge_ok = (ast.tag in ('block', 'block_merge', 'cmdlist'))
 
-        newitems = []
-        for item in ast.items:
-            if type(item) == ASTNode:
-                new_ast = self.decode(item, eval)
-
-                if isinstance(new_ast, ASTNode) and \
-                        (new_ast.tag == 'block_merge') and merge_ok:
-                    newitems.extend(new_ast.items)
-                else:
-                    newitems.append(new_ast)
-            else:
-                newitems.append(item)
+        # new item list, only made once an item has changed
+        newitems = None
+        items = ast.items
+        for i in range(len(items)):
+            item = items[i]
+            if type(item) != ASTNode:
+                if newitems is not None:
+                    newitems.append(item)
+                continue
+
+            new_ast = self._decode(item, eval)
+
+            if isinstance(new_ast, ASTNode) and \
+                    (new_ast.tag == 'block_merge') and merge_ok:
+                if newitems is None:
+                    newitems = items[:i]
+                newitems.extend(new_ast.items)
+
+            elif newitems is not None:
+                newitems.append(new_ast)
+
+            elif new_ast is not item:
+                newitems = items[:i]
+                newitems.append(new_ast)
+
+        changed = (newitems is not None)
+        if not changed:
+            newitems = items
 
         # if new item is a code block of some kind, but contains no
         # statements, then change it to a block_merge to be merged
@@ -820,7 +1991,14 @@ class Decoder(object):
             #return self.nop
             return ASTNode('block_merge')
 
-        return ASTNode(ast.tag, *newitems, **ast.attributes)
+        if not changed:
+            if ast.tag not in self.fresh_tags:
+                return ast
+            newitems = list(items)
+
+        new_ast = ASTNode(ast.tag, **ast.get_attributes())
+        new_ast.items = newitems
+        return new_ast
 
 
     def decode_id_ref(self, ast, eval):
@@ -971,7 +2149,8 @@ class Decoder(object):
         *ENDFOR
 
         Result is a command_block AST comprised of decoded cmd_lst
-        nodes unrolled for as many iterations as in the loop.
+        nodes unrolled for as many iterations as in the loop, or a
+        deferred_for node (see Note [3]).
         """
         assert ast.tag == 'star_for', ASTerr(ast)
         assert len(ast.items) == 4, ASTerr(ast)
@@ -1041,29 +2220,96 @@ class Decoder(object):
         if loop_count == 0:
             loop_count = qty
 
+        loop_count = int(loop_count)
+
+        if self.lazy_for and \
+               (not contains_tags(cmdlst_ast, ('star_set', 'star_for'))):
+            # The iterations are decoded in a copy of the current
+            # environment, and the variables are left as unrolling would
+            # leave them for the statements after the loop
+            res_ast = ASTNode('deferred_for', cmdlst_ast, loop_count,
+                              tup, val_lst, eval.clone())
+            self._pin_subs(cmdlst_ast, eval, tup)
+            last = min(loop_count, int(qty)) - 1
+            if last >= 0:
+                self._set_loop_vars(eval, last, tup, val_lst)
+            self.deferred += 1
+            return res_ast
+
         # Here's where the real unrolling takes place.  We produce a
         # command_block consisting of the set of unrolled iterations of
         # cmdlst_ast.
         astlist = []
-        for i in range(int(loop_count)):
-            # Set variables
-            index = i * var_lst_len
-
-            if index < val_lst_len:
-                for j in range(var_lst_len):
-                    self.logger.debug("SETTING %s to %s" % (var_lst[index+j], val_lst[index+j]))
-                    eval.set_var(var_lst[index+j], val_lst[index+j])
+        for i in range(loop_count):
+            self._set_loop_vars(eval, i, tup, val_lst)
 
             # decode body in env with updated variables
             #self.logger.debug(str(eval.variables.variable_map))
-            body_ast = self._decode_merge(cmdlst_ast, eval)
-
-            # append into a giant mergeable list
-            astlist.append(body_ast)
+            self._decode_iteration(cmdlst_ast, eval, astlist)
 
         # return merged result
-        #return ASTNode('block_merge', *astlist)
-        return self.merge('block_merge', astlist)
+        res_ast = ASTNode('block_merge')
+        res_ast.items = astlist
+        return res_ast
+
+
+    def _set_loop_vars(self, eval, i, var_lst, val_lst):
+        """Sets the variables (var_lst) of iteration (i) of a *FOR loop
+        to their values in (val_lst).
+        """
+        var_lst_len = len(var_lst)
+        index = i * var_lst_len
+
+        if index < len(val_lst):
+            for j in range(var_lst_len):
+                self.logger.debug("SETTING %s to %s" % (var_lst[j], val_lst[index+j]))
+                eval.set_var(var_lst[j], val_lst[index+j])
+
+
+    def _decode_iteration(self, cmdlst_ast, eval, astlist):
+        """Decodes the body (cmdlst_ast) of an iteration of a *FOR loop,
+        and appends its statements to (astlist).
+        """
+        body_ast = self._decode(cmdlst_ast, eval)
+
+        # append its statements into a giant mergeable list
+        if isinstance(body_ast, ASTNode) and \
+                body_ast.tag == 'cmdlist':
+            astlist.extend(body_ast.items)
+        else:
+            self._merge_item(astlist, body_ast)
+
+
+    def expand(self, astlist, snapshot=False):
+        """Generates the statements of the decoded list (astlist), in
+        which deferred_for nodes are replaced by the statements of their
+        iterations, decoded as they are reached.  If (snapshot) is True,
+        each iteration is decoded in a status snapshot of its own.
+        """
+        for ast in astlist:
+            if (not isinstance(ast, ASTNode)) or (ast.tag != 'deferred_for'):
+                yield ast
+                continue
+
+            (cmdlst_ast, loop_count, var_lst, val_lst, eval) = ast.items
+            for i in range(loop_count):
+                self._set_loop_vars(eval, i, var_lst, val_lst)
+
+                iteration = []
+                if snapshot:
+                    eval.status.push()
+                try:
+                    self._decode_iteration(cmdlst_ast, eval, iteration)
+
+                except AssertionError as e:
+                    raise DecodeError(str(e))
+
+                finally:
+                    if snapshot:
+                        eval.status.pop()
+
+                for sub_ast in self.expand(iteration, snapshot=snapshot):
+                    yield sub_ast
 
 
     def decode_star_set(self, ast, eval):
@@ -1173,7 +2419,7 @@ class Decoder(object):
             actuals[var] = make_closure(form, cur_eval)
 
         # Look up the skeleton file from our sk_bank
-        skbunch = self.sk_bank.lookup(obe_id, obe_mode, cmdname)
+        skbunch = self._lookup(obe_id, obe_mode, cmdname)
         if skbunch.errors > 0:
             # TODO: include verbose error string in this error
             raise DecodeError("%d errors parsing referent skeleton file '%s'" % (
@@ -1206,7 +2452,7 @@ class Decoder(object):
         new_eval.set_vars(params)
 
         # Decode the skeleton file body in the new environment
-        new_ast_body = self.decode(ast_body, new_eval)
+        new_ast_body = self._decode(ast_body, new_eval)
 
         assert new_ast_body.tag == 'command_section', ASTerr(new_ast_body)
         assert len(new_ast_body.items) == 3, ASTerr(new_ast_body)
@@ -1230,6 +2476,74 @@ class Decoder(object):
         return res_ast
 
 
+    def _lookup(self, obe_id, obe_mode, cmdname):
+        """Looks up the sk file of an abstract command in our sk_bank.  The
+        version first looked up is used for the rest of the decoding,
+        including that of the iterations of deferred *FOR loops, even if
+        the sk file is reloaded in the meantime.
+        """
+        key = (obe_id.upper(), obe_mode.upper(), cmdname.upper())
+        try:
+            skbunch = self.sk_pins[key]
+
+        except KeyError:
+            skbunch = self.sk_bank.lookup(obe_id, obe_mode, cmdname)
+            self.sk_pins[key] = skbunch
+
+        if self.sk_lookups is not None:
+            self.sk_lookups[key] = skbunch.version
+        return skbunch
+
+
+    def _pin_subs(self, ast, eval, var_lst):
+        """Looks up the sk files called by *SUB in (ast), the body of a
+        deferred *FOR loop, whose names do not depend on the loop
+        variables (var_lst), so that its iterations use the versions
+        current when the loop was decoded.
+        """
+        loop_vars = set([var.lower() for var in var_lst])
+
+        todo = [ast]
+        while len(todo) > 0:
+            node = todo.pop()
+            if not isinstance(node, ASTNode):
+                continue
+            if node.tag != 'star_sub':
+                todo.extend(node.items)
+                continue
+
+            (ast_cmd_exp, ast_params) = node.items
+            if ast_cmd_exp.tag != 'string':
+                continue
+            actuals = dict([(keyval.items[0].lower(), keyval.items[1])
+                            for keyval in ast_params.items])
+
+            names = []
+            for var in ('obe_id', 'obe_mode'):
+                val_ast = actuals.get(var, None)
+                if (val_ast is None) or \
+                       (val_ast.tag not in ('string', 'id_ref')) or \
+                       ((val_ast.tag == 'id_ref') and
+                        (val_ast.items[0].lower() in loop_vars)):
+                    break
+                try:
+                    name = eval.eval(val_ast)
+                except Exception:
+                    break
+                if type(name) != strtype:
+                    break
+                names.append(name)
+
+            else:
+                try:
+                    self._lookup(names[0], names[1], ast_cmd_exp.items[0])
+
+                except Exception as e:
+                    # left for the iteration that calls it, if any
+                    self.logger.debug("Error looking up *SUB %s: %s" % (
+                        ast_cmd_exp.items[0], str(e)))
+
+
     def _decode_params(self, ast, eval):
         assert ast.tag == 'param_list', ASTerr(ast)
 
@@ -1243,7 +2557,7 @@ class Decoder(object):
             (var, val_ast) = keyval.items
             assert type(var) == strtype, "variable is not a string"
 
-            new_val_ast = self.decode(val_ast, eval)
+            new_val_ast = self._decode(val_ast, eval)
 
             res[var] = new_val_ast
 
@@ -1251,7 +2565,7 @@ class Decoder(object):
 
     def _decode_merge(self, body_ast, eval):
 
-            new_ast = self.decode(body_ast, eval)
+            new_ast = self._decode(body_ast, eval)
 
             # if result is a command list, then mark it for merging into
             # one large result
@@ -1260,3 +2574,451 @@ class Decoder(object):
                 new_ast = ASTNode('block_merge', *new_ast.items)
 
             return new_ast
+
+
+##############################################################
+# OPTIMIZER
+##############################################################
+
+class Optimizer(sk_common.ASTVisitor):
+    """Simplifies the ASTs of skeleton files ahead of their decoding:
+
+    - arithmetic on number literals is folded into numbers,
+    - *IF ribs whose predicates are constant are dropped, or become the
+      ELSE rib, and a *IF left with only an ELSE rib is replaced by its
+      statements,
+    - command lists and blocks left with no statements, or a single one
+      that executes the same in the enclosing list, are unwrapped.
+
+    These only do ahead of time what the decoder does for every
+    execution, so the decoded results are unchanged.  Nodes that are not
+    simplified are shared with the original AST, which is not modified.
+    """
+
+    # Value of the expressions that are not constants
+    unknown = object()
+
+    visit_prefix = 'optimize_'
+    visit_default = 'optimize_default'
+
+    def __init__(self):
+        super(Optimizer, self).__init__()
+        # Evaluates the constant expressions; it has nothing to resolve
+        self.evaluator = Evaluator(None, None, None, None, None)
+
+    def optimize(self, ast):
+        """Returns the simplified form of (ast).
+        """
+        if not isinstance(ast, ASTNode):
+            return ast
+
+        method = self.visit_method(ast.tag)
+        return method(self, ast)
+
+
+    def optimize_default(self, ast):
+        return self.rebuild(ast, [self.optimize(item) for item in ast.items])
+
+
+    def rebuild(self, ast, items):
+        """Returns a node like (ast) with (items), or (ast) itself if they
+        are its own items.
+        """
+        if (len(items) == len(ast.items)) and \
+               all([new is old for (new, old) in zip(items, ast.items)]):
+            return ast
+
+        new_ast = ASTNode(ast.tag, *items, **ast.get_attributes())
+        new_ast.name = ast.name
+        return new_ast
+
+
+    def optimize_block(self, ast):
+        items = []
+        for item in ast.items:
+            items.extend(self.optimize_stmt(item))
+        return self.rebuild(ast, items)
+
+    optimize_block_merge = optimize_block
+    optimize_cmdlist = optimize_block
+
+
+    def optimize_stmt(self, ast):
+        """Returns the list of statements replacing statement (ast) of a
+        command list or block.
+        """
+        if not isinstance(ast, ASTNode):
+            return [ast]
+
+        if ast.tag == 'star_if':
+            ribs = self.optimize_ribs(ast)
+            if len(ribs) == 0:
+                return []
+            if ribs[0].items[0] is True:
+                then_ast = ribs[0].items[1]
+                if isinstance(then_ast, ASTNode) and \
+                       (then_ast.tag == 'cmdlist'):
+                    return list(then_ast.items)
+                return [then_ast]
+            return [self.rebuild(ast, ribs)]
+
+        new_ast = self.optimize(ast)
+
+        if new_ast.tag in ('block', 'cmdlist'):
+            if len(new_ast.items) == 0:
+                return []
+            if (len(new_ast.items) == 1) and \
+                   self.is_flat(new_ast.items[0]):
+                return [new_ast.items[0]]
+
+        return [new_ast]
+
+
+    def is_flat(self, ast):
+        """Returns True if statement (ast) executes the same as a statement
+        of its own command list or of the enclosing one: it does not end
+        the list, is not waited for at its end, and is not decoded into
+        statements to merge into it.
+        """
+        if not isinstance(ast, ASTNode):
+            return False
+
+        if ast.tag in ('async', 'return', 'star_for', 'block_merge'):
+            return False
+
+        if ast.tag == 'star_if':
+            for cond_ast in ast.items:
+                then_ast = cond_ast.items[1]
+                if isinstance(then_ast, ASTNode) and \
+                       (then_ast.tag == 'cmdlist'):
+                    if not all([self.is_flat(item)
+                                for item in then_ast.items]):
+                        return False
+                elif not self.is_flat(then_ast):
+                    return False
+
+        return True
+
+
+    def optimize_star_if(self, ast):
+        # A *IF that is not a statement of a command list
+        ribs = self.optimize_ribs(ast)
+        if len(ribs) == 0:
+            return ASTNode('block_merge')
+        return self.rebuild(ast, ribs)
+
+
+    def optimize_ribs(self, ast):
+        """Returns the cond ribs of *IF statement (ast) that may be taken.
+        """
+        res = []
+        for cond_ast in ast.items:
+            assert cond_ast.tag == 'cond', ASTerr(cond_ast)
+
+            assert len(cond_ast.items) == 2, ASTerr(cond_ast)
+            (pred_ast, then_ast) = cond_ast.items
+            then_ast = self.optimize(then_ast)
+
+            if pred_ast is True:
+                res.append(self.rebuild(cond_ast, [pred_ast, then_ast]))
+                break
+
+            pred_ast = self.optimize(pred_ast)
+            val = self.is_true(self.value(pred_ast))
+            if val is self.unknown:
+                res.append(self.rebuild(cond_ast, [pred_ast, then_ast]))
+
+            elif val:
+                # taken whenever the ribs before it are not
+                res.append(self.rebuild(cond_ast, [True, then_ast]))
+                break
+
+        return res
+
+
+    def value(self, ast):
+        """Returns the value of expression (ast) if it is a constant,
+        otherwise Optimizer.unknown.  The value is that the evaluator
+        computes; expressions it would raise an error for are not
+        constants, so that the error is left for execution.
+        """
+        if not self.is_constant(ast):
+            return self.unknown
+
+        try:
+            return self.evaluator.eval(ast)
+
+        except Exception:
+            return self.unknown
+
+
+    def is_true(self, val):
+        """Returns True or False for the value (val) of a predicate, as the
+        decoder takes it, or Optimizer.unknown if that is not known.
+        """
+        if val is self.unknown:
+            return val
+        try:
+            return bool(self.evaluator.isTrue(val))
+
+        except Exception:
+            return self.unknown
+
+
+    def is_constant(self, ast):
+        """Returns True if expression (ast) refers to no variables, status,
+        registers or frames, and calls no functions.
+        """
+        if not isinstance(ast, ASTNode):
+            return False
+
+        if ast.tag in ('number', 'string'):
+            return True
+
+        elif ast.tag == 'qstring':
+            return not template_specials[False].search(ast.items[0])
+
+        elif ast.tag == 'asnum':
+            return self.is_constant(ast.items[0])
+
+        elif (ast.tag == 'monad') and (len(ast.items) == 2):
+            (opr, exp1) = ast.items
+            return (opr in ('-', 'NOT')) and self.is_constant(exp1)
+
+        elif (ast.tag == 'dyad') and (len(ast.items) == 3):
+            (exp1, opr, exp2) = ast.items
+            return ((opr in ('AND', 'OR')) or (opr in dyad_ops)) and \
+                   self.is_constant(exp1) and self.is_constant(exp2)
+
+        return False
+
+
+    def number(self, val):
+        """Returns a number node for the result (val) of folding, or None if
+        it is not a finite float.
+        """
+        if isinstance(val, float) and math.isfinite(val):
+            return ASTNode('number', val)
+        return None
+
+
+    def optimize_dyad(self, ast):
+        new_ast = self.optimize_default(ast)
+        if (len(new_ast.items) == 3) and \
+               (new_ast.items[1] in ('+', '-', '*', '/')) and \
+               all([isinstance(item, ASTNode) and (item.tag == 'number')
+                    for item in (new_ast.items[0], new_ast.items[2])]):
+            res = self.number(self.value(new_ast))
+            if res is not None:
+                return res
+        return new_ast
+
+
+    def optimize_monad(self, ast):
+        new_ast = self.optimize_default(ast)
+        if (len(new_ast.items) == 2) and (new_ast.items[0] == '-') and \
+               isinstance(new_ast.items[1], ASTNode) and \
+               (new_ast.items[1].tag == 'number'):
+            res = self.number(self.value(new_ast))
+            if res is not None:
+                return res
+        return new_ast
+
+
+    def optimize_asnum(self, ast):
+        new_ast = self.optimize_default(ast)
+        if isinstance(new_ast.items[0], ASTNode) and \
+               (new_ast.items[0].tag == 'number'):
+            res = self.number(self.value(new_ast))
+            if res is not None:
+                return res
+        return new_ast
+
+
+##############################################################
+# DECODE CACHE
+##############################################################
+
+class DecodeCache(object):
+    """A cache of decoding results.
+
+    Entries are indexed by a key identifying the command being decoded
+    (e.g. the abstract command, the version of its sk file and its actual
+    parameters--see interpTask._decode_key()).  As decoding may read
+    status, each entry holds variants of the result for the values of the
+    status aliases that were read; a variant is only reused if those
+    aliases still have the same values and the sk files expanded by *SUB
+    are at the same version.  Results of decodings that allocated frames
+    or deferred *FOR loops (see Decoder) are never cached.
+
+    A cached result holds the decoded AST and the variables of the
+    evaluators its closures refer to.  Reusing it makes a copy bound to
+    the evaluator of the new decoding.
+    """
+
+    def __init__(self, sk_bank, maxsize=256, max_variants=8, logger=None):
+        self.sk_bank = sk_bank
+        if logger:
+            self.logger = logger
+        else:
+            self.logger = logging.getLogger('sk.decodecache')
+
+        self.cache = sk_cache.LRUCache(maxsize=maxsize)
+        self.max_variants = max_variants
+
+    def decode(self, decoder, ast, eval, key):
+        """Decodes (ast) with (decoder) and (eval), reusing an earlier
+        result cached under (key), if possible.  If (key) is None the
+        result is not cached.
+        """
+        if key is None:
+            return decoder.decode(ast, eval)
+
+        for variant in self.cache.get(key, ()):
+            if self._is_valid(variant, eval):
+                return self._instantiate(variant, eval)
+
+        status = eval.status
+        frames = eval.frame_id_source
+        if (not hasattr(status, 'record')) or \
+               (not hasattr(frames, 'allocated')):
+            return decoder.decode(ast, eval)
+
+        allocated = frames.allocated
+        deferred = decoder.deferred
+        status.record = {}
+        decoder.sk_lookups = {}
+        try:
+            new_ast = decoder.decode(ast, eval)
+
+        finally:
+            variant = Bunch.Bunch(status=status.record,
+                                  sk_lookups=decoder.sk_lookups)
+            status.record = None
+            decoder.sk_lookups = None
+
+        if frames.allocated != allocated:
+            # frame numbers must not be reused
+            return new_ast
+
+        if decoder.deferred != deferred:
+            # the iterations of deferred loops are decoded in evaluators
+            # of their own, as they are executed
+            return new_ast
+
+        # Keep a copy of the result detached from the evaluators used to
+        # produce it, which are replaced by numbers (the root being 0)
+        evaluators = self._get_evaluators(new_ast, eval)
+        evmap = dict([(ev, i) for (i, ev) in enumerate(evaluators)])
+        memo = {}
+        variant.ast = self._copy(new_ast, evmap, memo)
+        variant.envs = [dict([(var, self._copy(val, evmap, memo))
+                              for (var, val) in
+                              ev.variables.variable_map.items()])
+                        for ev in evaluators]
+
+        with self.cache.lock:
+            variants = self.cache.peek(key, [])
+            variants = variants[-(self.max_variants-1):] + [variant]
+            self.cache[key] = variants
+
+        return new_ast
+
+    def clear(self):
+        self.cache.clear()
+
+    def _is_valid(self, variant, eval):
+        for (alias, val) in variant.status.items():
+            try:
+                if eval.status.get(alias) != val:
+                    return False
+            except Exception:
+                return False
+
+        for (key, version) in variant.sk_lookups.items():
+            try:
+                if self.sk_bank.lookup(*key).version != version:
+                    return False
+            except Exception:
+                return False
+
+        return True
+
+    def _get_evaluators(self, ast, root):
+        """Returns a list of (root) and all the evaluators reachable from
+        the closures in (ast) or in the variables of those evaluators.
+        """
+        res = []
+        # (root is popped first)
+        todo = [ast, root]
+        seen = set()
+        while len(todo) > 0:
+            obj = todo.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+
+            if isinstance(obj, ASTNode):
+                todo.extend(obj.items)
+                todo.extend(obj.get_attributes().values())
+
+            elif isinstance(obj, Closure):
+                todo.append(obj.ast)
+                todo.append(obj.eval)
+
+            elif isinstance(obj, Evaluator):
+                res.append(obj)
+                todo.extend(obj.variables.variable_map.values())
+
+            elif isinstance(obj, (list, tuple)):
+                todo.extend(obj)
+
+        return res
+
+    def _copy(self, obj, evmap, memo):
+        """Copies the AST (obj), rebinding its closures to the evaluators
+        mapped from theirs by (evmap).
+        """
+        if isinstance(obj, ASTNode):
+            attrs = dict([(name, self._copy(val, evmap, memo))
+                          for (name, val) in obj.get_attributes().items()])
+            new_ast = ASTNode(obj.tag,
+                              *[self._copy(item, evmap, memo)
+                                for item in obj.items],
+                              **attrs)
+            new_ast.name = obj.name
+            return new_ast
+
+        elif isinstance(obj, Closure):
+            try:
+                return memo[id(obj)]
+            except KeyError:
+                cls = Closure(self._copy(obj.ast, evmap, memo),
+                              evmap[obj.eval])
+                memo[id(obj)] = cls
+                return cls
+
+        elif isinstance(obj, list):
+            return [self._copy(item, evmap, memo) for item in obj]
+
+        elif isinstance(obj, tuple):
+            return tuple([self._copy(item, evmap, memo) for item in obj])
+
+        return obj
+
+    def _instantiate(self, variant, eval):
+        """Makes a copy of the cached (variant) whose closures are bound to
+        (eval), or to new evaluators cloned from it.
+        """
+        evmap = [eval]
+        for i in range(1, len(variant.envs)):
+            evmap.append(eval.clone(inherit_vars=False))
+
+        memo = {}
+        new_ast = self._copy(variant.ast, evmap, memo)
+        for (new_eval, variables) in zip(evmap, variant.envs):
+            new_eval.variables.setAll(
+                dict([(var, self._copy(val, evmap, memo))
+                      for (var, val) in variables.items()]))
+
+        return new_ast
@@ -4,6 +4,11 @@ sk_lexer.py -- oscript ("skeleton") file lexer/scanner
 """
 import logging
 import re
+try:
+    # Python 3.11+
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
 
 import ply.lex as lex
 import ply.yacc as yacc
@@ -122,6 +127,9 @@ class skScanner(object):
 
     t_ignore = ' \t'
 
+    # Flags for compiling the token regexes
+    reflags = re.IGNORECASE
+
     t_START     = r'\:START'
     t_MAINSTART = r'\:MAIN_START'
     t_END       = r'\:END'
@@ -278,7 +286,7 @@ class skScanner(object):
 
 
     def build(self):
-        self.lexer = lex.lex(object=self, reflags=re.IGNORECASE,
+        self.lexer = lex.lex(object=self, reflags=self.reflags,
                              debug=self._debug, lextab=self._lextab)
 
     def __init__(self, logger=None, debug=False, lextab='sk_scan_tab'):
@@ -309,6 +317,18 @@ class skScanner(object):
     def input(self, buf):
         return self.lexer.input(buf)
 
+    # For position tracking in ply.yacc (ply.lex looks these up before
+    # the lexer is built)
+    @property
+    def lineno(self):
+        lexer = self.__dict__.get('lexer')
+        return lexer.lineno if lexer is not None else None
+
+    @property
+    def lexpos(self):
+        lexer = self.__dict__.get('lexer')
+        return lexer.lexpos if lexer is not None else None
+
 
     def tokenize(self, buf, startline=1):
         # Reset lexer state
@@ -353,3 +373,280 @@ class skScanner(object):
         res.filepath = skpath
 
         return res
+
+
+def first_chars(regex, flags=0):
+    """Returns the set of characters that a match of (regex) can start
+    with, or None if that is not easily determined.
+    """
+    try:
+        code = sre_parse.parse(regex, flags)
+
+    except Exception:
+        return None
+    return _first_chars(list(code))
+
+def _first_chars(code):
+    if len(code) == 0:
+        return None
+    (op, av) = code[0]
+
+    if op == sre_parse.LITERAL:
+        return set([chr(av)])
+
+    if op == sre_parse.IN:
+        res = set()
+        for (op2, av2) in av:
+            if op2 == sre_parse.LITERAL:
+                res.add(chr(av2))
+            elif op2 == sre_parse.RANGE:
+                res.update(map(chr, range(av2[0], av2[1] + 1)))
+            else:
+                # negated sets, categories
+                return None
+        return res
+
+    if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+        return _first_chars(list(av[2]))
+
+    if op == sre_parse.SUBPATTERN:
+        return _first_chars(list(av[-1]))
+
+    if op == sre_parse.BRANCH:
+        res = set()
+        for branch in av[1]:
+            chars = _first_chars(list(branch))
+            if chars is None:
+                return None
+            res.update(chars)
+        return res
+
+    return None
+
+
+class skFastScanner(skScanner):
+    """A drop-in replacement for skScanner that produces the identical
+    token stream, but does its own scanning in a single pass instead of
+    going through ply.lex token by token.
+
+    The token regexes are combined into a master regex in the same order
+    that ply.lex uses (function rules in the order of definition, then
+    string rules by decreasing regex length), so the first rule that
+    matches wins as before.  For speed, the next character of the input
+    selects a precompiled regex holding only the rules that can start
+    with it, and the ignored characters following a token are consumed
+    by the same match.  Matched rules dispatch directly to their token
+    type, and line numbers are counted from the matched newlines.
+
+    A subclass adding string rules needs nothing else; a new function rule
+    needs an entry in fast_actions.
+    """
+
+    # Kinds of actions for matched rules
+    A_TOKEN = 0         # token of the rule type
+    A_ID = 1            # identifier, number or reserved word
+    A_STRIP = 2         # token with the delimiters stripped off
+    A_LINE = 3          # discarded, ends a line
+    A_LINES = 4         # discarded, a run of newlines
+
+    # function rule -> (action, token type); a type of None means the
+    # name of the rule
+    fast_actions = {
+        't_ALIASREF': (A_TOKEN, None),
+        't_IDREF': (A_TOKEN, None),
+        't_REGREF': (A_TOKEN, None),
+        't_ID': (A_ID, None),
+        't_QSTR': (A_STRIP, None),
+        't_SQSTR': (A_STRIP, 'QSTR'),
+        't_LSTR': (A_STRIP, None),
+        't_LCONT': (A_LINE, None),
+        't_COMMENT': (A_LINE, None),
+        't_NEWLINE': (A_LINES, None),
+        }
+
+    # class -> (master matcher, dispatch table), shared by all instances
+    _scanner_cache = {}
+
+    def build(self):
+        # The ply lexer is still built: it validates the rules, and keeps
+        # the line number that the parsers refer to
+        super(skFastScanner, self).build()
+
+        self._tokens = iter(())
+        try:
+            (self._master, self._dispatch) = self._scanner_cache[
+                self.__class__]
+
+        except KeyError:
+            (self._master, self._dispatch) = self._build_scanner()
+            self._scanner_cache[self.__class__] = (self._master,
+                                                   self._dispatch)
+
+    def _get_rules(self):
+        """Returns a list of (name, regex, action, token type) tuples for
+        the rules of the scanner, in the order ply.lex tries them.
+        """
+        funcs = []
+        strs = []
+        for name in sorted(dir(self)):
+            if not name.startswith('t_') or name in ('t_ignore', 't_error'):
+                continue
+            rule = getattr(self, name)
+            if callable(rule):
+                funcs.append((rule.__code__.co_firstlineno, name,
+                              rule.__doc__))
+            else:
+                strs.append((name, rule))
+
+        funcs.sort(key=lambda x: x[0])
+        strs.sort(key=lambda x: len(x[1]), reverse=True)
+
+        res = []
+        for (lineno, name, regex) in funcs:
+            try:
+                (action, toktype) = self.fast_actions[name]
+
+            except KeyError:
+                raise skScanError("No fast scanner action for rule '%s'" % (
+                    name))
+            res.append((name, regex, action, toktype or name[2:]))
+
+        for (name, regex) in strs:
+            res.append((name, regex, self.A_TOKEN, name[2:]))
+
+        return res
+
+    def _make_matcher(self, rules):
+        """Returns a tuple of the match method of a regex matching any of
+        (rules) followed by ignored characters, and a list mapping its
+        group indexes to (action, token type) tuples.
+        """
+        regex = re.compile('(?:%s)[%s]*' % (
+            '|'.join(['(?P<%s>%s)' % (name, regex)
+                      for (name, regex, action, toktype) in rules]),
+            re.escape(self.t_ignore)), self.reflags)
+
+        actions = [None] * (regex.groups + 1)
+        for (name, _regex, action, toktype) in rules:
+            actions[regex.groupindex[name]] = (action, toktype)
+
+        return (regex.match, actions)
+
+    def _build_scanner(self):
+        rules = self._get_rules()
+        master = self._make_matcher(rules)
+
+        first = [(rule, first_chars(rule[1], self.reflags))
+                 for rule in rules]
+
+        # ASCII character -> matcher for the rules that can start with it.
+        # Rules with no known set of first characters are in all of them.
+        dispatch = {}
+        matchers = {}
+        for ch in map(chr, range(128)):
+            names = tuple([rule[0] for (rule, chars) in first
+                           if (chars is None) or (ch in chars) or
+                           ((self.reflags & re.IGNORECASE) and
+                            ch.swapcase() in chars)])
+            if len(names) == 0:
+                continue
+            if names not in matchers:
+                matchers[names] = self._make_matcher(
+                    [rule for rule in rules if rule[0] in names])
+            dispatch[ch] = matchers[names]
+
+        return (master, dispatch)
+
+    def _scan(self, buf):
+        lexer = self.lexer
+        master = self._master
+        get_matcher = self._dispatch.get
+        reserved_map = self.reserved_map
+        num_match = num_re.match
+        LexToken = lex.LexToken
+        A_TOKEN, A_ID, A_STRIP, A_LINE = (self.A_TOKEN, self.A_ID,
+                                          self.A_STRIP, self.A_LINE)
+
+        lineno = lexer.lineno
+        end = len(buf)
+        pos = 0
+        # Leading ignored characters; the ones after a token are skipped
+        # as part of matching it
+        while pos < end and buf[pos] in self.t_ignore:
+            pos += 1
+
+        while pos < end:
+            (match, actions) = get_matcher(buf[pos], master)
+            m = match(buf, pos)
+            if m is None:
+                # Report the error the way ply.lex does.  t_error does
+                # not skip input, so scanning stops here.
+                lexer.lineno = lineno
+                lexer.lexpos = pos
+                tok = LexToken()
+                tok.type = 'error'
+                tok.value = buf[pos:]
+                tok.lineno = lineno
+                tok.lexpos = pos
+                tok.lexer = lexer
+                self.t_error(tok)
+                raise lex.LexError("Scanning error. Illegal character '%s'" % (
+                    buf[pos]), buf[pos:])
+
+            idx = m.lastindex
+            (action, toktype) = actions[idx]
+            start = pos
+            pos = m.end()
+
+            if action == A_TOKEN:
+                value = m.group(idx)
+            elif action == A_ID:
+                value = m.group(idx)
+                if num_match(value):
+                    toktype = 'NUM'
+                else:
+                    value = value.upper()
+                    toktype = reserved_map.get(value, 'ID')
+            elif action == A_STRIP:
+                value = buf[start+1:m.end(idx)-1]
+            elif action == A_LINE:
+                lineno += 1
+                continue
+            else:
+                lineno += m.end(idx) - start
+                continue
+
+            tok = LexToken()
+            tok.type = toktype
+            tok.value = value
+            tok.lineno = lineno
+            tok.lexpos = start
+            lexer.lineno = lineno
+            lexer.lexpos = pos
+            yield tok
+
+        lexer.lineno = lineno
+        lexer.lexpos = pos
+
+    # For compatibility with ply.yacc
+    def token(self):
+        return next(self._tokens, None)
+
+    # For compatibility with ply.yacc
+    def input(self, buf):
+        self._tokens = self._scan(buf)
+
+    def tokenize(self, buf, startline=1):
+        # Reset lexer state
+        self.reset(lineno=startline)
+
+        self.input(buf)
+        res = []
+        try:
+            for tok in self._tokens:
+                res.append(tok)
+
+        except lex.LexError as e:
+            pass
+
+        return (self.errors, res, self.errinfo)
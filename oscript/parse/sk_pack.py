@@ -0,0 +1,378 @@
+#
+# sk_pack.py -- compact binary serialization of ASTs
+#
+"""
+A compact, versioned binary encoding for ASTNode trees.
+
+A stream starts with a header (magic string and format version) and is
+followed by any number of encoded values.  Values are ASTNodes and the
+things that may appear in their items or attributes: None, bools, ints,
+floats, strings, lists, tuples, dicts and Closures.  Strings are stored
+once per stream and referenced by index afterward, which keeps the
+repeated tags, operators and identifiers of an AST small.  Serial numbers
+of the nodes are preserved.
+
+A Closure is encoded as a placeholder holding its AST only; it decodes to
+a Closure whose evaluator is None, which must be bound before use.
+
+Example:
+    buf = sk_pack.dumps(ast)
+    ast2 = sk_pack.loads(buf)
+or, for a stream of values:
+    packer = sk_pack.Packer(out_f)
+    for ast in asts:
+        packer.pack(ast)
+    ...
+    for ast in sk_pack.Unpacker(in_f):
+        ...
+
+An Unpacker reads its file ahead of the values it has decoded, so it
+consumes the rest of the file.  dump() and load() instead write and read
+a single value as a record prefixed with its length, so that several
+records, or other data, may follow each other in a file.
+"""
+import sys
+import io
+import struct
+
+from oscript.parse.sk_common import ASTNode, Closure, skError
+
+magic = b'SKAST'
+# Bump this if the encoding changes
+format_version = 1
+
+header = magic + bytes([format_version])
+
+# Type codes
+T_NONE = 0
+T_TRUE = 1
+T_FALSE = 2
+T_INT = 3
+T_FLOAT = 4
+T_STR = 5
+T_STRREF = 6
+T_NODE = 7
+T_LIST = 8
+T_TUPLE = 9
+T_DICT = 10
+T_CLOSURE = 11
+
+# Flags of encoded nodes
+F_NAME = 1          # name differs from tag
+F_ATTRS = 2         # node has attributes
+
+float_struct = struct.Struct('<d')
+# Length prefix of the records written by dump()
+length_struct = struct.Struct('<Q')
+
+
+class PackError(skError):
+    pass
+
+
+class Packer(object):
+    """Encodes values to the binary file-like object (out_f).  The header
+    is written before the first value.
+    """
+
+    def __init__(self, out_f):
+        self.out_f = out_f
+        # string -> index in the string table of the stream
+        self.strings = {}
+        self.started = False
+
+    def pack(self, obj):
+        """Writes the encoding of (obj) to the stream.
+        """
+        buf = bytearray()
+        if not self.started:
+            buf.extend(header)
+            self.started = True
+
+        self._pack(obj, buf)
+        self.out_f.write(buf)
+
+    def _pack_uint(self, n, buf):
+        # LEB128 style variable length unsigned integer
+        while n >= 0x80:
+            buf.append((n & 0x7f) | 0x80)
+            n >>= 7
+        buf.append(n)
+
+    def _pack_str(self, s, buf):
+        try:
+            idx = self.strings[s]
+            buf.append(T_STRREF)
+            self._pack_uint(idx, buf)
+
+        except KeyError:
+            self.strings[s] = len(self.strings)
+            data = s.encode('utf-8', 'surrogatepass')
+            buf.append(T_STR)
+            self._pack_uint(len(data), buf)
+            buf.extend(data)
+
+    def _pack(self, obj, buf):
+        typ = type(obj)
+
+        if typ is ASTNode:
+            attrs = obj.get_attributes()
+            flags = 0
+            if obj.name != obj.tag:
+                flags |= F_NAME
+            if len(attrs) > 0:
+                flags |= F_ATTRS
+
+            buf.append(T_NODE)
+            buf.append(flags)
+            self._pack_uint(obj.serial_num, buf)
+            self._pack(obj.tag, buf)
+            if flags & F_NAME:
+                self._pack(obj.name, buf)
+            self._pack_uint(len(obj.items), buf)
+            for item in obj.items:
+                self._pack(item, buf)
+            if flags & F_ATTRS:
+                self._pack(dict(attrs), buf)
+
+        elif typ is str:
+            self._pack_str(obj, buf)
+
+        elif obj is None:
+            buf.append(T_NONE)
+
+        elif obj is True:
+            buf.append(T_TRUE)
+
+        elif obj is False:
+            buf.append(T_FALSE)
+
+        elif typ is int:
+            # zigzag encoding of signed integers
+            buf.append(T_INT)
+            if obj >= 0:
+                self._pack_uint(obj << 1, buf)
+            else:
+                self._pack_uint(((-obj) << 1) - 1, buf)
+
+        elif typ is float:
+            buf.append(T_FLOAT)
+            buf.extend(float_struct.pack(obj))
+
+        elif typ is list:
+            buf.append(T_LIST)
+            self._pack_uint(len(obj), buf)
+            for item in obj:
+                self._pack(item, buf)
+
+        elif typ is tuple:
+            buf.append(T_TUPLE)
+            self._pack_uint(len(obj), buf)
+            for item in obj:
+                self._pack(item, buf)
+
+        elif typ is dict:
+            buf.append(T_DICT)
+            self._pack_uint(len(obj), buf)
+            for (key, val) in obj.items():
+                self._pack(key, buf)
+                self._pack(val, buf)
+
+        elif isinstance(obj, Closure):
+            buf.append(T_CLOSURE)
+            self._pack(obj.ast, buf)
+
+        else:
+            raise PackError("Can't encode value of type %s: %s" % (
+                str(typ), str(obj)))
+
+
+class Unpacker(object):
+    """Decodes values from the binary file-like object (in_f).  Iterating
+    over it yields the values until the end of the stream.  The file is
+    read ahead in large chunks, so the stream must extend to the end of
+    it.
+    """
+
+    def __init__(self, in_f):
+        self.in_f = in_f
+        self.strings = []
+        self.started = False
+
+        # Decoding is done from a buffer, which is refilled from the file
+        # as needed
+        self.buf = b''
+        self.pos = 0
+
+    def __iter__(self):
+        while True:
+            try:
+                yield self.unpack()
+            except EOFError:
+                return
+
+    def _read(self, n):
+        if self.pos + n > len(self.buf):
+            chunks = [self.buf[self.pos:]]
+            size = len(chunks[0])
+            while size < n:
+                data = self.in_f.read(max(n - size, 65536))
+                if len(data) == 0:
+                    raise PackError("Truncated AST stream")
+                chunks.append(data)
+                size += len(data)
+            self.buf = b''.join(chunks)
+            self.pos = 0
+
+        res = self.buf[self.pos:self.pos+n]
+        self.pos += n
+        return res
+
+    def _read_byte(self):
+        try:
+            res = self.buf[self.pos]
+
+        except IndexError:
+            return self._read(1)[0]
+
+        self.pos += 1
+        return res
+
+    def _at_end(self):
+        if self.pos < len(self.buf):
+            return False
+        self.buf = self.in_f.read(65536)
+        self.pos = 0
+        return len(self.buf) == 0
+
+    def unpack(self):
+        """Reads and returns the next value of the stream.  Raises
+        EOFError at the end of the stream.
+        """
+        if self._at_end():
+            raise EOFError("End of AST stream")
+
+        if not self.started:
+            hdr = self._read(len(header))
+            if hdr[:len(magic)] != magic:
+                raise PackError("Not an AST stream")
+            if hdr[len(magic)] != format_version:
+                raise PackError("Unsupported AST stream version: %d" % (
+                    hdr[len(magic)]))
+            self.started = True
+
+        return self._unpack()
+
+    def _unpack_uint(self):
+        res = 0
+        shift = 0
+        while True:
+            b = self._read_byte()
+            res |= (b & 0x7f) << shift
+            if b < 0x80:
+                return res
+            shift += 7
+
+    def _unpack(self):
+        typ = self._read_byte()
+
+        if typ == T_NODE:
+            flags = self._read_byte()
+            node = ASTNode.__new__(ASTNode)
+            node.serial_num = self._unpack_uint()
+            node.tag = sys.intern(self._unpack())
+            if flags & F_NAME:
+                node.name = self._unpack()
+            else:
+                node.name = node.tag
+            node.items = [self._unpack() for i in range(self._unpack_uint())]
+            if flags & F_ATTRS:
+                node.attributes = self._unpack()
+            else:
+                node.attributes = None
+            return node
+
+        elif typ == T_STRREF:
+            return self.strings[self._unpack_uint()]
+
+        elif typ == T_STR:
+            s = self._read(self._unpack_uint()).decode('utf-8',
+                                                       'surrogatepass')
+            self.strings.append(s)
+            return s
+
+        elif typ == T_NONE:
+            return None
+
+        elif typ == T_TRUE:
+            return True
+
+        elif typ == T_FALSE:
+            return False
+
+        elif typ == T_INT:
+            n = self._unpack_uint()
+            if n & 1:
+                return -((n + 1) >> 1)
+            return n >> 1
+
+        elif typ == T_FLOAT:
+            return float_struct.unpack(self._read(8))[0]
+
+        elif typ == T_LIST:
+            return [self._unpack() for i in range(self._unpack_uint())]
+
+        elif typ == T_TUPLE:
+            return tuple([self._unpack() for i in range(self._unpack_uint())])
+
+        elif typ == T_DICT:
+            res = {}
+            for i in range(self._unpack_uint()):
+                key = self._unpack()
+                res[key] = self._unpack()
+            return res
+
+        elif typ == T_CLOSURE:
+            return Closure(self._unpack(), None)
+
+        raise PackError("Bad type code in AST stream: %d" % (typ))
+
+
+def dump(obj, out_f):
+    """Writes the encoding of (obj) to the binary file (out_f), as a
+    record that load() reads back.
+    """
+    data = dumps(obj)
+    out_f.write(length_struct.pack(len(data)))
+    out_f.write(data)
+
+def load(in_f):
+    """Reads a record written by dump() from the binary file (in_f).
+    Reads exactly the bytes of the record, so that the file may be read
+    further afterward.  Raises EOFError at the end of the file.
+    """
+    prefix = in_f.read(length_struct.size)
+    if len(prefix) == 0:
+        raise EOFError("End of AST stream")
+    if len(prefix) < length_struct.size:
+        raise PackError("Truncated AST stream")
+
+    size = length_struct.unpack(prefix)[0]
+    data = in_f.read(size)
+    if len(data) < size:
+        raise PackError("Truncated AST stream")
+    return loads(data)
+
+def dumps(obj):
+    """Returns the encoding of (obj) as bytes.
+    """
+    out_f = io.BytesIO()
+    Packer(out_f).pack(obj)
+    return out_f.getvalue()
+
+def loads(buf):
+    """Returns the value encoded in the bytes (buf).
+    """
+    return Unpacker(io.BytesIO(buf)).unpack()
+
+#END
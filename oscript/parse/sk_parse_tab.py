@@ -0,0 +1,167 @@
+
+# sk_parse_tab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'programleftANDORrightNOTnonassocEQNEGTGELTLEleftADDSUBleftMULDIVrightUMINUSADD ALIASREF AND ASN ASSIGN CATCH COMMA DEF DIV ELIF ELSE END ENDIF EQ EXEC FROM GE GET_F_NO GT ID IDREF IF IMPORT IN LCURBRACKET LE LET LPAREN LSTR LT MAINEND MAINSTART MUL NE NOT NUM OR QSTR RAISE RCURBRACKET REGREF RETURN RPAREN SEMICOLON START STAR_ELIF STAR_ELSE STAR_ENDFOR STAR_ENDIF STAR_FOR STAR_IF STAR_SET STAR_SUB SUB WHILE param_list : emptyparam_list : param_list key_value_pairkey_value_pair : ID ASSIGN expressionfactor : NUMfactor : IDREFfactor : ALIASREFfactor : frame_id_ref factor : ID\n                   | OR\n                   | AND\n         factor : LSTR  factor : QSTR factor : REGREFfactor2 : ADD factor %prec UMINUSdyad : expression MUL expression\n                | expression DIV expression\n                | expression ADD expression\n                | expression SUB expression\n                | expression LT expression\n                | expression GT expression\n                | expression LE expression\n                | expression GE expression\n                | expression EQ expression\n                | expression NE expression\n                | expression AND expression\n                | expression OR expression\n        monad : NOT expression\n                 | SUB expression %prec UMINUS\n        func_call : ID LPAREN arg_list RPARENproc_call : REGREF LPAREN arg_list RPARENproc_call : REGREF LPAREN RPAREN arg_list : expression_list COMMA kwd_params arg_list : expression_list arg_list : kwd_paramskwd_params : key_value_pair COMMA kwd_paramskwd_params : key_value_pairasnum : LPAREN expression RPARENexpression : monad\n                      | dyad\n                      | func_call\n                      | proc_call\n                      | asnum\n                      | factor\n                      | factor2frame_id_ref : GET_F_NO LSTRexpression_list : expressionexpression_list : expression_list COMMA expressionempty :program : command_sectioncommand_section : preamble mainpart endpartpreamble : START statementspreamble : STARTmainpart : MAINSTART statements MAINENDmainpart : MAINSTART MAINENDendpart : statements ENDendpart : ENDstatements : statementstatement : command_listcommand_list : command_list async\n                        | command_list sync\n        command_list : command_list special_form\n                        | command_list abs_command\n        command_list : async\n                        | sync\n                        | abs_command\n                        | special_form\n        command_list : empty\n        special_form : if_list\n                        | star_if_list\n                        | star_for_loop\n                        | while_loop\n                        | catch\n                        | raise\n                        | return\n                        | star_set_stmnt\n                        | let_stmnt\n                        | set_stmnt\n                        | proc_defn\n                        | import_stmnt\n        async : exec_command COMMA\n                 | abs_command COMMA\n                 | command_block COMMA\n                 | proc_call COMMA\n                 | while_loop COMMA\n                 | let_stmnt COMMA\n                 | catch COMMA\n        sync : exec_command SEMICOLON\n                | abs_command SEMICOLON\n                | command_block SEMICOLON\n                | proc_call SEMICOLON\n                | while_loop SEMICOLON\n                | let_stmnt SEMICOLON\n                | catch SEMICOLON\n        command_block : LCURBRACKET command_list RCURBRACKETexec_command : EXEC factor factor param_listexec_command : ID ASSIGN EXEC factor factor param_listabs_command : STAR_SUB factor param_listif_list : IF expression ENDIFif_list : IF expression command_list ENDIFif_list : IF expression command_list ELSE ENDIFif_list : IF expression command_list ELSE command_list ENDIFif_list : IF expression command_list elif_list ENDIFif_list : IF expression command_list elif_list ELSE command_list ENDIFelif : ELIF expression command_listelif_list : elifelif_list : elif_list elifstar_if_list : STAR_IF expression STAR_ENDIFstar_if_list : STAR_IF expression command_list STAR_ENDIFstar_if_list : STAR_IF expression command_list STAR_ELSE STAR_ENDIFstar_if_list : STAR_IF expression command_list STAR_ELSE command_list STAR_ENDIFstar_if_list : STAR_IF expression command_list star_elif_list STAR_ENDIFstar_if_list : STAR_IF expression command_list star_elif_list STAR_ELSE command_list STAR_ENDIFstar_elif : STAR_ELIF expression command_liststar_elif_list : star_elif_list star_elifstar_elif_list : star_elifstar_set_stmnt : STAR_SET set_flags param_liststar_set_stmnt : STAR_SET param_listset_stmnt : ASN kwd_paramsset_flags : set_flags set_flagset_flags : set_flagset_flag : SUB IDstar_for_loop : STAR_FOR expression idlist IN expression command_list STAR_ENDFORstar_for_loop : STAR_FOR expression idlist IN command_list STAR_ENDFORstar_for_loop : STAR_FOR expression idlist IN STAR_ENDFORwhile_loop : WHILE expression command_blocklet_stmnt : LET kwd_params IN command_blockproc_defn : DEF ID LPAREN varlist RPAREN command_blockimport_stmnt : FROM QSTR IMPORT varlistcatch : CATCH ID command_blockraise : RAISE expressionreturn : RETURN expressionreturn : RETURNidlist : expressionsvarlist : IDvarlist : varlist COMMA IDexpressions : expressions expressionexpressions : expression'
+    
+_lr_action_items = {'START':([0,],[4,]),'$end':([1,2,47,49,117,],[0,-49,-50,-56,-55,]),'MAINSTART':([3,4,7,8,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,42,43,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,101,107,108,109,110,111,112,114,119,120,123,125,130,143,144,145,151,152,154,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,195,206,208,212,214,215,220,221,227,233,236,240,241,242,243,244,245,],[6,-48,-51,-57,-58,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,-132,-48,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,-130,-131,-48,-117,-120,-1,-118,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,-107,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,-108,-134,-128,-29,-100,-102,-109,-111,-124,-101,-110,-123,-127,-135,-103,-112,-122,]),'STAR_SUB':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[21,21,21,21,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,21,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,21,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,21,21,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,21,-107,21,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,21,-108,21,21,-134,-128,-29,21,-100,-102,21,21,21,-109,-111,21,21,21,21,-124,-41,-8,-101,21,21,-110,21,21,21,-123,-127,-135,-103,-112,-122,]),'EXEC':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[31,31,31,31,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,31,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,122,31,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,31,31,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,31,-107,31,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,31,-108,31,31,-134,-128,-29,31,-100,-102,31,31,31,-109,-111,31,31,31,31,-124,-41,-8,-101,31,31,-110,31,31,31,-123,-127,-135,-103,-112,-122,]),'ID':([4,5,6,9,10,11,12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,33,35,36,37,38,39,40,41,42,43,44,45,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,87,88,89,90,91,92,93,94,95,96,97,98,99,101,104,105,106,107,108,109,110,111,112,113,114,118,119,120,121,122,123,125,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,149,150,151,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,194,195,196,199,200,201,202,203,204,205,206,208,209,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,],[32,32,32,32,-63,-64,-66,-65,-67,-71,-76,-72,75,-68,-69,-70,-73,-74,-75,-77,-78,-79,75,32,97,102,103,97,97,97,97,97,-48,102,115,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,75,32,129,-38,-39,-40,-41,-42,-43,-44,97,97,75,-8,97,-13,-36,32,32,97,-130,-131,-48,102,-120,-1,166,-118,-53,102,-45,-48,75,-94,-31,-125,97,97,97,97,97,97,97,97,97,97,97,97,-27,-28,-14,129,102,97,-129,-98,32,-107,32,-137,202,97,-10,-9,97,102,-119,-2,-121,206,206,102,75,-30,129,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,32,97,-108,32,97,229,-14,-8,-13,-18,-136,-134,-128,-48,-29,32,-100,-102,32,32,32,-109,-111,32,32,32,32,-124,-41,-8,242,102,-101,32,32,-110,32,32,32,-123,-127,-135,-103,-112,-122,]),'LCURBRACKET':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,86,87,88,89,90,91,92,93,97,99,101,103,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,148,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,230,233,234,235,236,237,238,239,240,241,242,243,244,245,],[33,33,33,33,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,33,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,33,33,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,33,33,33,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,33,-129,-98,33,-107,33,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,33,-108,33,33,-134,-128,-29,33,-100,-102,33,33,33,-109,-111,33,33,33,33,-124,-41,-8,33,-101,33,33,-110,33,33,33,-123,-127,-135,-103,-112,-122,]),'REGREF':([4,5,6,9,10,11,12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,33,35,38,39,40,41,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,87,88,89,90,91,92,93,94,95,96,97,98,99,101,104,105,106,107,108,109,110,111,112,114,118,119,120,122,123,125,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,150,151,152,153,154,155,156,158,159,160,161,162,163,164,165,166,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,194,195,196,199,200,201,202,203,204,205,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[34,34,34,34,-63,-64,-66,-65,-67,-71,-76,-72,80,-68,-69,-70,-73,-74,-75,-77,-78,-79,80,34,99,99,99,99,99,99,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,80,34,99,-38,-39,-40,-41,-42,-43,-44,99,99,80,-8,99,-13,-36,34,34,99,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,80,-94,-31,-125,99,99,99,99,99,99,99,99,99,99,99,99,-27,-28,-14,99,99,-129,-98,34,-107,34,-137,203,99,-10,-9,99,-116,-119,-2,-121,80,-30,99,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,34,99,-108,34,99,99,-14,-8,-13,-18,-136,-134,-128,-29,34,-100,-102,34,34,34,-109,-111,34,34,34,34,-124,-41,-8,-101,34,34,-110,34,34,34,-123,-127,-135,-103,-112,-122,]),'WHILE':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[35,35,35,35,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,35,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,35,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,35,35,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,35,-107,35,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,35,-108,35,35,-134,-128,-29,35,-100,-102,35,35,35,-109,-111,35,35,35,35,-124,-41,-8,-101,35,35,-110,35,35,35,-123,-127,-135,-103,-112,-122,]),'LET':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[36,36,36,36,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,36,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,36,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,36,36,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,36,-107,36,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,36,-108,36,36,-134,-128,-29,36,-100,-102,36,36,36,-109,-111,36,36,36,36,-124,-41,-8,-101,36,36,-110,36,36,36,-123,-127,-135,-103,-112,-122,]),'CATCH':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[37,37,37,37,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,37,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,37,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,37,37,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,37,-107,37,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,37,-108,37,37,-134,-128,-29,37,-100,-102,37,37,37,-109,-111,37,37,37,37,-124,-41,-8,-101,37,37,-110,37,37,37,-123,-127,-135,-103,-112,-122,]),'IF':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[38,38,38,38,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,38,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,38,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,38,38,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,38,-107,38,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,38,-108,38,38,-134,-128,-29,38,-100,-102,38,38,38,-109,-111,38,38,38,38,-124,-41,-8,-101,38,38,-110,38,38,38,-123,-127,-135,-103,-112,-122,]),'STAR_IF':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[39,39,39,39,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,39,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,39,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,39,39,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,39,-107,39,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,39,-108,39,39,-134,-128,-29,39,-100,-102,39,39,39,-109,-111,39,39,39,39,-124,-41,-8,-101,39,39,-110,39,39,39,-123,-127,-135,-103,-112,-122,]),'STAR_FOR':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[40,40,40,40,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,40,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,40,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,40,40,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,40,-107,40,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,40,-108,40,40,-134,-128,-29,40,-100,-102,40,40,40,-109,-111,40,40,40,40,-124,-41,-8,-101,40,40,-110,40,40,40,-123,-127,-135,-103,-112,-122,]),'RAISE':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[41,41,41,41,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,41,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,41,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,41,41,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,41,-107,41,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,41,-108,41,41,-134,-128,-29,41,-100,-102,41,41,41,-109,-111,41,41,41,41,-124,-41,-8,-101,41,41,-110,41,41,41,-123,-127,-135,-103,-112,-122,]),'RETURN':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[42,42,42,42,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,42,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,42,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,42,42,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,42,-107,42,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,42,-108,42,42,-134,-128,-29,42,-100,-102,42,42,42,-109,-111,42,42,42,42,-124,-41,-8,-101,42,42,-110,42,42,42,-123,-127,-135,-103,-112,-122,]),'STAR_SET':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[43,43,43,43,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,43,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,43,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,43,43,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,43,-107,43,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,43,-108,43,43,-134,-128,-29,43,-100,-102,43,43,43,-109,-111,43,43,43,43,-124,-41,-8,-101,43,43,-110,43,43,43,-123,-127,-135,-103,-112,-122,]),'ASN':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[44,44,44,44,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,44,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,44,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,44,44,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,44,-107,44,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,44,-108,44,44,-134,-128,-29,44,-100,-102,44,44,44,-109,-111,44,44,44,44,-124,-41,-8,-101,44,44,-110,44,44,44,-123,-127,-135,-103,-112,-122,]),'DEF':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[45,45,45,45,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,45,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,45,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,45,45,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,45,-107,45,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,45,-108,45,45,-134,-128,-29,45,-100,-102,45,45,45,-109,-111,45,45,45,45,-124,-41,-8,-101,45,45,-110,45,45,45,-123,-127,-135,-103,-112,-122,]),'FROM':([4,5,6,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,104,105,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,153,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,200,206,208,212,213,214,215,216,218,219,220,221,222,224,225,226,227,228,229,233,234,235,236,237,238,239,240,241,242,243,244,245,],[46,46,46,46,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,46,-132,-48,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,46,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,46,46,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,46,-107,46,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,46,-108,46,46,-134,-128,-29,46,-100,-102,46,46,46,-109,-111,46,46,46,46,-124,-41,-8,-101,46,46,-110,46,46,46,-123,-127,-135,-103,-112,-122,]),'END':([5,8,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,42,43,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,101,107,108,109,110,111,112,114,118,119,120,123,125,130,143,144,145,151,152,154,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,195,206,208,212,214,215,220,221,227,233,236,240,241,242,243,244,245,],[49,-57,-58,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,-132,-48,117,-54,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,-130,-131,-48,-117,-120,-1,-118,-53,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,-107,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,-108,-134,-128,-29,-100,-102,-109,-111,-124,-101,-110,-123,-127,-135,-103,-112,-122,]),'MAINEND':([6,8,9,10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,42,43,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,101,107,108,109,110,111,112,114,119,120,123,125,130,143,144,145,151,152,154,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,195,206,208,212,214,215,220,221,227,233,236,240,241,242,243,244,245,],[51,-57,-58,-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,-132,-48,118,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,-130,-131,-48,-117,-120,-1,-118,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,-107,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,-108,-134,-128,-29,-100,-102,-109,-111,-124,-101,-110,-123,-127,-135,-103,-112,-122,]),'RCURBRACKET':([10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,33,42,43,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,89,90,91,92,93,97,99,101,107,108,109,110,111,112,114,119,120,123,125,130,143,144,145,151,152,154,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,195,206,208,212,214,215,220,221,227,233,236,240,241,242,243,244,245,],[-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,-48,-132,-48,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,123,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,-130,-131,-48,-117,-120,-1,-118,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,-107,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,-108,-134,-128,-29,-100,-102,-109,-111,-124,-101,-110,-123,-127,-135,-103,-112,-122,]),'ENDIF':([10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,42,43,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,101,104,107,108,109,110,111,112,114,119,120,123,125,130,143,144,145,151,152,153,154,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,191,192,193,195,206,208,212,213,214,215,216,217,218,220,221,227,233,234,235,236,240,241,242,243,244,245,],[-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,-132,-48,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,152,-130,-131,-48,-117,-120,-1,-118,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,190,-107,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,214,215,-105,-108,-134,-128,-29,233,-100,-102,-48,-106,-48,-109,-111,-124,-101,243,-104,-110,-123,-127,-135,-103,-112,-122,]),'ELSE':([10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,42,43,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,101,104,107,108,109,110,111,112,114,119,120,123,125,130,143,144,145,151,152,153,154,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,192,193,195,206,208,212,214,215,217,218,220,221,227,233,235,236,240,241,242,243,244,245,],[-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,-132,-48,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,-48,-130,-131,-48,-117,-120,-1,-118,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,191,-107,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,216,-105,-108,-134,-128,-29,-100,-102,-106,-48,-109,-111,-124,-101,-104,-110,-123,-127,-135,-103,-112,-122,]),'ELIF':([10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,42,43,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,101,104,107,108,109,110,111,112,114,119,120,123,125,130,143,144,145,151,152,153,154,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,192,193,195,206,208,212,214,215,217,218,220,221,227,233,235,236,240,241,242,243,244,245,],[-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,-132,-48,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,-48,-130,-131,-48,-117,-120,-1,-118,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,194,-107,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,194,-105,-108,-134,-128,-29,-100,-102,-106,-48,-109,-111,-124,-101,-104,-110,-123,-127,-135,-103,-112,-122,]),'STAR_ENDIF':([10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,42,43,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,101,105,107,108,109,110,111,112,114,119,120,123,125,130,143,144,145,151,152,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,195,196,197,198,206,208,212,214,215,219,220,221,222,223,224,227,233,236,237,238,240,241,242,243,244,245,],[-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,-132,-48,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,154,-130,-131,-48,-117,-120,-1,-118,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,-107,195,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,-108,220,221,-115,-134,-128,-29,-100,-102,236,-109,-111,-48,-114,-48,-124,-101,-110,244,-113,-123,-127,-135,-103,-112,-122,]),'STAR_ELSE':([10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,42,43,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,101,105,107,108,109,110,111,112,114,119,120,123,125,130,143,144,145,151,152,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,195,197,198,206,208,212,214,215,220,221,223,224,227,233,236,238,240,241,242,243,244,245,],[-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,-132,-48,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,-48,-130,-131,-48,-117,-120,-1,-118,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,-107,196,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,-108,222,-115,-134,-128,-29,-100,-102,-109,-111,-114,-48,-124,-101,-110,-113,-123,-127,-135,-103,-112,-122,]),'STAR_ELIF':([10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,42,43,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,101,105,107,108,109,110,111,112,114,119,120,123,125,130,143,144,145,151,152,154,155,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,195,197,198,206,208,212,214,215,220,221,223,224,227,233,236,238,240,241,242,243,244,245,],[-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,-132,-48,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,-48,-130,-131,-48,-117,-120,-1,-118,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,-107,199,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,-108,199,-115,-134,-128,-29,-100,-102,-109,-111,-114,-48,-124,-101,-110,-113,-123,-127,-135,-103,-112,-122,]),'STAR_ENDFOR':([10,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,30,42,43,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,101,107,108,109,110,111,112,114,119,120,123,125,130,143,144,145,151,152,154,163,164,165,166,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,188,189,190,195,200,206,208,212,214,215,220,221,225,226,227,228,229,233,236,239,240,241,242,243,244,245,],[-63,-64,-66,-65,-67,-71,-76,-72,-68,-69,-70,-73,-74,-75,-77,-78,-79,-132,-48,-59,-60,-61,-62,-81,-88,-80,-87,-82,-89,-83,-90,-84,-91,-85,-92,-86,-93,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,-130,-131,-48,-117,-120,-1,-118,-97,-45,-94,-31,-125,-27,-28,-14,-129,-98,-107,-116,-119,-2,-121,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-35,-3,-99,-108,227,-134,-128,-29,-100,-102,-109,-111,-48,240,-124,-41,-8,-101,-110,245,-123,-127,-135,-103,-112,-122,]),'COMMA':([13,15,16,17,18,19,20,55,70,71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,101,112,119,120,121,123,125,126,128,129,130,143,144,145,151,165,169,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,189,206,207,208,209,211,212,228,232,242,],[56,58,60,62,64,66,68,56,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,149,-1,-97,-45,-48,-94,-31,172,-46,-8,-125,-27,-28,-14,-129,-2,-95,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-3,-134,231,231,-48,-47,-29,62,-96,-135,]),'SEMICOLON':([13,15,16,17,18,19,20,55,70,71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,112,119,120,121,123,125,130,143,144,145,151,165,169,171,173,174,175,176,177,178,179,180,181,182,183,184,186,187,189,209,212,228,232,],[57,59,61,63,65,67,69,57,-48,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,-1,-97,-45,-48,-94,-31,-125,-27,-28,-14,-129,-2,-95,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-126,-3,-48,-29,63,-96,]),'NUM':([21,31,35,38,39,40,41,42,71,72,73,74,75,76,77,78,79,80,82,85,87,88,89,90,91,92,93,94,95,96,97,98,99,106,120,122,125,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,150,156,158,159,160,161,162,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,194,199,200,201,202,203,204,205,212,],[71,71,71,71,71,71,71,71,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,71,71,-38,-39,-40,-41,-42,-43,-44,71,71,71,-8,71,-13,71,-45,71,-31,71,71,71,71,71,71,71,71,71,71,71,71,-27,-28,-14,71,71,-137,71,71,-10,-9,71,71,-30,71,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,71,71,71,-14,-8,-13,-18,-136,-29,]),'IDREF':([21,31,35,38,39,40,41,42,71,72,73,74,75,76,77,78,79,80,82,85,87,88,89,90,91,92,93,94,95,96,97,98,99,106,120,122,125,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,150,156,158,159,160,161,162,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,194,199,200,201,202,203,204,205,212,],[72,72,72,72,72,72,72,72,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,72,72,-38,-39,-40,-41,-42,-43,-44,72,72,72,-8,72,-13,72,-45,72,-31,72,72,72,72,72,72,72,72,72,72,72,72,-27,-28,-14,72,72,-137,72,72,-10,-9,72,72,-30,72,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,72,72,72,-14,-8,-13,-18,-136,-29,]),'ALIASREF':([21,31,35,38,39,40,41,42,71,72,73,74,75,76,77,78,79,80,82,85,87,88,89,90,91,92,93,94,95,96,97,98,99,106,120,122,125,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,150,156,158,159,160,161,162,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,194,199,200,201,202,203,204,205,212,],[73,73,73,73,73,73,73,73,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,73,73,-38,-39,-40,-41,-42,-43,-44,73,73,73,-8,73,-13,73,-45,73,-31,73,73,73,73,73,73,73,73,73,73,73,73,-27,-28,-14,73,73,-137,73,73,-10,-9,73,73,-30,73,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,73,73,73,-14,-8,-13,-18,-136,-29,]),'OR':([21,31,35,38,39,40,41,42,71,72,73,74,75,76,77,78,79,80,82,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,104,105,106,107,108,120,122,125,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,150,156,158,159,160,161,162,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,189,194,199,200,201,202,203,204,205,211,212,218,224,225,228,229,],[76,76,76,76,76,76,76,76,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,76,76,142,-38,-39,-40,-41,-42,-43,-44,76,76,76,-8,76,-13,142,142,161,142,142,-45,76,-31,142,-8,76,76,76,76,76,76,76,76,76,76,76,76,-27,-28,-14,76,142,76,142,76,76,-10,-9,76,76,-30,76,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,142,76,76,76,-14,-8,-13,-18,142,142,-29,142,142,142,-41,-8,]),'AND':([21,31,35,38,39,40,41,42,71,72,73,74,75,76,77,78,79,80,82,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,104,105,106,107,108,120,122,125,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,150,156,158,159,160,161,162,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,189,194,199,200,201,202,203,204,205,211,212,218,224,225,228,229,],[77,77,77,77,77,77,77,77,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,77,77,141,-38,-39,-40,-41,-42,-43,-44,77,77,77,-8,77,-13,141,141,160,141,141,-45,77,-31,141,-8,77,77,77,77,77,77,77,77,77,77,77,77,-27,-28,-14,77,141,77,141,77,77,-10,-9,77,77,-30,77,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,141,77,77,77,-14,-8,-13,-18,141,141,-29,141,141,141,-41,-8,]),'LSTR':([21,31,35,38,39,40,41,42,71,72,73,74,75,76,77,78,79,80,81,82,85,87,88,89,90,91,92,93,94,95,96,97,98,99,106,120,122,125,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,150,156,158,159,160,161,162,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,194,199,200,201,202,203,204,205,212,],[78,78,78,78,78,78,78,78,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,120,78,78,-38,-39,-40,-41,-42,-43,-44,78,78,78,-8,78,-13,78,-45,78,-31,78,78,78,78,78,78,78,78,78,78,78,78,-27,-28,-14,78,78,-137,78,78,-10,-9,78,78,-30,78,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,78,78,78,-14,-8,-13,-18,-136,-29,]),'QSTR':([21,31,35,38,39,40,41,42,46,71,72,73,74,75,76,77,78,79,80,82,85,87,88,89,90,91,92,93,94,95,96,97,98,99,106,120,122,125,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,150,156,158,159,160,161,162,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,194,199,200,201,202,203,204,205,212,],[79,79,79,79,79,79,79,79,116,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,79,79,-38,-39,-40,-41,-42,-43,-44,79,79,79,-8,79,-13,79,-45,79,-31,79,79,79,79,79,79,79,79,79,79,79,79,-27,-28,-14,79,79,-137,79,79,-10,-9,79,79,-30,79,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,79,79,79,-14,-8,-13,-18,-136,-29,]),'GET_F_NO':([21,31,35,38,39,40,41,42,71,72,73,74,75,76,77,78,79,80,82,85,87,88,89,90,91,92,93,94,95,96,97,98,99,106,120,122,125,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,150,156,158,159,160,161,162,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,194,199,200,201,202,203,204,205,212,],[81,81,81,81,81,81,81,81,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,81,81,-38,-39,-40,-41,-42,-43,-44,81,81,81,-8,81,-13,81,-45,81,-31,81,81,81,81,81,81,81,81,81,81,81,81,-27,-28,-14,81,81,-137,81,81,-10,-9,81,81,-30,81,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,81,81,81,-14,-8,-13,-18,-136,-29,]),'ASSIGN':([32,102,129,229,],[83,150,150,83,]),'LPAREN':([34,35,38,39,40,41,42,71,72,73,74,75,76,77,78,79,80,85,87,88,89,90,91,92,93,94,95,97,98,99,106,115,120,125,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,150,156,158,159,160,161,162,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,194,199,200,201,202,203,204,205,212,229,],[85,98,98,98,98,98,98,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,98,-38,-39,-40,-41,-42,-43,-44,98,98,146,98,85,98,167,-45,-31,146,98,98,98,98,98,98,98,98,98,98,98,98,-27,-28,-14,98,98,-137,98,98,-10,-9,98,-30,98,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,98,98,98,-14,146,85,-18,-136,-29,146,]),'NOT':([35,38,39,40,41,42,71,72,73,74,75,76,77,78,79,80,85,87,88,89,90,91,92,93,94,95,97,98,99,106,120,125,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,150,156,158,159,160,161,162,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,194,199,200,201,202,203,204,205,212,],[94,94,94,94,94,94,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,94,-38,-39,-40,-41,-42,-43,-44,94,94,-8,94,-13,94,-45,-31,94,94,94,94,94,94,94,94,94,94,94,94,-27,-28,-14,94,94,-137,94,94,94,94,94,-30,94,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,94,94,94,-14,-8,-13,-18,-136,-29,]),'SUB':([35,38,39,40,41,42,43,71,72,73,74,75,76,77,78,79,80,85,86,87,88,89,90,91,92,93,94,95,97,98,99,104,105,106,107,108,109,111,120,125,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,150,156,158,159,160,161,162,164,166,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,189,194,199,200,201,202,203,204,205,211,212,218,224,225,228,229,],[95,95,95,95,95,95,113,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,95,134,-38,-39,-40,-41,-42,-43,-44,95,95,-8,95,-13,134,134,159,134,134,113,-120,-45,-31,134,-8,95,95,95,95,95,95,95,95,95,95,95,95,134,-28,-14,95,134,95,134,95,95,95,95,95,-119,-121,-30,95,-15,-16,-17,-18,134,134,134,134,134,134,134,134,-37,134,95,95,95,-14,-8,-13,-18,134,134,-29,134,134,134,-41,-8,]),'ADD':([35,38,39,40,41,42,71,72,73,74,75,76,77,78,79,80,85,86,87,88,89,90,91,92,93,94,95,97,98,99,104,105,106,107,108,120,125,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,150,156,158,159,160,161,162,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,189,194,199,200,201,202,203,204,205,211,212,218,224,225,228,229,],[96,96,96,96,96,96,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,96,133,-38,-39,-40,-41,-42,-43,-44,96,96,-8,96,-13,133,133,158,133,133,-45,-31,133,-8,96,96,96,96,96,96,96,96,96,96,96,96,133,-28,-14,96,133,96,133,96,96,96,96,96,-30,96,-15,-16,-17,-18,133,133,133,133,133,133,133,133,-37,133,96,96,96,-14,-8,-13,-18,133,133,-29,133,133,133,-41,-8,]),'MUL':([71,72,73,74,75,76,77,78,79,80,86,87,88,89,90,91,92,93,97,99,104,105,106,107,108,120,125,128,129,143,144,145,147,156,160,161,171,173,174,175,176,177,178,179,180,181,182,183,184,186,189,201,202,203,204,205,211,212,218,224,225,228,229,],[-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,131,-38,-39,-40,-41,-42,-43,-44,-8,-13,131,131,131,131,131,-45,-31,131,-8,131,-28,-14,131,131,-10,-9,-30,-15,-16,131,131,131,131,131,131,131,131,131,131,-37,131,-14,-8,-13,131,131,131,-29,131,131,131,-41,-8,]),'DIV':([71,72,73,74,75,76,77,78,79,80,86,87,88,89,90,91,92,93,97,99,104,105,106,107,108,120,125,128,129,143,144,145,147,156,160,161,171,173,174,175,176,177,178,179,180,181,182,183,184,186,189,201,202,203,204,205,211,212,218,224,225,228,229,],[-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,132,-38,-39,-40,-41,-42,-43,-44,-8,-13,132,132,132,132,132,-45,-31,132,-8,132,-28,-14,132,132,-10,-9,-30,-15,-16,132,132,132,132,132,132,132,132,132,132,-37,132,-14,-8,-13,132,132,132,-29,132,132,132,-41,-8,]),'LT':([71,72,73,74,75,76,77,78,79,80,86,87,88,89,90,91,92,93,97,99,104,105,106,107,108,120,125,128,129,143,144,145,147,156,160,161,171,173,174,175,176,177,178,179,180,181,182,183,184,186,189,201,202,203,204,205,211,212,218,224,225,228,229,],[-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,135,-38,-39,-40,-41,-42,-43,-44,-8,-13,135,135,135,135,135,-45,-31,135,-8,135,-28,-14,135,135,-10,-9,-30,-15,-16,-17,-18,None,None,None,None,None,None,135,135,-37,135,-14,-8,-13,-18,135,135,-29,135,135,135,-41,-8,]),'GT':([71,72,73,74,75,76,77,78,79,80,86,87,88,89,90,91,92,93,97,99,104,105,106,107,108,120,125,128,129,143,144,145,147,156,160,161,171,173,174,175,176,177,178,179,180,181,182,183,184,186,189,201,202,203,204,205,211,212,218,224,225,228,229,],[-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,136,-38,-39,-40,-41,-42,-43,-44,-8,-13,136,136,136,136,136,-45,-31,136,-8,136,-28,-14,136,136,-10,-9,-30,-15,-16,-17,-18,None,None,None,None,None,None,136,136,-37,136,-14,-8,-13,-18,136,136,-29,136,136,136,-41,-8,]),'LE':([71,72,73,74,75,76,77,78,79,80,86,87,88,89,90,91,92,93,97,99,104,105,106,107,108,120,125,128,129,143,144,145,147,156,160,161,171,173,174,175,176,177,178,179,180,181,182,183,184,186,189,201,202,203,204,205,211,212,218,224,225,228,229,],[-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,137,-38,-39,-40,-41,-42,-43,-44,-8,-13,137,137,137,137,137,-45,-31,137,-8,137,-28,-14,137,137,-10,-9,-30,-15,-16,-17,-18,None,None,None,None,None,None,137,137,-37,137,-14,-8,-13,-18,137,137,-29,137,137,137,-41,-8,]),'GE':([71,72,73,74,75,76,77,78,79,80,86,87,88,89,90,91,92,93,97,99,104,105,106,107,108,120,125,128,129,143,144,145,147,156,160,161,171,173,174,175,176,177,178,179,180,181,182,183,184,186,189,201,202,203,204,205,211,212,218,224,225,228,229,],[-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,138,-38,-39,-40,-41,-42,-43,-44,-8,-13,138,138,138,138,138,-45,-31,138,-8,138,-28,-14,138,138,-10,-9,-30,-15,-16,-17,-18,None,None,None,None,None,None,138,138,-37,138,-14,-8,-13,-18,138,138,-29,138,138,138,-41,-8,]),'EQ':([71,72,73,74,75,76,77,78,79,80,86,87,88,89,90,91,92,93,97,99,104,105,106,107,108,120,125,128,129,143,144,145,147,156,160,161,171,173,174,175,176,177,178,179,180,181,182,183,184,186,189,201,202,203,204,205,211,212,218,224,225,228,229,],[-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,139,-38,-39,-40,-41,-42,-43,-44,-8,-13,139,139,139,139,139,-45,-31,139,-8,139,-28,-14,139,139,-10,-9,-30,-15,-16,-17,-18,None,None,None,None,None,None,139,139,-37,139,-14,-8,-13,-18,139,139,-29,139,139,139,-41,-8,]),'NE':([71,72,73,74,75,76,77,78,79,80,86,87,88,89,90,91,92,93,97,99,104,105,106,107,108,120,125,128,129,143,144,145,147,156,160,161,171,173,174,175,176,177,178,179,180,181,182,183,184,186,189,201,202,203,204,205,211,212,218,224,225,228,229,],[-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,140,-38,-39,-40,-41,-42,-43,-44,-8,-13,140,140,140,140,140,-45,-31,140,-8,140,-28,-14,140,140,-10,-9,-30,-15,-16,-17,-18,None,None,None,None,None,None,140,140,-37,140,-14,-8,-13,-18,140,140,-29,140,140,140,-41,-8,]),'RPAREN':([71,72,73,74,75,76,77,78,79,80,85,87,88,89,90,91,92,93,97,99,101,120,124,125,126,127,128,129,143,144,145,147,171,173,174,175,176,177,178,179,180,181,182,183,184,185,186,188,189,206,207,210,211,212,242,],[-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,125,-38,-39,-40,-41,-42,-43,-44,-8,-13,-36,-45,171,-31,-33,-34,-46,-8,-27,-28,-14,186,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,212,-37,-35,-3,-134,230,-32,-47,-29,-135,]),'IN':([71,72,73,74,75,76,77,78,79,80,87,88,89,90,91,92,93,97,99,100,101,120,125,143,144,145,156,157,160,161,162,171,173,174,175,176,177,178,179,180,181,182,183,184,186,188,189,201,202,203,204,205,212,],[-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-38,-39,-40,-41,-42,-43,-44,-8,-13,148,-36,-45,-31,-27,-28,-14,-137,200,-10,-9,-133,-30,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-37,-35,-3,-14,-8,-13,-28,-136,-29,]),'IMPORT':([116,],[168,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'command_section':([0,],[2,]),'preamble':([0,],[3,]),'mainpart':([3,],[5,]),'statements':([4,5,6,],[7,48,50,]),'statement':([4,5,6,],[8,8,8,]),'command_list':([4,5,6,33,104,105,191,196,200,216,218,222,224,225,],[9,9,9,84,153,155,213,219,226,234,235,237,238,239,]),'async':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[10,10,10,52,10,52,10,10,52,52,10,10,10,52,10,10,52,10,10,10,52,52,52,52,52,52,]),'sync':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[11,11,11,53,11,53,11,11,53,53,11,11,11,53,11,11,53,11,11,11,53,53,53,53,53,53,]),'special_form':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[12,12,12,54,12,54,12,12,54,54,12,12,12,54,12,12,54,12,12,12,54,54,54,54,54,54,]),'abs_command':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[13,13,13,55,13,55,13,13,55,55,13,13,13,55,13,13,55,13,13,13,55,55,55,55,55,55,]),'empty':([4,5,6,33,43,70,104,105,109,121,191,196,200,209,216,218,222,224,225,],[14,14,14,14,112,112,14,14,112,112,14,14,14,112,14,14,14,14,14,]),'exec_command':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'command_block':([4,5,6,9,33,84,86,103,104,105,148,153,155,191,196,200,213,216,218,219,222,224,225,226,230,234,235,237,238,239,],[16,16,16,16,16,16,130,151,16,16,187,16,16,16,16,16,16,16,16,16,16,16,16,16,241,16,16,16,16,16,]),'proc_call':([4,5,6,9,33,35,38,39,40,41,42,84,85,94,95,98,104,105,106,131,132,133,134,135,136,137,138,139,140,141,142,146,150,153,155,158,159,160,161,162,172,191,194,196,199,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[17,17,17,17,17,90,90,90,90,90,90,17,90,90,90,90,17,17,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,17,17,90,90,90,90,90,90,17,90,17,90,228,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'while_loop':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'let_stmnt':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'catch':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'if_list':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'star_if_list':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'star_for_loop':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'raise':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'return':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'star_set_stmnt':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'set_stmnt':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'proc_defn':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'import_stmnt':([4,5,6,9,33,84,104,105,153,155,191,196,200,213,216,218,219,222,224,225,226,234,235,237,238,239,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'endpart':([5,],[47,]),'factor':([21,31,35,38,39,40,41,42,82,85,94,95,96,98,106,122,131,132,133,134,135,136,137,138,139,140,141,142,146,150,158,159,160,161,162,170,172,194,199,200,],[70,82,92,92,92,92,92,92,121,92,92,92,145,92,92,170,92,92,92,92,92,92,92,92,92,92,92,92,92,92,201,92,92,92,92,209,92,92,92,92,]),'frame_id_ref':([21,31,35,38,39,40,41,42,82,85,94,95,96,98,106,122,131,132,133,134,135,136,137,138,139,140,141,142,146,150,158,159,160,161,162,170,172,194,199,200,],[74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'expression':([35,38,39,40,41,42,85,94,95,98,106,131,132,133,134,135,136,137,138,139,140,141,142,146,150,158,159,160,161,162,172,194,199,200,],[86,104,105,106,107,108,128,143,144,147,156,173,174,175,176,177,178,179,180,181,182,183,184,128,189,175,204,183,184,205,211,218,224,225,]),'monad':([35,38,39,40,41,42,85,94,95,98,106,131,132,133,134,135,136,137,138,139,140,141,142,146,150,158,159,160,161,162,172,194,199,200,],[87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,]),'dyad':([35,38,39,40,41,42,85,94,95,98,106,131,132,133,134,135,136,137,138,139,140,141,142,146,150,158,159,160,161,162,172,194,199,200,],[88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,]),'func_call':([35,38,39,40,41,42,85,94,95,98,106,131,132,133,134,135,136,137,138,139,140,141,142,146,150,158,159,160,161,162,172,194,199,200,],[89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,]),'asnum':([35,38,39,40,41,42,85,94,95,98,106,131,132,133,134,135,136,137,138,139,140,141,142,146,150,158,159,160,161,162,172,194,199,200,],[91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,]),'factor2':([35,38,39,40,41,42,85,94,95,98,106,131,132,133,134,135,136,137,138,139,140,141,142,146,150,158,159,160,161,162,172,194,199,200,],[93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,]),'kwd_params':([36,44,85,146,149,172,],[100,114,127,127,188,210,]),'key_value_pair':([36,44,85,110,119,146,149,163,169,172,232,],[101,101,101,165,165,101,101,165,165,101,165,]),'set_flags':([43,],[109,]),'param_list':([43,70,109,121,209,],[110,119,163,169,232,]),'set_flag':([43,109,],[111,164,]),'arg_list':([85,146,],[124,185,]),'expression_list':([85,146,],[126,126,]),'idlist':([106,],[157,]),'expressions':([106,],[162,]),'elif_list':([153,],[192,]),'elif':([153,192,],[193,217,]),'star_elif_list':([155,],[197,]),'star_elif':([155,197,],[198,223,]),'varlist':([167,168,],[207,208,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('param_list -> empty','param_list',1,'p_param_list1','param_parser.py',61),
+  ('param_list -> param_list key_value_pair','param_list',2,'p_param_list2','param_parser.py',65),
+  ('key_value_pair -> ID ASSIGN expression','key_value_pair',3,'p_key_value_pair','param_parser.py',70),
+  ('factor -> NUM','factor',1,'p_factor1','param_parser.py',75),
+  ('factor -> IDREF','factor',1,'p_factor2','param_parser.py',82),
+  ('factor -> ALIASREF','factor',1,'p_factor3','param_parser.py',86),
+  ('factor -> frame_id_ref','factor',1,'p_factor4','param_parser.py',90),
+  ('factor -> ID','factor',1,'p_factor6','param_parser.py',97),
+  ('factor -> OR','factor',1,'p_factor6','param_parser.py',98),
+  ('factor -> AND','factor',1,'p_factor6','param_parser.py',99),
+  ('factor -> LSTR','factor',1,'p_factor7','param_parser.py',104),
+  ('factor -> QSTR','factor',1,'p_factor8','param_parser.py',109),
+  ('factor -> REGREF','factor',1,'p_factor9','param_parser.py',113),
+  ('factor2 -> ADD factor','factor2',2,'p_factor_2_2','param_parser.py',121),
+  ('dyad -> expression MUL expression','dyad',3,'p_dyad1','param_parser.py',129),
+  ('dyad -> expression DIV expression','dyad',3,'p_dyad1','param_parser.py',130),
+  ('dyad -> expression ADD expression','dyad',3,'p_dyad1','param_parser.py',131),
+  ('dyad -> expression SUB expression','dyad',3,'p_dyad1','param_parser.py',132),
+  ('dyad -> expression LT expression','dyad',3,'p_dyad1','param_parser.py',133),
+  ('dyad -> expression GT expression','dyad',3,'p_dyad1','param_parser.py',134),
+  ('dyad -> expression LE expression','dyad',3,'p_dyad1','param_parser.py',135),
+  ('dyad -> expression GE expression','dyad',3,'p_dyad1','param_parser.py',136),
+  ('dyad -> expression EQ expression','dyad',3,'p_dyad1','param_parser.py',137),
+  ('dyad -> expression NE expression','dyad',3,'p_dyad1','param_parser.py',138),
+  ('dyad -> expression AND expression','dyad',3,'p_dyad1','param_parser.py',139),
+  ('dyad -> expression OR expression','dyad',3,'p_dyad1','param_parser.py',140),
+  ('monad -> NOT expression','monad',2,'p_monad1','param_parser.py',145),
+  ('monad -> SUB expression','monad',2,'p_monad1','param_parser.py',146),
+  ('func_call -> ID LPAREN arg_list RPAREN','func_call',4,'p_func_call','param_parser.py',151),
+  ('proc_call -> REGREF LPAREN arg_list RPAREN','proc_call',4,'p_proc_call','param_parser.py',155),
+  ('proc_call -> REGREF LPAREN RPAREN','proc_call',3,'p_proc_call2','param_parser.py',159),
+  ('arg_list -> expression_list COMMA kwd_params','arg_list',3,'p_arg_list1','param_parser.py',163),
+  ('arg_list -> expression_list','arg_list',1,'p_arg_list2','param_parser.py',170),
+  ('arg_list -> kwd_params','arg_list',1,'p_arg_list3','param_parser.py',175),
+  ('kwd_params -> key_value_pair COMMA kwd_params','kwd_params',3,'p_kwd_params1','param_parser.py',180),
+  ('kwd_params -> key_value_pair','kwd_params',1,'p_kwd_params2','param_parser.py',185),
+  ('asnum -> LPAREN expression RPAREN','asnum',3,'p_asnum1','param_parser.py',198),
+  ('expression -> monad','expression',1,'p_expression1','param_parser.py',202),
+  ('expression -> dyad','expression',1,'p_expression1','param_parser.py',203),
+  ('expression -> func_call','expression',1,'p_expression1','param_parser.py',204),
+  ('expression -> proc_call','expression',1,'p_expression1','param_parser.py',205),
+  ('expression -> asnum','expression',1,'p_expression1','param_parser.py',206),
+  ('expression -> factor','expression',1,'p_expression1','param_parser.py',207),
+  ('expression -> factor2','expression',1,'p_expression1','param_parser.py',208),
+  ('frame_id_ref -> GET_F_NO LSTR','frame_id_ref',2,'p_frame_id_acquisition','param_parser.py',212),
+  ('expression_list -> expression','expression_list',1,'p_expression_list1','param_parser.py',216),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list2','param_parser.py',220),
+  ('empty -> <empty>','empty',0,'p_epslion','param_parser.py',225),
+  ('program -> command_section','program',1,'p_program1','sk_parser.py',251),
+  ('command_section -> preamble mainpart endpart','command_section',3,'p_command_section','sk_parser.py',255),
+  ('preamble -> START statements','preamble',2,'p_preamble1','sk_parser.py',259),
+  ('preamble -> START','preamble',1,'p_preamble2','sk_parser.py',263),
+  ('mainpart -> MAINSTART statements MAINEND','mainpart',3,'p_mainpart1','sk_parser.py',267),
+  ('mainpart -> MAINSTART MAINEND','mainpart',2,'p_mainpart2','sk_parser.py',271),
+  ('endpart -> statements END','endpart',2,'p_endpart1','sk_parser.py',275),
+  ('endpart -> END','endpart',1,'p_endpart2','sk_parser.py',279),
+  ('statements -> statement','statements',1,'p_statements','sk_parser.py',283),
+  ('statement -> command_list','statement',1,'p_statement','sk_parser.py',292),
+  ('command_list -> command_list async','command_list',2,'p_command_list1','sk_parser.py',296),
+  ('command_list -> command_list sync','command_list',2,'p_command_list1','sk_parser.py',297),
+  ('command_list -> command_list special_form','command_list',2,'p_command_list2','sk_parser.py',303),
+  ('command_list -> command_list abs_command','command_list',2,'p_command_list2','sk_parser.py',304),
+  ('command_list -> async','command_list',1,'p_command_list3','sk_parser.py',310),
+  ('command_list -> sync','command_list',1,'p_command_list3','sk_parser.py',311),
+  ('command_list -> abs_command','command_list',1,'p_command_list3','sk_parser.py',312),
+  ('command_list -> special_form','command_list',1,'p_command_list3','sk_parser.py',313),
+  ('command_list -> empty','command_list',1,'p_command_list4','sk_parser.py',318),
+  ('special_form -> if_list','special_form',1,'p_special_form','sk_parser.py',324),
+  ('special_form -> star_if_list','special_form',1,'p_special_form','sk_parser.py',325),
+  ('special_form -> star_for_loop','special_form',1,'p_special_form','sk_parser.py',326),
+  ('special_form -> while_loop','special_form',1,'p_special_form','sk_parser.py',327),
+  ('special_form -> catch','special_form',1,'p_special_form','sk_parser.py',328),
+  ('special_form -> raise','special_form',1,'p_special_form','sk_parser.py',329),
+  ('special_form -> return','special_form',1,'p_special_form','sk_parser.py',330),
+  ('special_form -> star_set_stmnt','special_form',1,'p_special_form','sk_parser.py',331),
+  ('special_form -> let_stmnt','special_form',1,'p_special_form','sk_parser.py',332),
+  ('special_form -> set_stmnt','special_form',1,'p_special_form','sk_parser.py',333),
+  ('special_form -> proc_defn','special_form',1,'p_special_form','sk_parser.py',334),
+  ('special_form -> import_stmnt','special_form',1,'p_special_form','sk_parser.py',335),
+  ('async -> exec_command COMMA','async',2,'p_async','sk_parser.py',340),
+  ('async -> abs_command COMMA','async',2,'p_async','sk_parser.py',341),
+  ('async -> command_block COMMA','async',2,'p_async','sk_parser.py',342),
+  ('async -> proc_call COMMA','async',2,'p_async','sk_parser.py',343),
+  ('async -> while_loop COMMA','async',2,'p_async','sk_parser.py',344),
+  ('async -> let_stmnt COMMA','async',2,'p_async','sk_parser.py',345),
+  ('async -> catch COMMA','async',2,'p_async','sk_parser.py',346),
+  ('sync -> exec_command SEMICOLON','sync',2,'p_sync','sk_parser.py',351),
+  ('sync -> abs_command SEMICOLON','sync',2,'p_sync','sk_parser.py',352),
+  ('sync -> command_block SEMICOLON','sync',2,'p_sync','sk_parser.py',353),
+  ('sync -> proc_call SEMICOLON','sync',2,'p_sync','sk_parser.py',354),
+  ('sync -> while_loop SEMICOLON','sync',2,'p_sync','sk_parser.py',355),
+  ('sync -> let_stmnt SEMICOLON','sync',2,'p_sync','sk_parser.py',356),
+  ('sync -> catch SEMICOLON','sync',2,'p_sync','sk_parser.py',357),
+  ('command_block -> LCURBRACKET command_list RCURBRACKET','command_block',3,'p_command_block','sk_parser.py',362),
+  ('exec_command -> EXEC factor factor param_list','exec_command',4,'p_command_exec','sk_parser.py',368),
+  ('exec_command -> ID ASSIGN EXEC factor factor param_list','exec_command',6,'p_command_exec1','sk_parser.py',372),
+  ('abs_command -> STAR_SUB factor param_list','abs_command',3,'p_command_abs','sk_parser.py',376),
+  ('if_list -> IF expression ENDIF','if_list',3,'p_if_list1_0','sk_parser.py',381),
+  ('if_list -> IF expression command_list ENDIF','if_list',4,'p_if_list1_1','sk_parser.py',386),
+  ('if_list -> IF expression command_list ELSE ENDIF','if_list',5,'p_if_list1_1_1','sk_parser.py',390),
+  ('if_list -> IF expression command_list ELSE command_list ENDIF','if_list',6,'p_if_list1_2','sk_parser.py',395),
+  ('if_list -> IF expression command_list elif_list ENDIF','if_list',5,'p_if_list1_3','sk_parser.py',400),
+  ('if_list -> IF expression command_list elif_list ELSE command_list ENDIF','if_list',7,'p_if_list1_4','sk_parser.py',407),
+  ('elif -> ELIF expression command_list','elif',3,'p_elif','sk_parser.py',414),
+  ('elif_list -> elif','elif_list',1,'p_elif_list','sk_parser.py',418),
+  ('elif_list -> elif_list elif','elif_list',2,'p_elif_list2','sk_parser.py',422),
+  ('star_if_list -> STAR_IF expression STAR_ENDIF','star_if_list',3,'p_star_if_list1_1','sk_parser.py',428),
+  ('star_if_list -> STAR_IF expression command_list STAR_ENDIF','star_if_list',4,'p_star_if_list1_2','sk_parser.py',433),
+  ('star_if_list -> STAR_IF expression command_list STAR_ELSE STAR_ENDIF','star_if_list',5,'p_star_if_list2_1','sk_parser.py',437),
+  ('star_if_list -> STAR_IF expression command_list STAR_ELSE command_list STAR_ENDIF','star_if_list',6,'p_star_if_list2_2','sk_parser.py',442),
+  ('star_if_list -> STAR_IF expression command_list star_elif_list STAR_ENDIF','star_if_list',5,'p_star_if_list3_1','sk_parser.py',447),
+  ('star_if_list -> STAR_IF expression command_list star_elif_list STAR_ELSE command_list STAR_ENDIF','star_if_list',7,'p_star_if_list3_2','sk_parser.py',454),
+  ('star_elif -> STAR_ELIF expression command_list','star_elif',3,'p_star_elif','sk_parser.py',461),
+  ('star_elif_list -> star_elif_list star_elif','star_elif_list',2,'p_star_elif_list','sk_parser.py',465),
+  ('star_elif_list -> star_elif','star_elif_list',1,'p_star_elif_list2','sk_parser.py',470),
+  ('star_set_stmnt -> STAR_SET set_flags param_list','star_set_stmnt',3,'p_star_set_stmnt1','sk_parser.py',474),
+  ('star_set_stmnt -> STAR_SET param_list','star_set_stmnt',2,'p_star_set_stmnt2','sk_parser.py',478),
+  ('set_stmnt -> ASN kwd_params','set_stmnt',2,'p_set_stmnt','sk_parser.py',482),
+  ('set_flags -> set_flags set_flag','set_flags',2,'p_set_flags1','sk_parser.py',486),
+  ('set_flags -> set_flag','set_flags',1,'p_set_flags2','sk_parser.py',491),
+  ('set_flag -> SUB ID','set_flag',2,'p_set_flag','sk_parser.py',495),
+  ('star_for_loop -> STAR_FOR expression idlist IN expression command_list STAR_ENDFOR','star_for_loop',7,'p_star_for_loop1','sk_parser.py',499),
+  ('star_for_loop -> STAR_FOR expression idlist IN command_list STAR_ENDFOR','star_for_loop',6,'p_star_for_loop2','sk_parser.py',503),
+  ('star_for_loop -> STAR_FOR expression idlist IN STAR_ENDFOR','star_for_loop',5,'p_star_for_loop3','sk_parser.py',507),
+  ('while_loop -> WHILE expression command_block','while_loop',3,'p_while_loop1','sk_parser.py',512),
+  ('let_stmnt -> LET kwd_params IN command_block','let_stmnt',4,'p_let','sk_parser.py',516),
+  ('proc_defn -> DEF ID LPAREN varlist RPAREN command_block','proc_defn',6,'p_proc_defn1','sk_parser.py',520),
+  ('import_stmnt -> FROM QSTR IMPORT varlist','import_stmnt',4,'p_import','sk_parser.py',524),
+  ('catch -> CATCH ID command_block','catch',3,'p_catch1','sk_parser.py',528),
+  ('raise -> RAISE expression','raise',2,'p_raise','sk_parser.py',532),
+  ('return -> RETURN expression','return',2,'p_return','sk_parser.py',536),
+  ('return -> RETURN','return',1,'p_return2','sk_parser.py',540),
+  ('idlist -> expressions','idlist',1,'p_idlist1','sk_parser.py',544),
+  ('varlist -> ID','varlist',1,'p_varlist1','sk_parser.py',548),
+  ('varlist -> varlist COMMA ID','varlist',3,'p_varlist2','sk_parser.py',552),
+  ('expressions -> expressions expression','expressions',2,'p_expressions','sk_parser.py',557),
+  ('expressions -> expression','expressions',1,'p_expressions2','sk_parser.py',562),
+]
@@ -2,12 +2,14 @@
 sk_parser.py -- oscript ("skeleton") file parser
 """
 import sys
+import re
+import bisect
 import logging
 
 import ply.yacc as yacc
 from ply.lex import LexToken
 
-from oscript.parse import sk_common
+from oscript.parse import sk_common, sk_lexer
 from oscript.parse.sk_common import ASTNode
 from oscript.parse.param_parser import paramParser, skParseError
 from oscript.parse.ope import get_sections
@@ -21,6 +23,18 @@ from g2base import Bunch
 ##################################################################
 
 
+# Tokens of flat OPE command lines (see opeParser.parse_flat): words,
+# strings without escapes and ASSIGN.  Anything else is left to the
+# grammar.
+flat_token_re = re.compile(r"""[ \t]*(?:
+  (?P<word>[A-Za-z0-9][A-Za-z0-9_\.\:]*)
+ |"(?P<qstr>[^"\\\n]*)"
+ |'(?P<sqstr>[^'\\\n]*)'
+ |\[(?P<lstr>[^\]\n]*)\]
+ |(?P<assign>=)(?!=)
+)[ \t]*""", re.VERBOSE)
+
+
 class opeParser(paramParser):
 
     def __init__(self, lexer, logger=None,
@@ -31,6 +45,9 @@ class opeParser(paramParser):
         self.tokens.remove('UMINUS')
         self.tokens.extend(['EXEC'])
 
+        # If True, flat command lines are parsed without the grammar
+        self.fast_path = True
+
     # --- .OPE file commands ---
 
     def p_opecmd(self, p):
@@ -53,11 +70,97 @@ class opeParser(paramParser):
                                 tabmodule=self._parsetab,
                                 errorlog=self.logger)
 
+    def _flat_factor(self, kind, value):
+        if kind == 'word':
+            if sk_lexer.num_re.match(value):
+                if value.find('.') < 0:
+                    return ASTNode('number', int(value))
+                return ASTNode('number', float(value))
+            value = value.upper()
+            # OR and AND may be used as strings, see p_factor6
+            if ((value in sk_lexer.skScanner.reserved_map) and
+                (value not in ('OR', 'AND'))):
+                return None
+            return ASTNode('string', value)
+
+        elif kind in ('qstr', 'sqstr'):
+            return ASTNode('qstring', value)
+
+        elif kind == 'lstr':
+            return ASTNode('lstring', value)
+
+        return None
+
+    def parse_flat(self, buf):
+        """Parses the common flat forms of OPE command lines:
+
+            EXEC <subsys> <cmd> KEY=VALUE ...
+            <abscmd> KEY=VALUE ...
+
+        where the command words and values are single words, numbers or
+        strings.  Returns the same AST as the grammar does, or None if
+        (buf) is not of these forms, in which case it must be parsed with
+        the grammar.  Nodes are created in the order the grammar reduces
+        them, so that their serial numbers are in the same order.
+        """
+        toks = []
+        pos = 0
+        for match in flat_token_re.finditer(buf):
+            if match.start() != pos:
+                return None
+            pos = match.end()
+            toks.append((match.lastgroup, match.group(match.lastgroup)))
+        if (pos != len(buf)) or (len(toks) == 0):
+            return None
+
+        if (toks[0][0] == 'word') and (toks[0][1].upper() == 'EXEC'):
+            ncmd = 2
+            i = 1
+        else:
+            ncmd = 1
+            i = 0
+        if len(toks) < i + ncmd:
+            return None
+
+        cmd = []
+        for kind, value in toks[i:i+ncmd]:
+            factor = self._flat_factor(kind, value)
+            if factor is None:
+                return None
+            cmd.append(factor)
+        i += ncmd
+
+        params = ASTNode('param_list')
+        if (len(toks) - i) % 3 != 0:
+            return None
+        while i < len(toks):
+            (kind, key) = toks[i]
+            if ((kind != 'word') or (toks[i+1][0] != 'assign') or
+                sk_lexer.num_re.match(key) or
+                (key.upper() in sk_lexer.skScanner.reserved_map)):
+                return None
+            value = self._flat_factor(*toks[i+2])
+            if value is None:
+                return None
+            params.append(ASTNode('key_value_pair', key.lower(), value))
+            i += 3
+
+        if ncmd == 2:
+            ast = ASTNode('exec', cmd[0], cmd[1], params, None)
+        else:
+            ast = ASTNode('abscmd', cmd[0], params)
+        return ASTNode('cmdlist', ast)
+
     def parse_opecmd(self, buf, startline=1):
 
         # Initialize module level error variables
         self.reset(lineno=startline)
 
+        if self.fast_path:
+            ast = self.parse_flat(buf)
+            if ast is not None:
+                return (self.errors, ast, self.errinfo)
+
         try:
             ast = self.parser.parse(buf, lexer=self.lexer)
 
@@ -129,8 +232,39 @@ class opeParser(paramParser):
         return res
 
 
+# Statements that may end with a list of parameters or an optional
+# expression, which the tokens of a following statement could continue
+open_ended_tags = frozenset(['star_set', 'star_sub', 'set', 'import',
+                             'raise', 'return'])
+
+def is_open_ended(ast):
+    while (isinstance(ast, ASTNode) and (ast.tag == 'cmdlist') and
+           (len(ast.items) == 1)):
+        ast = ast.items[0]
+    return isinstance(ast, ASTNode) and (ast.tag in open_ended_tags)
+
+def ends_cleanly(buf):
+    """Returns True if whatever follows (buf) is scanned independently of
+    it.
+    """
+    if buf.endswith('\n'):
+        return True
+    if buf.endswith(' ') or buf.endswith('\t'):
+        # not if the last line is a comment
+        return '#' not in buf[buf.rfind('\n') + 1:]
+    return False
+
+
 class skParser(paramParser):
 
+    # Sections of the command part for reparse_skbuf(): the markers
+    # before and after each, and the text around it to parse it alone
+    incr_sections = (
+        ('START', 'MAINSTART', ':START', ':MAIN_START :MAIN_END :END'),
+        ('MAINSTART', 'MAINEND', ':START :MAIN_START', ':MAIN_END :END'),
+        ('MAINEND', 'END', ':START :MAIN_START :MAIN_END', ':END'),
+        )
+
     def __init__(self, lexer, logger=None,
                  debug=False, parsetab='sk_parse_tab'):
         super(skParser, self).__init__(lexer, logger=logger,
@@ -145,6 +279,25 @@ class skParser(paramParser):
                             'WHILE', 'LET', 'DEF', 'FROM', 'IMPORT',
                             'CATCH', 'RAISE', 'RETURN', 'EXEC'])
 
+        # Positions of section markers and statements recorded during a
+        # parse for reparse_skbuf(), or None when not tracking
+        self._tracking = None
+
+    def _track_marker(self, p, n, name):
+        if self._tracking is not None:
+            self._tracking.markers[name] = (p.lexpos(n), p.lineno(n),
+                                            len(p[n]))
+
+    def _track_statement(self, p, n, first=False):
+        if self._tracking is not None:
+            # Nodes are tracked by id; a new list replaces any record of
+            # a discarded node with the same id
+            if first:
+                self._tracking.lists[id(p[0])] = []
+            if n is not None:
+                self._tracking.lists[id(p[0])].append((p.lexpos(n),
+                                                       p.lineno(n)))
+
     def p_program1(self, p):
         """program : command_section"""
         p[0] = p[1]
@@ -156,26 +309,34 @@ class skParser(paramParser):
     def p_preamble1(self, p):
         """preamble : START statements"""
         p[0] = p[2]
+        self._track_marker(p, 1, 'START')
 
     def p_preamble2(self, p):
         """preamble : START"""
         p[0] = ASTNode('nop')
+        self._track_marker(p, 1, 'START')
 
     def p_mainpart1(self, p):
         """mainpart : MAINSTART statements MAINEND"""
         p[0] = p[2]
+        self._track_marker(p, 1, 'MAINSTART')
+        self._track_marker(p, 3, 'MAINEND')
 
     def p_mainpart2(self, p):
         """mainpart : MAINSTART MAINEND"""
         p[0] = ASTNode('nop')
+        self._track_marker(p, 1, 'MAINSTART')
+        self._track_marker(p, 2, 'MAINEND')
 
     def p_endpart1(self, p):
         """endpart : statements END"""
         p[0] = p[1]
+        self._track_marker(p, 2, 'END')
 
     def p_endpart2(self, p):
         """endpart : END"""
         p[0] = ASTNode('nop')
+        self._track_marker(p, 1, 'END')
 
     def p_statements(self, p):
         """statements : statement"""
@@ -196,6 +357,7 @@ class skParser(paramParser):
         """
         p[0] = p[1]
         p[0].append(p[2])
+        self._track_statement(p, 2)
 
     def p_command_list2(self, p):
         """command_list : command_list special_form
@@ -203,6 +365,7 @@ class skParser(paramParser):
         """
         p[0] = p[1]
         p[0].append(p[2])
+        self._track_statement(p, 2)
 
     def p_command_list3(self, p):
         """command_list : async
@@ -211,12 +374,14 @@ class skParser(paramParser):
                         | special_form
         """
         p[0] = ASTNode('cmdlist', p[1])
+        self._track_statement(p, 1, first=True)
 
     def p_command_list4(self, p):
         """command_list : empty
         """
         #p[0] = ASTNode('cmdlist', ASTNode('nop'))
         p[0] = ASTNode('nop')
+        self._track_statement(p, None, first=True)
 
     def p_special_form(self, p):
         """special_form : if_list
@@ -474,7 +639,8 @@ class skParser(paramParser):
         self.reset(lineno=startline)
 
         try:
-            ast = self.parser.parse(buf, lexer=self.lexer)
+            ast = self.parser.parse(buf, lexer=self.lexer,
+                                    tracking=(self._tracking is not None))
             #print("errors=%d, AST=%s" % (self.errors, ast))
 
             ## # !!! HACK !!!  MUST FIX PARSER!!!
@@ -502,12 +668,33 @@ class skParser(paramParser):
 
         return (self.errors, ast, self.errinfo)
 
+    def _parse_tracked(self, buf, startline=1):
+        self._tracking = Bunch.Bunch(markers={}, lists={})
+        try:
+            (errors, ast, errinfo) = self.parse(buf, startline=startline)
+            return (errors, ast, errinfo, self._tracking)
+
+        finally:
+            self._tracking = None
+
+    def _get_statements(self, node, tracking, offset):
+        # Positions and line numbers of the statements of a section
+        if node.tag == 'nop':
+            return []
+        return [(pos + offset, lineno)
+                for (pos, lineno) in tracking.lists.get(id(node), [])]
 
-    def parse_skbuf(self, buf):
 
+    def parse_skbuf(self, buf, incremental=False):
+        """Parses the sk file contents (buf).  If (incremental) is True,
+        the positions of the sections and statements of the command part
+        are recorded in the result, so that it can be passed to
+        reparse_skbuf().
+        """
         # Get the constituent parts of a skeleton file:
         # header, parameter list, command part
-        (hdrbuf, prmbuf, cmdbuf, startline) = sk_common.get_skparts(buf)
+        match = sk_common.match_skparts(buf)
+        (hdrbuf, prmbuf, cmdbuf, startline) = sk_common.split_skparts(match)
         # print("header", hdrbuf)
         # print("params", prmbuf)
         # print("commands", cmdbuf)
@@ -540,7 +727,12 @@ class skParser(paramParser):
                 errbnch.verbose = sk_common.mk_error(parambuf, errbnch, 1)
 
         # parse the command part
-        (errors, ast_cmds, errinfo) = self.parse(cmdbuf, startline=startline)
+        if incremental:
+            (errors, ast_cmds, errinfo, tracking) = self._parse_tracked(
+                cmdbuf, startline=startline)
+        else:
+            (errors, ast_cmds, errinfo) = self.parse(cmdbuf,
+                                                     startline=startline)
 
         # Append errinfo together
         res.errors += errors
@@ -557,10 +749,191 @@ class skParser(paramParser):
         # "skeleton" node
         res.ast = ASTNode("skeleton", ast_params, ast_cmds)
 
+        if incremental:
+            offset = sk_common.get_cmd_offset(match)
+            markers = dict([(name, (pos + offset, lineno, length))
+                            for (name, (pos, lineno, length))
+                            in tracking.markers.items()])
+            if errors == 0:
+                statements = [self._get_statements(node, tracking, offset)
+                              for node in ast_cmds.items]
+            else:
+                statements = None
+            res.incr = Bunch.Bunch(buf=buf, hdrbuf=hdrbuf, prmbuf=prmbuf,
+                                   startline=startline, cmd_offset=offset,
+                                   cmd_len=len(cmdbuf), cmd_errors=errors,
+                                   markers=markers, statements=statements,
+                                   reparsed='full')
+
         # return a bundle of these objects
         return res
 
 
+    def reparse_skbuf(self, prev, start, end, text):
+        """Parses the sk file contents that result from replacing the text
+        between offsets (start) and (end) of the contents parsed for the
+        result (prev) with (text).  (prev) is a result of
+        parse_skbuf(buf, incremental=True) or of this method.
+
+        If the edit is within a section of the command part, only the
+        top-level statement containing it, or else that section, is parsed
+        again, and spliced into a new AST sharing the rest of the previous
+        one.  Otherwise, or if there are parse errors in the command part,
+        the whole contents are parsed again, so that errors are reported
+        as by a full parse.  The result records which was done in
+        incr.reparsed ('statement', 'section' or 'full').
+        """
+        incr = prev.incr
+        buf = incr.buf[:start] + text + incr.buf[end:]
+
+        res = None
+        if incr.cmd_errors == 0:
+            res = self._reparse(prev, buf, start, end, text)
+        if res is None:
+            res = self.parse_skbuf(buf, incremental=True)
+        return res
+
+    def _parse_region(self, k, buf, offset, lineno, sep):
+        # Parses (buf), statements of section (k) at (offset) and line
+        # (lineno) of the contents, as a whole command part.  Returns the
+        # statements, their positions and the line number after them.
+        (name1, name2, prefix, suffix) = self.incr_sections[k]
+        prefix = prefix + sep
+        (errors, ast, errinfo, tracking) = self._parse_tracked(
+            prefix + buf + sep + suffix, startline=lineno)
+        if errors > 0:
+            return None
+
+        node = ast.items[k]
+        if node.tag == 'nop':
+            items = []
+        else:
+            items = list(node.items)
+        statements = self._get_statements(node, tracking,
+                                          offset - len(prefix))
+        return (items, statements, tracking.markers[name2][1])
+
+    def _reparse(self, prev, buf, start, end, text):
+        incr = prev.incr
+        delta = len(text) - (end - start)
+
+        # Find the section containing the edit
+        for k in range(len(self.incr_sections)):
+            (name1, name2, prefix, suffix) = self.incr_sections[k]
+            (pos1, lineno1, len1) = incr.markers[name1]
+            (pos2, lineno2, len2) = incr.markers[name2]
+            if (pos1 + len1 <= start) and (end <= pos2):
+                break
+        else:
+            return None
+
+        # The edit must not change how the contents divide into parts
+        try:
+            match = sk_common.match_skparts(buf)
+
+        except sk_common.skError:
+            return None
+        (hdrbuf, prmbuf, cmdbuf, startline) = sk_common.split_skparts(match)
+        if ((hdrbuf != incr.hdrbuf) or (prmbuf != incr.prmbuf) or
+            (startline != incr.startline) or
+            (sk_common.get_cmd_offset(match) != incr.cmd_offset) or
+            (len(cmdbuf) != incr.cmd_len + delta)):
+            return None
+
+        section = prev.ast.items[1].items[k]
+        if section.tag == 'nop':
+            old_items = []
+        else:
+            old_items = section.items
+        statements = incr.statements[k]
+        if len(old_items) != len(statements):
+            return None
+
+        # Try the top-level statement containing the edit: it reaches up
+        # to the next statement.  It can be parsed alone unless the edit
+        # joins it to the tokens around it.
+        res = None
+        i = bisect.bisect_right([pos for (pos, lineno) in statements],
+                                start) - 1
+        if i >= 0:
+            (region_start, region_lineno) = statements[i]
+            if i + 1 < len(statements):
+                (region_end, end_lineno) = statements[i+1]
+            else:
+                (region_end, end_lineno) = (pos2, lineno2)
+            region = buf[region_start:region_end + delta]
+
+            if ((end <= region_end) and
+                ((start > region_start) or
+                 (incr.buf[region_start-1] in ' \t\n')) and
+                ((i == 0) or not is_open_ended(old_items[i-1])) and
+                ((region == '') or ends_cleanly(region))):
+                res = self._parse_region(k, region, region_start,
+                                         region_lineno, ' ')
+                if res is None:
+                    return None
+                if ((i + 1 < len(statements)) and (len(res[0]) > 0) and
+                    is_open_ended(res[0][-1])):
+                    res = None
+                else:
+                    reparsed = 'statement'
+                    (first, last) = (i, i + 1)
+
+        # Otherwise the whole section
+        if res is None:
+            (region_start, region_lineno) = (pos1 + len1, lineno1)
+            (region_end, end_lineno) = (pos2, lineno2)
+            region = buf[region_start:region_end + delta]
+            res = self._parse_region(k, region, region_start,
+                                     region_lineno, '')
+            if res is None:
+                return None
+            reparsed = 'section'
+            (first, last) = (0, len(statements))
+
+        (items, new_statements, new_end_lineno) = res
+        lines = new_end_lineno - end_lineno
+
+        def shift(pos, lineno):
+            return (pos + delta, lineno + lines)
+
+        # Splice the new statements into a new AST
+        items = list(old_items[:first]) + items + list(old_items[last:])
+        if len(items) == 0:
+            section = ASTNode('nop')
+        else:
+            section = ASTNode('cmdlist', *items)
+        sections = list(prev.ast.items[1].items)
+        sections[k] = section
+
+        res = Bunch.Bunch(errors=prev.errors, errinfo=list(prev.errinfo),
+                          header=prev.header, params=prev.params,
+                          patterns=prev.patterns)
+        res.ast = ASTNode('skeleton', prev.ast.items[0],
+                          ASTNode('command_section', *sections))
+
+        # Positions after the edit move with it
+        markers = {}
+        for (name, (pos, lineno, length)) in incr.markers.items():
+            if pos >= region_end:
+                (pos, lineno) = shift(pos, lineno)
+            markers[name] = (pos, lineno, length)
+
+        statements = list(incr.statements)
+        statements[k] = (statements[k][:first] + new_statements +
+                         [shift(*stmt) for stmt in statements[k][last:]])
+        for j in range(k + 1, len(statements)):
+            statements[j] = [shift(*stmt) for stmt in statements[j]]
+
+        res.incr = Bunch.Bunch(buf=buf, hdrbuf=hdrbuf, prmbuf=prmbuf,
+                               startline=startline,
+                               cmd_offset=incr.cmd_offset,
+                               cmd_len=len(cmdbuf), cmd_errors=0,
+                               markers=markers, statements=statements,
+                               reparsed=reparsed)
+        return res
+
+
     def parse_skfile(self, skpath):
 
         with open(skpath, 'r') as in_f:
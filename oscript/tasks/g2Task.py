@@ -9,12 +9,15 @@
 #
 import sys, time
 import threading
+import logging
 
 from g2base import Task, Bunch
 from g2base.remoteObjects import remoteObjects as ro
 from g2base.remoteObjects import Monitor
 from g2cam.status.common import STATNONE, STATERROR
 
+from oscript.util import frame_pool
+
 
 class g2TaskError(Task.TaskError):
     """Base class for exceptions raised by g2Tasks.
@@ -93,6 +96,44 @@ class frame2dict(object):
         return True
 
 
+class frameService(object):
+    """Wrapper for a gen2 frame server, returning the frame lists of its
+    results, as expected of the frame service of a FramePool.
+    """
+
+    def __init__(self, g2frameSvc, logger):
+        self.frameSvc = g2frameSvc
+        self.logger = logger
+
+    def getFrames(self, instname, frametype, count):
+        self.logger.debug("Invoking frames.getFrames(%s, %s, %d)" % \
+                          (instname, frametype, count))
+        (code, result) = self.frameSvc.getFrames(instname, frametype, count)
+        if code != ro.OK:
+            raise g2TaskError("Error invoking frame service: %s" % (
+                str(result)))
+
+        framelist = result
+        self.logger.debug("Frame service: framelist=%s" % (framelist))
+
+        return framelist
+
+
+def add_framepool(alloc, block_size=10, logger=None):
+    """Adds to the allocations (alloc) of a task manager, in which the
+    frame service is allocated as 'frames', a FramePool reserving blocks
+    of (block_size) frames from it, as 'framepool'.  The tasks sharing
+    these allocations then get their frames from the pool.
+    """
+    if logger is None:
+        logger = logging.getLogger('g2task')
+    frameSvc = frameService(alloc['frames'], logger)
+    alloc['framepool'] = frame_pool.FramePool(frameSvc,
+                                              block_size=block_size,
+                                              logger=logger)
+    return alloc['framepool']
+
+
 class g2Task(Task.Task):
     """Base class for all Gen2 tasks.  Provides convenience methods and
     abstracts details about how underlying subsystems communicate and
@@ -366,22 +407,30 @@ class g2Task(Task.Task):
                 self.params[name] = statusDict[alias]
 
     def getFrames(self, instname, frametype, count):
-        """Get a list of frames.
+        """Get a list of frames.  If a FramePool is allocated as
+        'framepool' (see add_framepool()), the frames are taken from its
+        reservations for our frame_owner.
         """
+        if 'framepool' in self.alloc:
+            return self.alloc['framepool'].getFrames(
+                instname, frametype, count,
+                owner=getattr(self, 'frame_owner', None))
+
         if 'frames' not in self.alloc:
             raise g2TaskError("Frame service is not allocated.")
 
-        self.logger.debug("Invoking frames.getFrames(%s, %s, %d)" % \
-                          (instname, frametype, count))
-        (code, result) = self.alloc['frames'].getFrames(instname, frametype, count)
-        if code != ro.OK:
-            raise g2TaskError("Error invoking frame service: %s" % (
-                str(result)))
+        frameSvc = frameService(self.alloc['frames'], self.logger)
+        return frameSvc.getFrames(instname, frametype, count)
 
-        framelist = result
-        self.logger.debug("Frame service: framelist=%s" % (framelist))
-
-        return framelist
+    def cancelFrames(self):
+        """Releases the frames reserved for our frame_owner by the
+        allocated FramePool, if any, that have not been handed out, or
+        those reserved without an owner if we have none.  The
+        reservations of other owners are left alone.
+        """
+        if hasattr(self, 'alloc') and ('framepool' in self.alloc):
+            self.alloc['framepool'].cancel(
+                owner=getattr(self, 'frame_owner', None))
 
     def fetchOne(self, statusAlias):
         """Get a single status value.
@@ -99,6 +99,11 @@ class skExecutorTask(g2Task.g2Task):
 
         super(skExecutorTask, self).__init__()
 
+        # The frames reserved by a FramePool for the tasks we run are
+        # ours, and are released if we are cancelled or when we end
+        self.frame_owner = 'executor%d' % id(self)
+        self.extend_shares(['frame_owner'])
+
 
     def execute(self):
         self.count = 0
@@ -159,6 +164,9 @@ class skExecutorTask(g2Task.g2Task):
         # TODO: should we wait for self.count > 0?
         self.logger.debug("Executor task terminating")
 
+        # Give back the frames reserved for our tasks but not used
+        self.cancelFrames()
+
         return self.result
 
 
@@ -200,6 +208,7 @@ class skExecutorTask(g2Task.g2Task):
         g2Task.g2Task.cancel(self)
 
         self.release_sklock()
+        self.cancelFrames()
 
 
     def addTask(self, task):
@@ -210,12 +219,14 @@ class skExecutorTask(g2Task.g2Task):
 # Generic skeleton language interpretation task
 ####################################################################
 #
-class interpTask(g2Task.g2Task):
+class interpTask(g2Task.g2Task, sk_common.ASTVisitor):
     """Task class for interpreting a SOSS language fragment.
     Typically, this class would be invoked indirectly via skTask or
     execTask classes.
     """
 
+    visit_prefix = 'interp_'
+
     def __init__(self, ast, sk_bank, params, ast_default_params=None):
         """Takes an abstract syntax tree (ast), a skeleton file
         bank object (skbank) and initial parameters.  Interprets the ast.
@@ -227,6 +238,8 @@ class interpTask(g2Task.g2Task):
         self.ast = ast
         self.name = ast.tag
         self.ast_default_params = ast_default_params
+        # Scope of status snapshots, see skBank
+        self.status_scope = getattr(sk_bank, 'status_scope', None)
 
         # (This will save params to self.params)
         super(interpTask, self).__init__(**params)
@@ -259,13 +272,20 @@ class interpTask(g2Task.g2Task):
         self.eval.set_vars(self.params, nonew=True)
 
         # Create decoder.  FOR NOW...share eval with decoder
-        self.decoder = sk_interp.Decoder(self.eval, self.sk_bank, self.logger)
+        self.decoder = sk_interp.Decoder(self.eval, self.sk_bank, self.logger,
+                                         lazy_for=getattr(self.sk_bank,
+                                                          'lazy_for', False))
 
         self.check_state()
 
         # Decode AST and substitute params;
         # should be no vars left after this pass
-        new_ast = self.decoder.decode(self.ast, self.eval)
+        with sk_interp.status_snapshot(self.eval.status, self.status_scope):
+            if getattr(self.sk_bank, 'memo_decode', False):
+                new_ast = self.sk_bank.decode_cache.decode(
+                    self.decoder, self.ast, self.eval, self._decode_key())
+            else:
+                new_ast = self.decoder.decode(self.ast, self.eval)
 
         # Record serial number of this AST execution
         self.sk_id = '%d.%d' % (os.getpid(), new_ast.serial_num)
@@ -300,6 +320,13 @@ class interpTask(g2Task.g2Task):
         return self.interpret(new_ast, self.eval)
 
 
+    def _decode_key(self):
+        """Returns a key identifying the result of decoding our AST, for
+        the sk bank's decode cache, or None if it should not be cached.
+        """
+        return None
+
+
     def interpret(self, ast, eval):
         """Generid top-level method to interpret an ast node.
         """
@@ -307,19 +334,30 @@ class interpTask(g2Task.g2Task):
         self.check_state()
 
         self.logger.debug("Interpreting AST=%s" % str(ast))
-        try:
-            # Look up the method for interpreting this kind of AST.
-            interp_method = getattr(self, 'interp_%s' % ast.tag)
-
-        except AttributeError:
+        # Look up the method for interpreting this kind of AST.
+        interp_method = self.visit_method(ast.tag)
+        if interp_method is None:
             # ==> There is no function "interp_XXX" for the tag XXX of the ast.
             raise ExecError("No interpretation for AST node '%s'" % ast.tag)
 
-        if not callable(interp_method):
-            raise ExecError("No method for interpreting parse object '%s'" % ast.tag)
-
         # Call the method on this ast
-        return interp_method(ast, eval)
+        return interp_method(self, ast, eval)
+
+
+    def eval_status(self, eval, ast, eval_fn):
+        """Evaluates (ast) with (eval_fn), in a status snapshot scope if
+        status_scope is set (see skBank), having first fetched the status
+        aliases referenced in it in a single call.
+        """
+        if self.status_scope is None:
+            return eval_fn(ast)
+
+        aliases = sk_interp.collect_aliases(ast)
+        if len(aliases) < 2:
+            aliases = ()
+        with sk_interp.status_snapshot(eval.status, self.status_scope,
+                                       aliases):
+            return eval_fn(ast)
 
 
     def interp_command_section(self, ast, eval):
@@ -399,7 +437,7 @@ class interpTask(g2Task.g2Task):
             #assert (pred_ast.tag == 'expression') and  (pred_ast.tag == 'dyad')
             #       ParseExecError("Badly formed predicate ast: %s" % str(pred_ast))
 
-            res = eval.eval(pred_ast)
+            res = self.eval_status(eval, pred_ast, eval.eval)
             if eval.isTrue(res):
                 return self.interp_cmdlist(then_ast, eval)
 
@@ -428,7 +466,7 @@ class interpTask(g2Task.g2Task):
             # Check if we are being asked to terminate, etc.
             self.check_state()
 
-            res = eval.eval(pred_ast)
+            res = self.eval_status(eval, pred_ast, eval.eval)
             not_done = eval.isTrue(res)
             if not_done:
                 try:
@@ -486,7 +524,7 @@ class interpTask(g2Task.g2Task):
                ParseExecError("Badly formed RAISE expression: %s" % str(ast))
 
         exp_ast = ast.items[0]
-        res = eval.eval(exp_ast)
+        res = self.eval_status(eval, exp_ast, eval.eval)
 
         raise skUserException(str(res))
 
@@ -500,7 +538,7 @@ class interpTask(g2Task.g2Task):
                ParseExecError("Badly formed CALC expression: %s" % str(ast))
 
         exp_ast = ast.items[0]
-        res = eval.eval(exp_ast)
+        res = self.eval_status(eval, exp_ast, eval.eval)
         return res
 
 
@@ -515,7 +553,7 @@ class interpTask(g2Task.g2Task):
         # Evaluate DD command parameters
         cmdname = eval.eval(cmdname_ast)
         subsys = eval.eval(subsys_ast)
-        params = eval.eval_params(params_ast)
+        params = self.eval_status(eval, params_ast, eval.eval_params)
 
         varname = None
         if resvar_ast != None:
@@ -571,7 +609,7 @@ class interpTask(g2Task.g2Task):
                ParseExecError("Badly formed SET ast: %s" % str(ast))
 
         params_ast = ast.items[0]
-        params = eval.eval_params(params_ast)
+        params = self.eval_status(eval, params_ast, eval.eval_params)
 
         eval.registers.set(**params)
 
@@ -590,7 +628,7 @@ class interpTask(g2Task.g2Task):
         fn = eval.registers.get(regref[1:])
 
         # evaluate parameters
-        args, kwdargs = eval.eval_args(params_ast)
+        args, kwdargs = self.eval_status(eval, params_ast, eval.eval_args)
         self.logger.info("fn=%s args=%s kwdargs=%s" % (fn, args, kwdargs))
 
         return fn(*args, **kwdargs)
@@ -644,7 +682,7 @@ class interpTask(g2Task.g2Task):
 
         params_ast, body_ast = ast.items
         # eval parameters
-        params = eval.eval_params(params_ast)
+        params = self.eval_status(eval, params_ast, eval.eval_params)
 
         eval2 = eval.clone()
         eval2.registers.push(params)
@@ -747,8 +785,10 @@ class interpTask(g2Task.g2Task):
         # Iterate through the sub-elements of this ast, running them as
         # tasks.  For commands and blocks marked asynchronous, start them
         # and add them to the wait set (asynctasks) otherwise run the task
-        # and wait for it to finish.
-        for sub_ast in ast.items:
+        # and wait for it to finish.  The iterations of deferred *FOR
+        # loops are decoded and run in line, as they are reached.
+        for sub_ast in self.decoder.expand(
+                ast.items, snapshot=(self.status_scope is not None)):
             # Check if we should be interrupted
             self.check_state()
 
@@ -761,7 +801,7 @@ class interpTask(g2Task.g2Task):
                 res = None    # 0?
                 if len(sub_ast.items) > 0:
                     exp_ast = sub_ast.items[0]
-                    res = eval.eval(exp_ast)
+                    res = self.eval_status(eval, exp_ast, eval.eval)
 
                 break
 
@@ -828,6 +868,12 @@ class interpTask(g2Task.g2Task):
         return self.block_exec(ast, eval)
 
 
+    def interp_deferred_for(self, ast, eval):
+        assert (ast.tag == 'deferred_for'), \
+               ParseExecError("deferred_for ast has wrong tag: %s" % str(ast))
+        return self.block_exec(sk_common.ASTNode('block_merge', ast), eval)
+
+
     # Without a lot more unfolding, we are going to need one of these
     def interp_nop(self, ast, eval):
         assert (ast.tag == 'nop'), \
@@ -955,7 +1001,7 @@ class execTask(interpTask):
         # necessary
         envstr = envstr.strip()
         if len(envstr) > 0:
-            res = sk_bank.param_parser.parse_params(envstr)
+            res = sk_bank.parse_params(envstr)
             if res[0]:
                 raise ParseExecError("Error parsing default parameters '%s': %s" % (
                     envstr, res[2]))
@@ -969,7 +1015,7 @@ class execTask(interpTask):
 
         # Parse command string into an AST, raising parse error if
         # necessary
-        res = sk_bank.ope_parser.parse_opecmd(cmdstr)
+        res = sk_bank.parse_opecmd(cmdstr)
         if res[0]:
             raise ParseExecError("Error parsing command '%s': %s" % (
                 cmdstr, res[2]))
@@ -1022,6 +1068,10 @@ class skTask(interpTask):
         # this shows up in the status variable FITS.<INST>.OBS-MOD
         self._obs_mod = skbunch.header.get('OBS_MOD', obe_mode).upper()
 
+        # Version of the sk file we are running.  The bank may reload the
+        # file if it changes, but this task keeps the AST it got here.
+        self.sk_version = skbunch.version
+
         # Extract the ast and verify it contains a list of default
         # parameters and a body
         ast_skel = skbunch.ast
@@ -1034,6 +1084,19 @@ class skTask(interpTask):
                                      ast_default_params=ast_default_params)
 
 
+    def _decode_key(self):
+        # Only parameters with simple values can be compared reliably
+        params = []
+        for (var, val) in self.params.items():
+            if not isinstance(val, (str, int, float, bool, type(None))):
+                return None
+            params.append((var.lower(), val))
+        params.sort()
+
+        return (self.obe_id.upper(), self.obe_mode.upper(),
+                self.cmdname.upper(), self.sk_version, tuple(params))
+
+
     def execute(self):
 
         # Report our execution to the monitor
@@ -0,0 +1,41 @@
+#
+# sk_fakes.py -- stand-ins for the status and frame services, shared by
+#   the sk tests
+#
+
+
+class FakeStatus(object):
+    """Status service returning the values of the aliases in (values), and
+    recording what it was asked for in calls.
+    """
+    def __init__(self, values):
+        self.values = values
+        self.calls = []
+
+    def fetchOne(self, alias):
+        self.calls.append(alias)
+        return self.values[alias]
+
+    def fetch(self, statusDict):
+        self.calls.append(tuple(statusDict.keys()))
+        return dict([(alias, self.values[alias]) for alias in statusDict])
+
+
+class FakeFrameSource(object):
+    """Frame source counting the frames allocated.  Frames are numbered in
+    the order of allocation if (count) is True, otherwise they are all
+    number 1.
+    """
+    def __init__(self, count=False):
+        self.count = count
+        self.allocated = 0
+
+    def get(self, *args):
+        self.allocated += 1
+        if self.count:
+            num = self.allocated
+        else:
+            num = 1
+        return '%s%s%08d' % (args[0], args[1], num)
+
+#END
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# test_frame_pool.py
+
+import unittest
+import threading
+import logging
+
+from oscript.parse import sk_interp
+from oscript.util.frame_pool import FramePool, FramePoolError
+
+logger = logging.getLogger('sk.test')
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.CRITICAL)
+
+
+class LocalFrameService(object):
+    """Stands in for the frame service."""
+
+    def __init__(self):
+        self.counters = {}
+        self.calls = []
+        self.released = []
+
+    def getFrames(self, instname, frametype, count):
+        self.calls.append((instname, frametype, count))
+        key = (instname, frametype)
+        start = self.counters.get(key, 1)
+        self.counters[key] = start + count
+        return ['%s%s%08d' % (instname, frametype, num)
+                for num in range(start, start + count)]
+
+    def releaseFrames(self, instname, frametype, frames):
+        self.released.append((instname, frametype, frames))
+
+
+class NoReleaseFrameService(LocalFrameService):
+    releaseFrames = None
+
+
+class FramePoolTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.frameSvc = LocalFrameService()
+        self.pool = FramePool(self.frameSvc, block_size=10, logger=logger)
+
+    def test_blocks(self):
+        frames = [self.pool.getFrames('SUP', 'A', 1)[0] for i in range(25)]
+        self.assertEqual(frames, ['SUPA%08d' % num for num in range(1, 26)])
+        self.assertEqual(self.frameSvc.calls, [('SUP', 'A', 10)] * 3)
+        self.assertEqual(self.pool.fetches, 3)
+        self.assertEqual(self.pool.available('sup', 'a'), 5)
+
+        # instruments and frame types have their own reservations
+        self.assertEqual(self.pool.getFrames('SUP', 'Q', 1), ['SUPQ00000001'])
+        self.assertEqual(self.pool.getFrames('HSC', 'A', 1), ['HSCA00000001'])
+        self.assertEqual(self.pool.available('SUP', 'A'), 5)
+
+    def test_contiguous(self):
+        self.assertEqual(self.pool.getFrames('SUP', 'A', 4),
+                         ['SUPA%08d' % num for num in range(1, 5)])
+        # does not fit in what is left: a new block is reserved, and the
+        # rest of the first one is kept
+        self.assertEqual(self.pool.getFrames('SUP', 'A', 8),
+                         ['SUPA%08d' % num for num in range(11, 19)])
+        self.assertEqual(self.frameSvc.released, [])
+        self.assertEqual(self.pool.available('SUP', 'A'), 8)
+        # and used first
+        self.assertEqual(self.pool.getFrames('SUP', 'A', 6),
+                         ['SUPA%08d' % num for num in range(5, 11)])
+        self.assertEqual(self.pool.getFrames('SUP', 'A', 2),
+                         ['SUPA00000019', 'SUPA00000020'])
+        self.assertEqual(self.pool.available('SUP', 'A'), 0)
+        self.assertEqual(len(self.frameSvc.calls), 2)
+        # larger than a block
+        self.assertEqual(len(self.pool.getFrames('SUP', 'A', 12)), 12)
+        self.assertEqual(self.frameSvc.calls[-1], ('SUP', 'A', 12))
+        self.assertRaises(FramePoolError, self.pool.getFrames, 'SUP', 'A', 0)
+
+    def test_cancel(self):
+        self.pool.getFrames('SUP', 'A', 1)
+        self.pool.getFrames('SUP', 'Q', 1)
+        self.pool.cancel('SUP', 'Q')
+        self.assertEqual(self.frameSvc.released,
+                         [('SUP', 'Q', ['SUPQ%08d' % num
+                                        for num in range(2, 11)])])
+        self.pool.cancel()
+        self.assertEqual(len(self.frameSvc.released), 2)
+        self.assertEqual(self.pool.available('SUP', 'A'), 0)
+        self.assertEqual(self.pool.getFrames('SUP', 'A', 1), ['SUPA00000011'])
+
+        # a frame service that cannot take frames back
+        pool = FramePool(NoReleaseFrameService(), block_size=10)
+        pool.getFrames('SUP', 'A', 1)
+        pool.cancel()
+        self.assertEqual(pool.available('SUP', 'A'), 0)
+
+    def test_no_gaps(self):
+        # with a frame service that cannot take frames back, no frame is
+        # lost between requests of various sizes
+        frameSvc = NoReleaseFrameService()
+        pool = FramePool(frameSvc, block_size=10)
+        res = []
+        for count in (3, 4, 5, 1, 2, 8, 1, 1, 7, 3, 1):
+            res.extend(pool.getFrames('SUP', 'A', count))
+        for i in range(pool.available('SUP', 'A')):
+            res.extend(pool.getFrames('SUP', 'A', 1))
+        nums = sorted([int(frame[4:]) for frame in res])
+        self.assertEqual(nums, list(range(1, len(nums) + 1)))
+
+    def test_owners(self):
+        self.assertEqual(self.pool.getFrames('SUP', 'A', 1, owner='q1'),
+                         ['SUPA00000001'])
+        self.assertEqual(self.pool.getFrames('SUP', 'A', 1, owner='q2'),
+                         ['SUPA00000011'])
+        self.assertEqual(self.pool.getFrames('SUP', 'A', 1),
+                         ['SUPA00000021'])
+
+        # cancelling releases the reservations of one owner only
+        self.pool.cancel(owner='q1')
+        self.assertEqual(self.frameSvc.released,
+                         [('SUP', 'A', ['SUPA%08d' % num
+                                        for num in range(2, 11)])])
+        self.assertEqual(self.pool.available('SUP', 'A', owner='q1'), 0)
+        self.assertEqual(self.pool.available('SUP', 'A', owner='q2'), 9)
+        self.assertEqual(self.pool.available('SUP', 'A'), 9)
+        self.assertEqual(self.pool.getFrames('SUP', 'A', 1, owner='q2'),
+                         ['SUPA00000012'])
+
+        # and so does cancelling without an owner
+        self.pool.cancel()
+        self.assertEqual(self.frameSvc.released[-1],
+                         ('SUP', 'A', ['SUPA%08d' % num
+                                       for num in range(22, 31)]))
+        self.assertEqual(self.pool.available('SUP', 'A'), 0)
+        self.assertEqual(self.pool.available('SUP', 'A', owner='q2'), 8)
+        self.pool.cancel(all_owners=True)
+        self.assertEqual(self.pool.available('SUP', 'A', owner='q2'), 0)
+        self.assertEqual(self.pool.reserved, {})
+        self.assertEqual(self.pool.locks, {})
+
+    def test_short(self):
+        class ShortFrameService(LocalFrameService):
+            def getFrames(self, instname, frametype, count):
+                return ['SUPA00000001']
+
+        pool = FramePool(ShortFrameService(), block_size=10)
+        with self.assertRaises(FramePoolError) as cm:
+            pool.getFrames('SUP', 'A', 2)
+        self.assertIn('(1) does not match request (2)', str(cm.exception))
+
+    def test_threads(self):
+        res = []
+        def get_frames():
+            for i in range(50):
+                res.extend(self.pool.getFrames('SUP', 'A', 1 + i % 3))
+
+        threads = [threading.Thread(target=get_frames) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(res), len(set(res)))
+
+    def test_threads_cancel(self):
+        # new reservations are made while others are cancelled
+        errors = []
+        def get_frames(owner):
+            try:
+                for i in range(200):
+                    self.pool.getFrames('SUP', 'A%d' % (i % 20), 1,
+                                        owner=owner)
+            except Exception as e:
+                errors.append(e)
+
+        def cancel():
+            try:
+                for i in range(200):
+                    self.pool.cancel(all_owners=True)
+                    self.pool.available('SUP', 'A0')
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=get_frames, args=('q%d' % i,))
+                   for i in range(4)]
+        threads.append(threading.Thread(target=cancel))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_frame_source(self):
+        frame_source = sk_interp.FrameSource(self.pool)
+        self.assertEqual(frame_source.get('SUP', 'A'), 'SUPA00000001')
+        self.assertEqual(frame_source.get('SUP', 'A', '3'),
+                         'SUPA00000002:0003')
+        self.assertEqual(frame_source.allocated, 4)
+        self.assertEqual(len(self.frameSvc.calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
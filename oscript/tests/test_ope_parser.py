@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# test_ope_parser.py
+
+import unittest
+import logging
+
+from oscript.parse import sk_lexer, sk_parser
+from oscript.parse.sk_common import ASTNode
+
+logger = logging.getLogger('sk.test')
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.CRITICAL)
+
+# Command lines of the flat forms
+flat_cmds = [
+    'EXEC TSC MOVE RA=10.5 DEC=5 MODE=fast',
+    'exec obs check',
+    'EXEC 1 2.5 X=007 Y=1.2.3 Z=1. W=1e5',
+    '  EXEC  TSC\tMOVE  K = V  ',
+    'EXEC "TSC" [MOVE] K=V',
+    'EXEC TSC MOVE K=OR L=and',
+    'EXEC TSC MOVE NAME="a b" EMPTY="" S=\'single\' L=[1 2 3] T=a:b',
+    'SETUPFIELD OBE_ID=SPCAM OBE_MODE=IMAG_N_VGW Exptime=10',
+    'FOO',
+    '"quoted" K=V',
+    ]
+
+# Command lines that must go through the grammar
+other_cmds = [
+    '',
+    'EXEC TSC',
+    'FOO=1',
+    'EXEC TSC MOVE AND=1',
+    'EXEC TSC MOVE K=A AND B',
+    'EXEC TSC MOVE K==1',
+    'EXEC TSC MOVE K=IF',
+    'EXEC TSC MOVE K=$X',
+    'EXEC TSC MOVE K=!STATS.RA',
+    'EXEC TSC MOVE K=@REG',
+    'EXEC TSC MOVE K=&GET_F_NO[SUP A]',
+    'EXEC TSC MOVE K=-1',
+    'EXEC TSC MOVE K=+1',
+    'EXEC TSC MOVE K=(1 + 2)',
+    'EXEC TSC MOVE K=SIN(30)',
+    'EXEC TSC MOVE 1=2',
+    'EXEC TSC MOVE K=V L',
+    'EXEC TSC MOVE K=V ;',
+    'EXEC TSC MOVE K="esc \\" quote"',
+    'EXEC TSC MOVE K=V\nL=W',
+    'EXEC TSC MOVE K=V # comment',
+    'EXEC TSC MOVE K=.5',
+    'EXEC TSC MOVE K=café',
+    ]
+
+
+class OpeParserTestCase(unittest.TestCase):
+
+    def setUp(self):
+        lexer = sk_lexer.skScanner(logger=logger, debug=False,
+                                   lextab='scan2_tab')
+        self.parser = sk_parser.opeParser(lexer, logger=logger)
+        self.parser.build()
+
+    def flatten(self, ast, res):
+        if isinstance(ast, ASTNode):
+            res.append((ast.tag, ast.serial_num))
+            for item in ast.items:
+                self.flatten(item, res)
+        else:
+            res.append((type(ast), ast))
+        return res
+
+    def assertSameAST(self, ast1, ast2):
+        res1 = self.flatten(ast1, [])
+        res2 = self.flatten(ast2, [])
+        # serial numbers differ, but must be in the same order
+        base1 = min([val for (tag, val) in res1 if isinstance(tag, str)])
+        base2 = min([val for (tag, val) in res2 if isinstance(tag, str)])
+        res1 = [(tag, val - base1) if isinstance(tag, str) else (tag, val)
+                for (tag, val) in res1]
+        res2 = [(tag, val - base2) if isinstance(tag, str) else (tag, val)
+                for (tag, val) in res2]
+        self.assertEqual(res1, res2)
+
+    def parse(self, cmdstr, fast_path):
+        self.parser.fast_path = fast_path
+        return self.parser.parse_opecmd(cmdstr)
+
+    def test_flat(self):
+        for cmdstr in flat_cmds:
+            self.assertIsNotNone(self.parser.parse_flat(cmdstr), cmdstr)
+
+            (errors1, ast1, errinfo1) = self.parse(cmdstr, False)
+            (errors2, ast2, errinfo2) = self.parse(cmdstr, True)
+            self.assertEqual(errors1, 0)
+            self.assertEqual(errors2, 0)
+            self.assertEqual(errinfo2, [])
+            self.assertSameAST(ast1, ast2)
+
+    def test_other(self):
+        for cmdstr in other_cmds:
+            self.assertIsNone(self.parser.parse_flat(cmdstr), cmdstr)
+
+            (errors1, ast1, errinfo1) = self.parse(cmdstr, False)
+            (errors2, ast2, errinfo2) = self.parse(cmdstr, True)
+            self.assertEqual(errors1, errors2)
+            self.assertEqual(str(ast1), str(ast2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# test_parse_tables.py
+
+import unittest
+import logging
+
+import build_parser_tables
+
+logging.getLogger('build_parser_tables').setLevel(logging.CRITICAL)
+
+
+class ParseTablesTestCase(unittest.TestCase):
+
+    def test_tables(self):
+        # every shipped table must match the grammar of its parser
+        tabmodules = []
+        for (parser, start, tabmodule) in build_parser_tables.get_parsers():
+            self.assertTrue(build_parser_tables.check_table(parser, start,
+                                                            tabmodule),
+                            "table module '%s' is missing or out of date" % (
+                                tabmodule))
+            tabmodules.append(tabmodule)
+
+        self.assertEqual(sorted(tabmodules),
+                         ['PARA_parse_tab', 'ope_command_parse_tab',
+                          'param_parse_tab', 'sk_parse_tab'])
+
+
+if __name__ == '__main__':
+    unittest.main()
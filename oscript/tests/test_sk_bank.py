@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+# test_sk_bank.py
+
+import unittest
+import tempfile
+import io
+import contextlib
+import os
+import threading
+import time
+import logging
+
+from oscript.parse import sk_interp
+from oscript.parse.sk_common import ASTNode
+
+logger = logging.getLogger('sk.test')
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.CRITICAL)
+
+step_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+POS=0
+:COMMAND
+:START
+:MAIN_START
+EXEC TSC MOVE POS=$POS VERSION=%d ;
+:MAIN_END
+:END
+'''
+
+caller_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+OBE_ID=TEST
+OBE_MODE=MODE
+:COMMAND
+:START
+:MAIN_START
+*SUB %s OBE_ID=$OBE_ID OBE_MODE=$OBE_MODE POS=1 ;
+*SUB $CMD OBE_ID=TEST OBE_MODE=OTHER ;
+*IF $POS == 1
+    *SUB SETUP OBE_ID=TEST OBE_MODE=OTHER ;
+*ENDIF
+:MAIN_END
+:END
+'''
+
+
+class SkBankParseCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.topdir = tempfile.TemporaryDirectory()
+        self.sk_bank = sk_interp.skBank(self.topdir.name, logger=logger,
+                                        parse_cache_maxsize=2)
+
+    def tearDown(self):
+        self.topdir.cleanup()
+
+    def test_copies(self):
+        cmdstr = 'EXEC TSC MOVE RA=!STATS.RA DEC=$DEC'
+        (errors, ast1, errinfo) = self.sk_bank.parse_opecmd(cmdstr)
+        self.assertEqual(errors, 0)
+        text = str(ast1)
+
+        # modifying the result does not affect later results
+        ast1.items[0].items[2].items.append(ASTNode('nop'))
+        (errors, ast2, errinfo) = self.sk_bank.parse_opecmd(
+            '  ' + cmdstr + '\n')
+        self.assertEqual(errors, 0)
+        self.assertEqual(str(ast2), text)
+        self.assertIsNot(ast1.items[0], ast2.items[0])
+        self.assertEqual(self.sk_bank.parse_cache.hits, 1)
+
+        (errors, ast3, errinfo) = self.sk_bank.parse_params('A=1 B="x"')
+        self.assertEqual(errors, 0)
+        self.assertEqual(ast3.tag, 'param_list')
+
+    def test_errors(self):
+        for i in range(2):
+            (errors, ast, errinfo) = self.sk_bank.parse_opecmd('EXEC (')
+            self.assertGreater(errors, 0)
+            self.assertGreater(len(errinfo), 0)
+        self.assertEqual(len(self.sk_bank.parse_cache), 0)
+
+    def test_status_scope(self):
+        # status is not snapshotted unless asked for
+        self.assertIsNone(self.sk_bank.status_scope)
+        self.assertRaises(sk_interp.skError, sk_interp.skBank,
+                          self.topdir.name, logger=logger,
+                          status_scope='task')
+
+        sk_bank = sk_interp.skBank(self.topdir.name, logger=logger,
+                                   status_scope='statement')
+        self.assertEqual(sk_bank.status_scope, 'statement')
+
+    def test_bounded(self):
+        for i in range(5):
+            self.sk_bank.parse_opecmd('EXEC TSC MOVE N=%d' % i)
+        self.assertEqual(len(self.sk_bank.parse_cache), 2)
+
+
+class SkBankLookupTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.topdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.topdir.cleanup()
+
+    def write_sk(self, obe_mode, abscmd, buf):
+        moddir = os.path.join(self.topdir.name, 'TEST', 'sk', obe_mode)
+        os.makedirs(moddir, exist_ok=True)
+        skpath = os.path.join(moddir, abscmd + '.sk')
+        with open(skpath, 'w') as out_f:
+            out_f.write(buf)
+        return skpath
+
+    def test_reload(self):
+        self.write_sk('MODE', 'STEP', step_sk % 1)
+        sk_bank = sk_interp.skBank(self.topdir.name, logger=logger,
+                                   check_ttl=3600)
+        skbunch1 = sk_bank.lookup('TEST', 'MODE', 'STEP')
+        self.assertEqual(skbunch1.errors, 0)
+        text = str(skbunch1.ast)
+
+        # the file is not checked again before the TTL expires
+        self.write_sk('MODE', 'STEP', step_sk % 22)
+        self.assertIs(sk_bank.lookup('test', 'mode', 'step'), skbunch1)
+
+        # and is reloaded after it does
+        skbunch1.checked -= 3600
+        skbunch2 = sk_bank.lookup('TEST', 'MODE', 'STEP')
+        self.assertIsNot(skbunch2, skbunch1)
+        self.assertEqual(skbunch2.version, skbunch1.version + 1)
+        self.assertIn('VERSION=22', skbunch2.ast.AST2str())
+        self.assertIs(sk_bank.lookup('TEST', 'MODE', 'STEP'), skbunch2)
+        # the old version is left as it was
+        self.assertEqual(str(skbunch1.ast), text)
+
+        # an unchanged file is not reloaded
+        skbunch2.checked -= 3600
+        self.assertIs(sk_bank.lookup('TEST', 'MODE', 'STEP'), skbunch2)
+
+    def test_load_once(self):
+        self.write_sk('MODE', 'STEP', step_sk % 1)
+        sk_bank = sk_interp.skBank(self.topdir.name, logger=logger)
+
+        # count the parses, and make them slow enough for the lookups to
+        # overlap
+        loads = []
+        load_skfile = sk_bank.load_skfile
+        def counting_load(*args):
+            loads.append(args)
+            time.sleep(0.2)
+            return load_skfile(*args)
+        sk_bank.load_skfile = counting_load
+
+        nthreads = 8
+        barrier = threading.Barrier(nthreads)
+        results = [None] * nthreads
+        def lookup(i):
+            barrier.wait()
+            results[i] = sk_bank.lookup('TEST', 'MODE', 'STEP')
+
+        threads = [threading.Thread(target=lookup, args=(i,))
+                   for i in range(nthreads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(loads), 1)
+        self.assertIsNotNone(results[0])
+        for skbunch in results:
+            self.assertIs(skbunch, results[0])
+        self.assertEqual(sk_bank._loading, {})
+
+    def test_prefetch(self):
+        self.write_sk('MODE', 'STEP', step_sk % 1)
+        sk_bank = sk_interp.skBank(self.topdir.name, logger=logger)
+        future = sk_bank.prefetch('TEST', 'MODE', 'STEP')
+        skbunch = future.result(timeout=60)
+        self.assertEqual(skbunch.errors, 0)
+        self.assertIn(('TEST', 'MODE', 'STEP'), sk_bank.cache)
+        self.assertIs(sk_bank.lookup('TEST', 'MODE', 'STEP'), skbunch)
+
+        # errors are raised by the future
+        future = sk_bank.prefetch('TEST', 'MODE', 'MISSING')
+        with self.assertRaises(Exception):
+            future.result(timeout=60)
+
+    def test_prefetch_subs(self):
+        self.write_sk('MODE', 'TOP', caller_sk % 'STEP')
+        self.write_sk('MODE', 'STEP', step_sk % 1)
+
+        # off by default
+        sk_bank = sk_interp.skBank(self.topdir.name, logger=logger)
+        sk_bank.lookup('TEST', 'MODE', 'TOP')
+        self.assertIsNone(sk_bank._executor)
+        self.assertNotIn(('TEST', 'MODE', 'STEP'), sk_bank.cache)
+
+        sk_bank = sk_interp.skBank(self.topdir.name, logger=logger,
+                                   prefetch_subs=True)
+        sk_bank.lookup('TEST', 'MODE', 'TOP')
+        # (the call to OTHER/SETUP, which does not exist, fails quietly)
+        sk_bank._executor.shutdown(wait=True)
+        self.assertIn(('TEST', 'MODE', 'STEP'), sk_bank.cache)
+        self.assertNotIn(('TEST', 'OTHER', 'SETUP'), sk_bank.cache)
+
+    def test_preload_skfiles(self):
+        self.write_sk('MODE', 'STEP', step_sk % 1)
+        sk_bank = sk_interp.skBank(self.topdir.name, logger=logger)
+
+        loads = []
+        load_skfile = sk_bank.load_skfile
+        def slow_load(*args):
+            loads.append(args)
+            time.sleep(0.2)
+            return load_skfile(*args)
+        sk_bank.load_skfile = slow_load
+
+        # a preload while a lookup is loading the file waits for it
+        thread = threading.Thread(target=sk_bank.lookup,
+                                  args=('TEST', 'MODE', 'STEP'))
+        thread.start()
+        time.sleep(0.05)
+        sk_bank.preload_skfiles('test', 'mode')
+        thread.join()
+        self.assertEqual(len(loads), 1)
+        self.assertEqual(sk_bank.lookup('TEST', 'MODE', 'STEP').version, 1)
+
+    def test_preload_all(self):
+        for i in range(4):
+            self.write_sk('MODE%d' % (i % 2), 'STEP%d' % i, step_sk % i)
+        self.write_sk('MODE0', 'BAD', step_sk.replace('POS=$POS', 'POS=('))
+
+        for workers in (1, 2):
+            sk_bank = sk_interp.skBank(self.topdir.name, logger=logger)
+            stderr = io.StringIO()
+            with self.assertLogs(logger, 'INFO') as logs:
+                with contextlib.redirect_stderr(stderr):
+                    report = sk_bank.preload_all(['TEST'], workers=workers)
+            self.assertEqual(list(report.keys()), [('TEST', 'MODE0', 'BAD')])
+            self.assertIn("errors parsing skeleton file '%s'" % (
+                os.path.join(self.topdir.name, 'TEST', 'sk', 'MODE0',
+                             'BAD.sk')),
+                          report[('TEST', 'MODE0', 'BAD')])
+            # the errors are in the report only
+            self.assertEqual(stderr.getvalue(), '')
+            self.assertIn('preloaded 5 sk files (1 with errors)',
+                          logs.output[-1])
+
+            self.assertEqual(len(sk_bank.cache), 5)
+            for i in range(4):
+                key = ('TEST', 'MODE%d' % (i % 2), 'STEP%d' % i)
+                skbunch = sk_bank.cache.peek(key)
+                self.assertEqual(skbunch.errors, 0)
+                self.assertIn('VERSION=%d' % i, skbunch.ast.AST2str())
+                self.assertIs(sk_bank.lookup(*key), skbunch)
+
+    def test_preload_fast_scan(self):
+        for i in range(2):
+            self.write_sk('MODE', 'STEP%d' % i, step_sk % i)
+
+        res = []
+        for fast_scan in (False, True):
+            sk_bank = sk_interp.skBank(self.topdir.name, logger=logger,
+                                       fast_scan=fast_scan)
+            with self.assertLogs(logger, 'INFO'):
+                report = sk_bank.preload_all(['TEST'], workers=1)
+            self.assertEqual(report, {})
+            # the files are parsed with the scanner of the bank
+            parser = sk_interp._preload_parsers[fast_scan]
+            self.assertIs(type(parser.lexer), sk_bank.scanner_class)
+            res.append(sk_bank.cache.peek(('TEST', 'MODE', 'STEP1')))
+        self.assertEqual(res[0].ast.AST2str(), res[1].ast.AST2str())
+
+    def test_deps(self):
+        self.write_sk('MODE', 'TOP', caller_sk % 'MID')
+        self.write_sk('MODE', 'MID', caller_sk % 'STEP')
+        self.write_sk('MODE', 'STEP', step_sk % 1)
+        self.write_sk('OTHER', 'SETUP', step_sk % 1)
+        sk_bank = sk_interp.skBank(self.topdir.name, logger=logger,
+                                   check_ttl=0, prefetch_subs=False)
+
+        top = sk_bank.lookup('TEST', 'MODE', 'TOP')
+        # OBE_ID and OBE_MODE come from the default parameters; the call
+        # with a variable command name is left out
+        self.assertEqual(sk_interp.get_sub_deps(('TEST', 'MODE', 'TOP'),
+                                                top.ast),
+                         set([('TEST', 'MODE', 'MID'),
+                              ('TEST', 'OTHER', 'SETUP')]))
+
+        for abscmd in ('MID', 'STEP'):
+            sk_bank.lookup('TEST', 'MODE', abscmd)
+        sk_bank.lookup('TEST', 'OTHER', 'SETUP')
+        self.assertEqual(sk_bank.deps[('TEST', 'MODE', 'STEP')], set())
+        self.assertEqual(sk_bank.rdeps[('TEST', 'MODE', 'STEP')],
+                         set([('TEST', 'MODE', 'MID')]))
+        self.assertEqual(sk_bank.rdeps[('TEST', 'OTHER', 'SETUP')],
+                         set([('TEST', 'MODE', 'TOP'),
+                              ('TEST', 'MODE', 'MID')]))
+        self.assertEqual(sk_bank.dependents('test', 'mode', 'step'),
+                         set([('TEST', 'MODE', 'TOP'),
+                              ('TEST', 'MODE', 'MID')]))
+
+        # editing a *SUB file invalidates its callers, transitively
+        self.write_sk('MODE', 'STEP', step_sk % 22)
+        step = sk_bank.lookup('TEST', 'MODE', 'STEP')
+        self.assertIn('VERSION=22', step.ast.AST2str())
+        self.assertEqual(sorted(sk_bank.cache.keys()),
+                         [('TEST', 'MODE', 'STEP'),
+                          ('TEST', 'OTHER', 'SETUP')])
+        self.assertIsNot(sk_bank.lookup('TEST', 'MODE', 'TOP'), top)
+
+        # and so does invalidating it
+        sk_bank.lookup('TEST', 'MODE', 'MID')
+        sk_bank.invalidate('TEST', 'OTHER', 'SETUP')
+        self.assertEqual(sk_bank.cache.keys(), [('TEST', 'MODE', 'STEP')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# test_sk_cache.py
+
+import unittest
+import tempfile
+import os
+import logging
+
+from oscript.parse import sk_lexer, sk_parser, sk_cache
+
+logger = logging.getLogger('sk.test')
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.CRITICAL)
+
+test_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+OBE_ID=TEST
+EXPTIME=10
+:COMMAND
+:START
+:MAIN_START
+EXEC TSC WAIT TIME=$EXPTIME ;
+:MAIN_END
+:END
+'''
+
+
+class SkDiskCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.topdir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.topdir.name, 'cache')
+        self.cache = sk_cache.skDiskCache(self.cache_dir, logger=logger)
+
+        self.skpath = os.path.join(self.topdir.name, 'TEST.sk')
+        self.write_sk(test_sk)
+
+        lexer = sk_lexer.skScanner(logger=logger, debug=False,
+                                   lextab='scan4_tab')
+        self.parser = sk_parser.skParser(lexer, logger=logger)
+        self.parser.build()
+
+    def tearDown(self):
+        self.topdir.cleanup()
+
+    def write_sk(self, buf, mtime_ns=None):
+        with open(self.skpath, 'w') as out_f:
+            out_f.write(buf)
+        if mtime_ns is not None:
+            os.utime(self.skpath, ns=(mtime_ns, mtime_ns))
+
+    def store(self):
+        """Parses the sk file and caches the result, as skBank does.
+        """
+        (key, buf) = self.cache.identify(self.skpath)
+        skbunch = self.parser.parse_skbuf(buf)
+        self.assertEqual(skbunch.errors, 0)
+        self.cache.put(key, skbunch)
+        return skbunch
+
+    def lookup(self):
+        (key, buf) = self.cache.identify(self.skpath)
+        return self.cache.get(key)
+
+    def test_hit(self):
+        self.assertIsNone(self.lookup())
+
+        skbunch = self.store()
+        res = self.lookup()
+        self.assertIsNotNone(res)
+        self.assertEqual(res.errors, 0)
+        self.assertEqual(res.filepath, os.path.abspath(self.skpath))
+        self.assertEqual(str(res.ast), str(skbunch.ast))
+        self.assertEqual(res.params, skbunch.params)
+
+        # the entry is found by another instance, e.g. after a restart
+        cache = sk_cache.skDiskCache(self.cache_dir, logger=logger)
+        (key, buf) = cache.identify(self.skpath)
+        self.assertEqual(str(cache.get(key).ast), str(skbunch.ast))
+
+        self.cache.clear()
+        self.assertIsNone(self.lookup())
+
+    def test_modified(self):
+        self.store()
+        mtime_ns = os.stat(self.skpath).st_mtime_ns
+
+        # same contents, different modification time
+        os.utime(self.skpath, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        self.assertIsNone(self.lookup())
+        self.store()
+        self.assertIsNotNone(self.lookup())
+        mtime_ns += 10**9
+
+        # different size, same modification time
+        self.write_sk(test_sk + '\n', mtime_ns=mtime_ns)
+        self.assertIsNone(self.lookup())
+        self.store()
+        self.assertIsNotNone(self.lookup())
+
+        # different contents of the same size, same modification time
+        self.write_sk(test_sk.replace('10', '20') + '\n', mtime_ns=mtime_ns)
+        self.assertEqual(os.stat(self.skpath).st_size,
+                         len(test_sk) + 1)
+        self.assertIsNone(self.lookup())
+        skbunch = self.store()
+        self.assertEqual(skbunch.params['EXPTIME'], '20')
+        self.assertEqual(self.lookup().params['EXPTIME'], '20')
+
+    def test_grammar_version(self):
+        self.store()
+        self.assertIsNotNone(self.lookup())
+
+        saved = sk_cache._grammar_version
+        self.addCleanup(setattr, sk_cache, '_grammar_version', saved)
+        sk_cache._grammar_version = 'changed'
+
+        cache = sk_cache.skDiskCache(self.cache_dir, logger=logger)
+        (key, buf) = cache.identify(self.skpath)
+        self.assertIsNone(cache.get(key))
+
+    def test_unreadable(self):
+        self.store()
+        (key, buf) = self.cache.identify(self.skpath)
+        entry_path = self.cache._entry_path(key[0])
+        self.assertTrue(os.path.exists(entry_path))
+
+        with open(entry_path, 'wb') as out_f:
+            out_f.write(b'not a pickle')
+        self.assertIsNone(self.cache.get(key))
+
+        # a truncated entry is ignored too, and replaced by the next put
+        self.store()
+        with open(entry_path, 'rb') as in_f:
+            data = in_f.read()
+        with open(entry_path, 'wb') as out_f:
+            out_f.write(data[:len(data) // 2])
+        self.assertIsNone(self.cache.get(key))
+        self.store()
+        self.assertIsNotNone(self.cache.get(key))
+
+    def test_errors(self):
+        # parse results with errors are not cached
+        self.write_sk(test_sk.replace('TIME=$EXPTIME', 'TIME=('))
+        (key, buf) = self.cache.identify(self.skpath)
+        skbunch = self.parser.parse_skbuf(buf)
+        self.assertGreater(skbunch.errors, 0)
+        self.cache.put(key, skbunch)
+        self.assertIsNone(self.cache.get(key))
+
+
+class LRUCacheTestCase(unittest.TestCase):
+
+    def test_order(self):
+        cache = sk_cache.LRUCache(maxsize=3)
+        for key in 'abc':
+            cache[key] = key.upper()
+        self.assertEqual(cache['a'], 'A')
+        cache['d'] = 'D'
+        # 'b' was the least recently used
+        self.assertEqual(cache.keys(), ['c', 'a', 'd'])
+
+        # setting an entry counts as a use
+        cache['c'] = 'C2'
+        cache['e'] = 'E'
+        self.assertEqual(cache.keys(), ['d', 'c', 'e'])
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(cache.get('c'), 'C2')
+
+        del cache['d']
+        self.assertNotIn('d', cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_maxbytes(self):
+        cache = sk_cache.LRUCache(maxbytes=10, sizeof=len)
+        cache['a'] = 'x' * 4
+        cache['b'] = 'x' * 4
+        self.assertEqual(cache.nbytes, 8)
+        cache['c'] = 'x' * 4
+        self.assertEqual(cache.keys(), ['b', 'c'])
+        self.assertEqual(cache.nbytes, 8)
+
+        # replacing an entry replaces its size
+        cache['b'] = 'x'
+        self.assertEqual(cache.nbytes, 5)
+        cache['d'] = 'x' * 5
+        self.assertEqual(cache.keys(), ['c', 'b', 'd'])
+        self.assertEqual(cache.nbytes, 10)
+
+        # an entry over the budget by itself is not kept
+        cache['e'] = 'x' * 11
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_pinned(self):
+        cache = sk_cache.LRUCache(maxsize=2,
+                                  is_pinned=lambda key: key.startswith('p'))
+        cache['p1'] = 1
+        cache['p2'] = 2
+        cache['a'] = 3
+        # unpinned entries are evicted first, however recently used
+        self.assertEqual(cache.keys(), ['p1', 'p2'])
+        cache['b'] = 4
+        cache['c'] = 5
+        self.assertEqual(cache.keys(), ['p1', 'p2'])
+
+        # the budget may be exceeded by pinned entries alone
+        cache['p3'] = 6
+        self.assertEqual(len(cache), 3)
+
+    def test_peek(self):
+        cache = sk_cache.LRUCache(maxsize=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache.peek('a'), 1)
+        self.assertEqual(cache.peek('x', 0), 0)
+        cache['c'] = 3
+        # 'a' was peeked at, not used
+        self.assertEqual(cache.keys(), ['b', 'c'])
+        self.assertEqual(cache.stats()['hits'], 0)
+        self.assertEqual(cache.stats()['misses'], 0)
+
+    def test_stats(self):
+        cache = sk_cache.LRUCache(maxsize=2, maxbytes=100, sizeof=len)
+        self.assertEqual(cache.stats(), dict(hits=0, misses=0, evictions=0,
+                                             entries=0, bytes=0))
+        cache['a'] = 'xx'
+        cache['b'] = 'xxx'
+        cache['a']
+        cache.get('a')
+        cache.get('z')
+        with self.assertRaises(KeyError):
+            cache['y']
+        cache['c'] = 'x'
+        self.assertEqual(cache.stats(), dict(hits=2, misses=2, evictions=1,
+                                             entries=2, bytes=3))
+
+        cache.clear()
+        self.assertEqual(cache.stats()['entries'], 0)
+        self.assertEqual(cache.stats()['bytes'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
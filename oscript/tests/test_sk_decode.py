@@ -0,0 +1,413 @@
+#!/usr/bin/env python
+# test_sk_decode.py
+
+import unittest
+import tempfile
+import os
+import logging
+
+from oscript.parse import sk_lexer, sk_parser, sk_interp, sk_common
+from oscript.parse.sk_common import ASTNode
+from oscript.tests.sk_fakes import FakeStatus, FakeFrameSource
+
+logger = logging.getLogger('sk.test')
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.CRITICAL)
+
+test_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+OBE_ID=TEST
+EXPTIME=10
+:COMMAND
+:START
+*SET X=2
+:MAIN_START
+*FOR 3 I IN
+    EXEC TSC WAIT TIME=1 ;
+    EXEC TSC MOVE POS=$I ;
+*ENDFOR
+EXEC TSC WAIT TIME=$EXPTIME ,
+:MAIN_END
+EXEC TSC WAIT TIME=2 ;
+:END
+'''
+
+loop_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+OBE_ID=TEST
+:COMMAND
+:START
+*SET X=2
+:MAIN_START
+*FOR 0 I J IN "1 2 3 4 5 6"
+    EXEC TSC MOVE POS=$I OFFSET=$J FRAME=&GET_F_NO[SUP A] ;
+    *IF $I == "3"
+        EXEC TSC WAIT TIME=$X ,
+    *ENDIF
+*ENDFOR
+EXEC TSC WAIT TIME=$I ;
+*FOR 3 K IN
+    *SET X=$K
+*ENDFOR
+EXEC TSC WAIT TIME=$X ;
+:MAIN_END
+:END
+'''
+
+text_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+OBE_ID=TEST
+:COMMAND
+:START
+:MAIN_START
+%s
+:MAIN_END
+:END
+'''
+
+sub_loop_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+OBE_ID=TEST
+:COMMAND
+:START
+:MAIN_START
+*FOR 0 I IN "1 2 3"
+    *SUB STEP OBE_ID=TEST OBE_MODE=MODE POS=$I ;
+*ENDFOR
+:MAIN_END
+:END
+'''
+
+step_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+POS=0
+:COMMAND
+:START
+:MAIN_START
+EXEC TSC MOVE POS=$POS VERSION=%d ;
+:MAIN_END
+:END
+'''
+
+cached_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+OBE_ID=TEST
+:COMMAND
+:START
+:MAIN_START
+*SUB STEP OBE_ID=TEST OBE_MODE=MODE POS=1 ;
+*IF !TEST.POS == 6
+    EXEC TSC WAIT TIME=6 ;
+*ENDIF
+%s
+:MAIN_END
+:END
+'''
+
+
+class SkDecodeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        lexer = sk_lexer.skScanner(logger=logger, debug=False,
+                                   lextab='scan4_tab')
+        self.parser = sk_parser.skParser(lexer, logger=logger)
+        self.parser.build()
+
+    def make_decoder(self, params, lazy_for=False, sk_bank=None):
+        evaluator = sk_interp.Evaluator(sk_interp.VariableResolver(params),
+                                        sk_interp.RegisterResolver(),
+                                        sk_interp.MockStatusResolver({}),
+                                        FakeFrameSource(count=True), logger)
+        return sk_interp.Decoder(evaluator, sk_bank, logger,
+                                 lazy_for=lazy_for)
+
+    def decode(self, ast, params):
+        decoder = self.make_decoder(params)
+        return decoder.decode(ast, decoder.eval)
+
+    def flatten(self, decoder, ast, res):
+        """Lists the statements of (ast), as interpTask.block_exec() would
+        run them.
+        """
+        if ast.tag in ('block', 'block_merge', 'cmdlist'):
+            res.append('{')
+            for item in decoder.expand(ast.items):
+                self.flatten(decoder, item, res)
+            res.append('}')
+        else:
+            res.append(ast.AST2str())
+        return res
+
+    def test_share(self):
+        skbunch = self.parser.parse_skbuf(test_sk)
+        self.assertEqual(skbunch.errors, 0)
+        ast = skbunch.ast.items[1]
+        text = str(ast)
+
+        res = self.decode(ast, dict(OBE_ID='TEST', EXPTIME=10))
+        self.assertEqual(str(ast), text)
+
+        (pre_ast, main_ast, post_ast) = res.items
+        self.assertEqual(len(pre_ast.items), 0)
+        # the loop is unrolled and merged
+        self.assertEqual([item.tag for item in main_ast.items],
+                         ['cmdlist', 'async'])
+        loop_ast = main_ast.items[0]
+        self.assertEqual([item.tag for item in loop_ast.items],
+                         ['sync'] * 6)
+
+        # unchanged subtrees are shared with the AST decoded...
+        body = ast.items[1].items[0].items[0].items[3]
+        exec_ast = body.items[0].items[0]
+        for item in loop_ast.items[0:6:2]:
+            self.assertIs(item.items[0].items[2], exec_ast.items[2])
+        # ...but commands are copied, so each one executed has its own
+        # serial number
+        execs = [item.items[0] for item in loop_ast.items]
+        self.assertEqual(len(set([id(item) for item in execs])), len(execs))
+        self.assertNotIn(exec_ast, execs)
+
+        # decoding again gives the same result
+        res2 = self.decode(ast, dict(OBE_ID='TEST', EXPTIME=10))
+        self.assertEqual(str(res2), str(res))
+
+    def test_unchanged(self):
+        ast = ASTNode('star_if',
+                      ASTNode('cond', True,
+                              ASTNode('cmdlist', ASTNode('nop'))))
+        wrapper = ASTNode('sync', ast)
+        params = ASTNode('param_list')
+        res = self.decode(ASTNode('cmdlist', params, wrapper), {})
+        self.assertIs(res.items[0], params)
+        self.assertEqual(res.items[1].tag, 'sync')
+        self.assertEqual(res.items[1].items[0].tag, 'block_merge')
+
+        ast = ASTNode('param_list',
+                      ASTNode('key_value_pair', 'A', ASTNode('number', 1)))
+        res = self.decode(ast, {})
+        self.assertEqual(str(res), str(ast))
+        self.assertIs(res.items[0], ast.items[0])
+        empty = ASTNode('block')
+        self.assertEqual(self.decode(empty, {}).tag, 'block_merge')
+
+    def test_fresh_root(self):
+        ast = ASTNode('command_section',
+                      *[ASTNode('cmdlist',
+                                ASTNode('sync',
+                                        ASTNode('raise',
+                                                ASTNode('number', i))))
+                        for i in range(3)])
+        # (decoding leaves all of it unchanged)
+        decoder = self.make_decoder({})
+        self.assertIs(decoder._decode(ast, decoder.eval), ast)
+
+        # the root of each decoding identifies it, even if nothing in the
+        # skeleton is changed by decoding
+        res1 = self.decode(ast, dict(OBE_ID='TEST'))
+        res2 = self.decode(ast, dict(OBE_ID='TEST'))
+        self.assertEqual(str(res1), str(res2))
+        for res in (res1, res2):
+            self.assertIsNot(res, ast)
+            self.assertNotEqual(res.serial_num, ast.serial_num)
+        self.assertIsNot(res1, res2)
+        self.assertNotEqual(res1.serial_num, res2.serial_num)
+
+    def test_lazy_for(self):
+        skbunch = self.parser.parse_skbuf(loop_sk)
+        self.assertEqual(skbunch.errors, 0)
+        ast = skbunch.ast.items[1]
+
+        decoder = self.make_decoder(dict(OBE_ID='TEST'))
+        main_ast = decoder.decode(ast, decoder.eval).items[1]
+        self.assertEqual(decoder.eval.frame_id_source.allocated, 3)
+        res1 = self.flatten(decoder, main_ast, [])
+
+        decoder = self.make_decoder(dict(OBE_ID='TEST'), lazy_for=True)
+        main_ast = decoder.decode(ast, decoder.eval).items[1]
+        self.assertEqual(decoder.deferred, 1)
+        # the first loop is left for execution, not the one that sets
+        # variables
+        loop_ast = main_ast.items[0].items[0]
+        self.assertEqual(loop_ast.tag, 'deferred_for')
+        self.assertIn('*FOR 3 I J', loop_ast.AST2str())
+        self.assertEqual(decoder.eval.frame_id_source.allocated, 0)
+
+        # the iterations are decoded as they are reached
+        items = decoder.expand(main_ast.items[0].items)
+        item = next(items)
+        self.assertIn('POS=1 OFFSET=2 FRAME=SUPA00000001 ;', item.AST2str())
+        self.assertEqual(decoder.eval.frame_id_source.allocated, 1)
+
+        # and the statements are those unrolling gives
+        decoder = self.make_decoder(dict(OBE_ID='TEST'), lazy_for=True)
+        main_ast = decoder.decode(ast, decoder.eval).items[1]
+        res2 = self.flatten(decoder, main_ast, [])
+        self.assertEqual(res2, res1)
+        self.assertIn('EXEC TSC WAIT TIME=2 ,', res2)
+        self.assertEqual(res2[-3:-1], ['EXEC TSC WAIT TIME=5 ;',
+                                       'EXEC TSC WAIT TIME=3 ;'])
+
+    def test_lazy_for_text(self):
+        skbunch = self.parser.parse_skbuf(loop_sk)
+        self.assertEqual(skbunch.errors, 0)
+        loop_ast = skbunch.ast.items[1].items[1].items[0].items[0]
+        self.assertEqual(loop_ast.tag, 'star_for')
+
+        decoder = self.make_decoder(dict(OBE_ID='TEST'), lazy_for=True)
+        main_ast = decoder.decode(skbunch.ast.items[1], decoder.eval).items[1]
+        deferred_ast = main_ast.items[0].items[0]
+        self.assertEqual(deferred_ast.tag, 'deferred_for')
+
+        # the text issued for the deferred loop parses back to the loop
+        text = sk_common.IssueAST().issue(deferred_ast)
+        self.assertIn('*FOR 3 I J IN "1 2 3 4 5 6"', text)
+        skbunch2 = self.parser.parse_skbuf(text_sk % text)
+        self.assertEqual(skbunch2.errors, 0)
+        loop_ast2 = skbunch2.ast.items[1].items[1].items[0].items[0]
+        self.assertEqual(loop_ast2.tag, 'star_for')
+        self.assertEqual(str(loop_ast2.items[3]), str(loop_ast.items[3]))
+
+        # and unrolls to the same statements
+        res = []
+        for ast in (loop_ast, loop_ast2):
+            decoder = self.make_decoder(dict(OBE_ID='TEST', X=2))
+            res.append(str(decoder.decode(ast, decoder.eval)))
+        self.assertEqual(res[0], res[1])
+
+    def test_lazy_for_reload(self):
+        topdir = tempfile.TemporaryDirectory()
+        self.addCleanup(topdir.cleanup)
+        moddir = os.path.join(topdir.name, 'TEST', 'sk', 'MODE')
+        os.makedirs(moddir)
+        steppath = os.path.join(moddir, 'STEP.sk')
+        with open(steppath, 'w') as out_f:
+            out_f.write(step_sk % 1)
+
+        sk_bank = sk_interp.skBank(topdir.name, logger=logger, check_ttl=0,
+                                   lazy_for=True)
+        skbunch = self.parser.parse_skbuf(sub_loop_sk)
+        self.assertEqual(skbunch.errors, 0)
+        decoder = self.make_decoder(dict(OBE_ID='TEST'), lazy_for=True,
+                                    sk_bank=sk_bank)
+        main_ast = decoder.decode(skbunch.ast.items[1], decoder.eval).items[1]
+        self.assertEqual(decoder.deferred, 1)
+
+        # the sk file called in the loop is looked up when the loop is
+        # decoded...
+        self.assertIn(('TEST', 'MODE', 'STEP'), decoder.sk_pins)
+        items = decoder.expand(main_ast.items[0].items)
+        res = [next(items).AST2str()]
+
+        # ...and modifying it while the loop runs does not change the
+        # iterations left
+        with open(steppath, 'w') as out_f:
+            out_f.write(step_sk % 22)
+        self.assertEqual(sk_bank.lookup('TEST', 'MODE', 'STEP').version, 2)
+        res.extend([item.AST2str() for item in items])
+        self.assertEqual(len(res), 3)
+        for i in range(3):
+            self.assertIn('POS=%d VERSION=1 ;' % (i + 1), res[i])
+
+        # a new decoding gets the new version
+        decoder = self.make_decoder(dict(OBE_ID='TEST'), lazy_for=True,
+                                    sk_bank=sk_bank)
+        main_ast = decoder.decode(skbunch.ast.items[1], decoder.eval).items[1]
+        text = '\n'.join(self.flatten(decoder, main_ast, []))
+        self.assertIn('EXEC TSC MOVE POS=1 VERSION=22 ;', text)
+        self.assertNotIn('VERSION=1 ', text)
+
+
+class DecodeCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.topdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.topdir.cleanup)
+        moddir = os.path.join(self.topdir.name, 'TEST', 'sk', 'MODE')
+        os.makedirs(moddir)
+        self.steppath = os.path.join(moddir, 'STEP.sk')
+        self.write_step(1)
+        for (abscmd, stmt) in (('TOP', ''),
+                               ('EXPOSE',
+                                'EXEC SUP EXPOSE FRAME=&GET_F_NO[SUP A] ;')):
+            with open(os.path.join(moddir, abscmd + '.sk'), 'w') as out_f:
+                out_f.write(cached_sk % stmt)
+
+        self.sk_bank = sk_interp.skBank(self.topdir.name, logger=logger,
+                                        check_ttl=0, memo_decode=True)
+        self.status = {'TEST.POS': 5}
+        self.frames = FakeFrameSource(count=True)
+
+    def write_step(self, version):
+        with open(self.steppath, 'w') as out_f:
+            out_f.write(step_sk % version)
+
+    def decode(self, abscmd):
+        """Decodes the sk file (abscmd) through the decode cache, as
+        interpTask does.
+        """
+        skbunch = self.sk_bank.lookup('TEST', 'MODE', abscmd)
+        self.assertEqual(skbunch.errors, 0)
+        evaluator = sk_interp.Evaluator(
+            sk_interp.VariableResolver(dict(OBE_ID='TEST')),
+            sk_interp.RegisterResolver(),
+            sk_interp.StatusResolver(FakeStatus(self.status)),
+            self.frames, logger)
+        decoder = sk_interp.Decoder(evaluator, self.sk_bank, logger)
+        key = ('TEST', 'MODE', abscmd, skbunch.version)
+        res = self.sk_bank.decode_cache.decode(decoder, skbunch.ast.items[1],
+                                               evaluator, key)
+        return res.AST2str()
+
+    def test_hit(self):
+        cache = self.sk_bank.decode_cache.cache
+        res1 = self.decode('TOP')
+        self.assertIn('EXEC TSC MOVE POS=1 VERSION=1 ;', res1)
+        self.assertNotIn('WAIT', res1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.hits, 0)
+
+        res2 = self.decode('TOP')
+        self.assertEqual(res2, res1)
+        self.assertEqual(cache.hits, 1)
+
+        # a different value of the status read is another variant
+        self.status['TEST.POS'] = 6
+        self.assertIn('EXEC TSC WAIT TIME=6 ;', self.decode('TOP'))
+        self.assertEqual(len(cache.peek(cache.keys()[0])), 2)
+        self.status['TEST.POS'] = 5
+        self.assertEqual(self.decode('TOP'), res1)
+
+    def test_sk_version(self):
+        self.decode('TOP')
+        # the sk file called by *SUB is reloaded, so the result cached
+        # for the older version is not reused
+        self.write_step(22)
+        res = self.decode('TOP')
+        self.assertIn('EXEC TSC MOVE POS=1 VERSION=22 ;', res)
+        self.assertEqual(self.decode('TOP'), res)
+
+    def test_frames(self):
+        res1 = self.decode('EXPOSE')
+        self.assertIn('FRAME=SUPA00000001 ;', res1)
+        self.assertEqual(len(self.sk_bank.decode_cache.cache), 0)
+
+        # frame numbers are never reused
+        res2 = self.decode('EXPOSE')
+        self.assertIn('FRAME=SUPA00000002 ;', res2)
+        self.assertEqual(self.frames.allocated, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+# test_sk_eval.py
+
+import unittest
+import tempfile
+import pickle
+import logging
+
+from oscript.parse import sk_lexer, sk_parser, sk_interp, sk_common
+from oscript.parse.sk_common import ASTNode, skError
+from oscript.tests.sk_fakes import FakeStatus, FakeFrameSource
+
+logger = logging.getLogger('sk.test')
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.CRITICAL)
+
+# Expressions, as parameter values of a command line
+exprs = [
+    '(1 + 2 * $X)', '(($X - 1) / 4)', '(-$X)', '(+$X)',
+    '($X > 2 AND NOT $Y == 0)', '($X < 2 OR $Y != 0)', '($X >= 3)',
+    '($X <= 3)', '($X OR 0)', '($Y AND 1)',
+    'SIN(30)', 'COS($X)', 'TAN(45)', 'INT("3")', 'FLOAT($X)',
+    'IDX(LIST(1, 2, $X), 1)', 'APPLY(ATTR("abc", "upper"))',
+    'DICT(A=1, B=$X)', 'FORMAT("%s-%s", 1, $Y)',
+    'APPLY(@F, 1, K=2)', '@F(1, K=$X)', '@G()',
+    '@R', '!STATS.RA', '&GET_F_NO[SUP A]', 'FRAME("SUP", "A")',
+    '"a $X b !STATS.RA"', "'single $X'", '[1 $X]', 'abc', '12.5',
+    # errors
+    '(1 / 0)', '$NOPE', '@NOPE', '!NOPE', 'FOO(1)', '("a" - 1)',
+    ]
+
+
+class Evaluator(sk_interp.Evaluator):
+    """Evaluates by walking the tree only."""
+    eval = sk_interp.Evaluator.interpret
+
+
+class SkEvalTestCase(unittest.TestCase):
+
+    def setUp(self):
+        lexer = sk_lexer.skScanner(logger=logger, debug=False,
+                                   lextab='scan2_tab')
+        self.parser = sk_parser.opeParser(lexer, logger=logger)
+        self.parser.build()
+
+    def make_evaluator(self, klass):
+        registers = sk_interp.RegisterResolver()
+        registers.set(R=5, F=lambda *args, **kwdargs: (args, kwdargs),
+                      G=lambda: 'g')
+        status = sk_interp.MockStatusResolver({'STATS.RA': 10.5})
+        evaluator = klass(sk_interp.VariableResolver(dict(X=3, Y=0)),
+                          registers, status, FakeFrameSource(), logger)
+        return evaluator
+
+    def parse_expr(self, expr):
+        (errors, ast, errinfo) = self.parser.parse_opecmd(
+            'EXEC A B K=%s' % (expr))
+        self.assertEqual(errors, 0, expr)
+        return ast.items[0].items[2].items[0].items[1]
+
+    def evaluate(self, evaluator, ast):
+        try:
+            return ('ok', evaluator.eval(ast))
+        except Exception as e:
+            return ('error', type(e), str(e))
+
+    def test_exprs(self):
+        compiled = self.make_evaluator(sk_interp.Evaluator)
+        interpreted = self.make_evaluator(Evaluator)
+
+        for expr in exprs:
+            ast = self.parse_expr(expr)
+            res1 = self.evaluate(interpreted, ast)
+            self.assertFalse(hasattr(ast, 'compiled'))
+            # twice, the second time from the cached compiled form
+            for i in range(2):
+                res2 = self.evaluate(compiled, ast)
+                self.assertEqual(res1, res2, msg=expr)
+
+    def test_resolvers(self):
+        # compiled forms resolve through the evaluator they are called with
+        ast = self.parse_expr('(1 + $X)')
+        evaluator1 = self.make_evaluator(sk_interp.Evaluator)
+        evaluator2 = evaluator1.clone()
+        evaluator2.set_var('X', 10)
+        self.assertEqual(evaluator1.eval(ast), 4.0)
+        self.assertEqual(evaluator2.eval(ast), 11.0)
+
+    def test_malformed(self):
+        evaluator = self.make_evaluator(sk_interp.Evaluator)
+        ast = ASTNode('dyad', ASTNode('number', 1), '%',
+                      ASTNode('number', 2))
+        self.assertRaises(skError, evaluator.eval, ast)
+        self.assertEqual(evaluator.eval(ASTNode('nop')).tag, 'nop')
+
+    def test_interpolate(self):
+        evaluator = self.make_evaluator(sk_interp.Evaluator)
+        for (stg, res) in (
+            ('', ''), ('plain', 'plain'),
+            ('a $X b !STATS.RA @R', 'a 3 b 10.5 5'),
+            ('&GET_F_NO[SUP A] &get_f_no[SUP A 3]',
+             'SUPA00000001 SUPA00000001'),
+            ('\\$X \\\\ x\\', '$X \\ x'),
+            # the newline ending the string is dropped after a reference
+            ('$X\n', '3'), ('X\n', 'X\n')):
+            self.assertEqual(evaluator.eval_string_interpolate(stg), res)
+            self.assertEqual(evaluator.eval_string_interpolate(stg), res)
+
+        self.assertEqual(evaluator.eval_string_interpolate('$X !A @R',
+                                                           vars_only=True),
+                         '3 !A @R')
+        for stg in ('$X $', '$X\n\n', 'a $NOPE', '&GET_F_NO[]'):
+            self.assertRaises(skError, evaluator.eval_string_interpolate,
+                              stg)
+
+        self.assertEqual(sk_interp.parse_template('a $X\\! b'),
+                         ['a ', ('$', ('X',)), '! b'])
+
+    def test_collect_aliases(self):
+        ast = self.parse_expr('(!A.B + !C * !A.B > IDX(LIST(!D), 0) '
+                              'AND "x !E $X" == [!F])')
+        self.assertEqual(sk_interp.collect_aliases(ast),
+                         ('A.B', 'C', 'D', 'E', 'F'))
+        self.assertEqual(sk_interp.collect_aliases(ast),
+                         ('A.B', 'C', 'D', 'E', 'F'))
+        self.assertEqual(sk_interp.collect_aliases(self.parse_expr('$X')),
+                         ())
+
+    def test_status_snapshot(self):
+        fake = FakeStatus({'A': 1, 'B': 2, 'C': 3})
+        status = sk_interp.StatusResolver(fake)
+        status.push(('A', 'B'))
+        fake.values['A'] = 10
+        self.assertEqual((status.get('A'), status.get('B')), (1, 2))
+        # nested snapshots only fetch new aliases
+        status.push(('A', 'C'))
+        self.assertEqual((status.get('A'), status.get('C')), (1, 3))
+        status.pop()
+        status.pop()
+        self.assertEqual(status.get('A'), 10)
+        self.assertEqual(fake.calls, [('A', 'B'), ('C',), 'A'])
+
+    def test_classify(self):
+        for (expr, kind) in (('(1 + $X * SIN(30))', sk_common.EXPR_PURE),
+                             ('"a $X"', sk_common.EXPR_PURE),
+                             ('($X > !A)', sk_common.EXPR_STATUS),
+                             ('"a !A"', sk_common.EXPR_STATUS),
+                             ('&GET_F_NO[SUP A]', sk_common.EXPR_FRAME),
+                             ('FRAME("SUP", "A")', sk_common.EXPR_FRAME),
+                             ('(@R + 1)', sk_common.EXPR_VOLATILE),
+                             ('@F()', sk_common.EXPR_VOLATILE),
+                             ('IDX($X, 0)', sk_common.EXPR_VOLATILE)):
+            self.assertEqual(sk_common.classify_expr(self.parse_expr(expr)),
+                             kind, msg=expr)
+
+    def test_memo_pure(self):
+        evaluator1 = self.make_evaluator(sk_interp.Evaluator)
+        evaluator2 = evaluator1.clone()
+        cls1 = sk_interp.make_closure(self.parse_expr('(1 + $X)'),
+                                      evaluator1)
+        evaluator2.set_var('Y', cls1)
+        cls2 = sk_interp.make_closure(self.parse_expr('(2 * $Y)'),
+                                      evaluator2)
+        self.assertEqual(cls2.thaw(), 8.0)
+        self.assertIsNotNone(cls1.memo)
+        self.assertIsNotNone(cls2.memo)
+        self.assertEqual(cls2.thaw(), 8.0)
+
+        # a change of the variables read, directly or not, is seen
+        evaluator1.set_var('X', 5)
+        self.assertEqual(cls2.thaw(), 12.0)
+        evaluator2.set_var('Y', 1)
+        self.assertEqual(cls2.thaw(), 2.0)
+
+    def test_memo_status(self):
+        fake = FakeStatus({'A': 1})
+        evaluator = self.make_evaluator(sk_interp.Evaluator)
+        evaluator.status = sk_interp.StatusResolver(fake)
+        cls = sk_interp.make_closure(self.parse_expr('(!A + $X)'),
+                                     evaluator)
+        evaluator.set_var('Y', cls)
+        cls2 = sk_interp.make_closure(self.parse_expr('(1 + $Y)'),
+                                      evaluator)
+
+        # outside a snapshot scope, status is read each time
+        self.assertEqual(cls2.thaw(), 5.0)
+        self.assertEqual(cls2.thaw(), 5.0)
+        self.assertEqual(fake.calls, ['A', 'A'])
+
+        evaluator.status.push()
+        self.assertEqual(cls2.thaw(), 5.0)
+        fake.values['A'] = 2
+        self.assertEqual(cls2.thaw(), 5.0)
+        self.assertEqual(cls.thaw(), 4.0)
+        evaluator.status.pop()
+        self.assertEqual(fake.calls, ['A', 'A', 'A'])
+
+        evaluator.status.push()
+        self.assertEqual(cls2.thaw(), 6.0)
+        evaluator.status.pop()
+
+    def test_memo_scope(self):
+        # the status_scope setting of the bank decides whether status
+        # closures are memoized while a task evaluates a statement
+        for (scope, calls) in ((None, ['A', 'A']), ('statement', ['A'])):
+            sk_bank = sk_interp.skBank(tempfile.gettempdir(), logger=logger,
+                                       status_scope=scope)
+            fake = FakeStatus({'A': 1})
+            evaluator = self.make_evaluator(sk_interp.Evaluator)
+            evaluator.status = sk_interp.StatusResolver(fake)
+            cls = sk_interp.make_closure(self.parse_expr('(!A + 1)'),
+                                         evaluator)
+
+            with sk_interp.status_snapshot(evaluator.status,
+                                           sk_bank.status_scope):
+                self.assertEqual(cls.thaw(), 2)
+                fake.values['A'] = 2
+                val = cls.thaw()
+            self.assertEqual(fake.calls, calls)
+            if scope is None:
+                # re-fetched
+                self.assertEqual(val, 3)
+                self.assertIsNone(cls.memo)
+            else:
+                self.assertEqual(val, 2)
+
+    def test_memo_volatile(self):
+        evaluator = self.make_evaluator(sk_interp.Evaluator)
+        for expr in ('&GET_F_NO[SUP A]', '@R'):
+            cls = sk_interp.make_closure(self.parse_expr(expr), evaluator)
+            evaluator.set_var('Y', cls)
+            cls2 = sk_interp.make_closure(self.parse_expr('"a $Y"'),
+                                          evaluator)
+            cls2.thaw()
+            self.assertIsNone(cls.memo)
+            self.assertIsNone(cls2.memo)
+
+    def test_clone(self):
+        evaluator1 = self.make_evaluator(sk_interp.Evaluator)
+        evaluator2 = evaluator1.clone()
+        evaluator3 = evaluator2.clone()
+        self.assertIs(evaluator2.variables.variable_map,
+                      evaluator1.variables.variable_map)
+
+        # assignments are seen only by the evaluator making them
+        evaluator2.set_var('X', 10)
+        evaluator1.set_vars(dict(Y=1))
+        self.assertEqual([(ev.variables.get('X'), ev.variables.get('Y'))
+                          for ev in (evaluator1, evaluator2, evaluator3)],
+                         [(3, 1), (10, 0), (3, 0)])
+        self.assertEqual(evaluator3.eval_string_interpolate('$X @R'), '3 5')
+
+        # registers pushed by a clone are its own, the ribs are shared
+        evaluator2.registers.push(dict(R=6, S=1))
+        self.assertEqual(evaluator2.registers.get('R'), 6)
+        self.assertRaises(skError, evaluator1.registers.get, 'S')
+        evaluator3.registers.set(R=7)
+        self.assertEqual(evaluator1.registers.get('R'), 7)
+        evaluator2.registers.pop()
+        self.assertEqual(evaluator2.registers.get('R'), 7)
+
+    def test_registers(self):
+        registers = sk_interp.RegisterResolver()
+        registers.set(A=1, B=2)
+        registers.push(dict(B=3))
+        registers.push(dict(C=4))
+        self.assertEqual([registers.get(key) for key in ('A', 'b', 'C')],
+                         [1, 3, 4])
+        self.assertEqual(registers.get('USER'), '@USER')
+        self.assertRaises(skError, registers.get, 'D')
+
+        # assignments go to the innermost scope defining the register,
+        # and define new registers in the current scope
+        registers.set(A=5, B=6, D=7)
+        registers.pop()
+        self.assertEqual([registers.get(key) for key in ('A', 'B')], [5, 6])
+        self.assertRaises(skError, registers.get, 'D')
+        registers.pop()
+        self.assertEqual([registers.get(key) for key in ('A', 'B')], [5, 2])
+
+        # a clone sees the assignments to the scopes it shares
+        registers2 = registers.clone()
+        registers.push({})
+        registers.set(A=8)
+        registers2.set(A=9)
+        self.assertEqual(registers.get('A'), 9)
+
+        # a register defined after it was looked up in vain is found
+        registers2.push({})
+        self.assertRaises(skError, registers2.get, 'E')
+        registers.set(E=10)
+        self.assertRaises(skError, registers2.get, 'E')
+        registers2.pop()
+        registers2.set(E=11)
+        self.assertEqual(registers.get('E'), 10)
+        registers.pop()
+        self.assertEqual(registers.get('E'), 11)
+
+    def test_pickle(self):
+        evaluator = self.make_evaluator(sk_interp.Evaluator)
+        ast = self.parse_expr('(1 + $X)')
+        evaluator.eval(ast)
+        ast2 = pickle.loads(pickle.dumps(ast))
+        self.assertFalse(hasattr(ast2, 'compiled'))
+        self.assertEqual(ast2.serial_num, ast.serial_num)
+        self.assertEqual(str(ast2), str(ast))
+        self.assertEqual(evaluator.eval(ast2), 4.0)
+
+    def test_visitor(self):
+        class MyIssueAST(sk_common.IssueAST):
+            def issue_number(self, ast):
+                return 'N'
+
+        ast = self.parse_expr('(1 + $X)')
+        self.assertEqual(sk_common.IssueAST().issue(ast), '(1 + $X)')
+        self.assertEqual(MyIssueAST().issue(ast), '(N + $X)')
+        # tags without a method of their own get the default one
+        issuer = MyIssueAST()
+        self.assertIs(issuer.visit_method('no_such_tag'),
+                      sk_common.IssueAST.issue_default)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# test_sk_incremental.py
+
+import unittest
+import logging
+
+from oscript.parse import sk_lexer, sk_parser
+
+logger = logging.getLogger('sk.test')
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.CRITICAL)
+
+test_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+OBE_ID=TEST
+EXPTIME=10.5
+:COMMAND
+:START
+# comment
+*SET VAL=!STATS.RA
+ASN X=1, Y=$EXPTIME * 2
+:MAIN_START
+EXEC TSC MOVE RA=!STATS.RA DEC=-5 ;
+*IF $X > 2
+    EXEC TSC WAIT TIME=3 ;
+*ENDIF
+*FOR 3 I IN
+    EXEC OBS EXPOSE INDEX=$I ;
+*ENDFOR
+EXEC TSC WAIT TIME=4 ;
+:MAIN_END
+:END
+'''
+
+# Edits as (old text, new text, expected kind of reparse), each applied
+# to the result of the previous ones
+edits = [
+    ('DEC=-5', 'DEC=-7 SPEED=FAST', 'statement'),
+    ('TIME=3 ;', 'TIME=3 ;\n    EXEC TSC WAIT TIME=30 ;', 'statement'),
+    ('INDEX=$I', 'INDEX=$I\n        NAME="x"', 'statement'),
+    ('EXEC TSC WAIT TIME=4 ;\n', '', 'statement'),
+    ('*SET VAL=!STATS.RA', '*SET VAL=!STATS.DEC', 'section'),
+    # follows a *SET, which could take it as more parameters
+    ('ASN X=1', 'ASN X=2', 'section'),
+    # edits of the section markers
+    (':END\n', 'EXEC TSC WAIT TIME=9 ;\n:END\n', 'full'),
+    ('# comment\n', '', 'section'),
+    ('EXEC TSC WAIT TIME=9 ;\n', '', 'statement'),
+    # errors are reported by a full parse
+    ('TIME=30', 'TIME=(30', 'full'),
+    ('TIME=(30', 'TIME=30', 'full'),
+    ('OBS_MOD=TEST', 'OBS_MOD=TEST2', 'full'),
+    ('EXPTIME=10.5', 'EXPTIME=11', 'full'),
+    (':MAIN_END', ':MAIN_END\n', 'full'),
+    ]
+
+
+class SkIncrementalTestCase(unittest.TestCase):
+
+    def setUp(self):
+        lexer = sk_lexer.skScanner(logger=logger, debug=False,
+                                   lextab='scan3_tab')
+        self.parser = sk_parser.skParser(lexer, logger=logger)
+        self.parser.build()
+
+    def assertSameParse(self, res):
+        full = self.parser.parse_skbuf(res.incr.buf, incremental=True)
+        self.assertEqual(res.errors, full.errors)
+        self.assertEqual(str(res.ast), str(full.ast))
+        self.assertEqual([(bnch.lineno, bnch.errstr) for bnch in res.errinfo],
+                         [(bnch.lineno, bnch.errstr)
+                          for bnch in full.errinfo])
+        self.assertEqual(res.params, full.params)
+        self.assertEqual(res.incr.markers, full.incr.markers)
+        self.assertEqual(res.incr.statements, full.incr.statements)
+
+    def edit(self, res, old, new):
+        buf = res.incr.buf
+        start = buf.index(old)
+        return self.parser.reparse_skbuf(res, start, start + len(old), new)
+
+    def test_edits(self):
+        res = self.parser.parse_skbuf(test_sk, incremental=True)
+        self.assertEqual(res.errors, 0)
+        self.assertEqual(res.incr.reparsed, 'full')
+
+        for (old, new, reparsed) in edits:
+            res = self.edit(res, old, new)
+            self.assertEqual(res.incr.reparsed, reparsed, msg=new)
+            self.assertSameParse(res)
+
+    def test_errinfo(self):
+        res = self.parser.parse_skbuf(test_sk, incremental=True)
+        res = self.edit(res, 'DEC=-5 ;', 'DEC=-5 ;\n\n\nEXEC TSC (')
+        self.assertGreater(res.errors, 0)
+        self.assertEqual(res.incr.reparsed, 'full')
+        self.assertSameParse(res)
+
+        # fixing the error parses the file in full again
+        res = self.edit(res, 'EXEC TSC (', '')
+        self.assertEqual(res.errors, 0)
+        self.assertSameParse(res)
+
+    def test_joined(self):
+        # an edit that joins two statements into one
+        res = self.parser.parse_skbuf(test_sk, incremental=True)
+        res = self.edit(res, 'DEC=-5 ;', 'DEC=-5')
+        self.assertSameParse(res)
+
+        # a statement that may continue onto the next line
+        res = self.parser.parse_skbuf(test_sk, incremental=True)
+        res = self.edit(res, 'ASN X=1, Y=$EXPTIME * 2', 'ASN X=1, Y=$EXPTIME')
+        self.assertSameParse(res)
+        res = self.edit(res, '*SET VAL=!STATS.RA', '*SET VAL=!STATS.RA\n')
+        self.assertSameParse(res)
+
+    def test_empty_section(self):
+        res = self.parser.parse_skbuf(test_sk, incremental=True)
+        start = res.incr.buf.index('EXEC TSC MOVE')
+        end = res.incr.buf.index(':MAIN_END')
+        res = self.parser.reparse_skbuf(res, start, end, '')
+        self.assertEqual(res.ast.items[1].items[1].tag, 'nop')
+        self.assertSameParse(res)
+
+        res = self.parser.reparse_skbuf(res, start, start,
+                                        'EXEC TSC WAIT TIME=1 ;\n')
+        self.assertEqual(res.ast.items[1].items[1].tag, 'cmdlist')
+        self.assertSameParse(res)
+
+        start = res.incr.buf.index(':END')
+        res = self.parser.reparse_skbuf(res, start, start,
+                                        'EXEC TSC WAIT TIME=2 ;\n')
+        self.assertEqual(res.incr.reparsed, 'section')
+        self.assertEqual(res.ast.items[1].items[2].tag, 'cmdlist')
+        self.assertSameParse(res)
+
+
+if __name__ == '__main__':
+    unittest.main()
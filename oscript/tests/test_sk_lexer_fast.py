@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# test_sk_lexer_fast.py
+
+import unittest
+import random
+import logging
+
+from oscript.parse import sk_lexer, sk_parser
+
+logger = logging.getLogger('sk.test')
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.CRITICAL)
+
+test_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+OBE_ID=TEST
+OBE_MODE=TEST
+EXPTIME=10.5
+NAME="a string"
+:COMMAND
+:START
+# comment
+*SET -ALIASOFF VAL=!STATS.RA
+*set nums=[1 2 3]
+asn x=1, Y=$EXPTIME * 2
+FROM "os.path" IMPORT join, split
+DEF DOUBLE(A) {
+    RETURN $A * 2
+}
+:MAIN_START
+EXEC TSC MOVE RA=!STATS.RA DEC=-5 MODE=(1 + 2) \\
+    SPEED=fast ;
+RET1 = EXEC OBS CHECK FRAME=&GET_F_NO[SUP A] ;
+*SUB SETUP OBE_ID=$OBE_ID OBE_MODE=$OBE_MODE POS=@DOUBLE(3) ;
+*IF $COUNT > 2 AND NOT $EXPTIME == 0
+    EXEC TSC WAIT TIME=3 ;
+*ELIF $COUNT < 0 OR $COUNT >= 10 or $X != 1 and $X <= 1
+    EXEC TSC WAIT TIME=4 NAME='single' ;
+*ENDIF
+*FOR 0 A B IN "1 2 3 4"
+    EXEC OBS EXPOSE A=$A B=$B ;
+*ENDFOR
+:MAIN_END
+:END
+'''
+
+# Pieces the random corpus is built from
+fragments = [
+    'EXEC', 'exec', 'Asn', 'if', 'ELIF', 'else', 'EndIf', 'WHILE', 'raise',
+    'catch', 'def', 'return', 'from', 'import', 'let', 'in', 'and', 'or',
+    'not', ':START', ':MAIN_START', ':MAIN_END', ':END', ':start',
+    '*IF', '*elif', '*ELSE', '*ENDIF', '*SET', '*sub', '*FOR', '*ENDFOR',
+    '&GET_F_NO', '&get_f_no', 'foo', 'Foo.Bar', 'a1:b2', 'X_Y', '0', '12',
+    '1.5', '3.', '.25', '1.2.3', '1e5', '0x1F', '007', '$VAR', '$var.x',
+    '!STATS.RA', '!tsc.az', '@REG', '@_r1', '=', '==', '!=', '>', '>=',
+    '<', '<=', '+', '-', '*', '/', '(', ')', '{', '}', '[', ']', ',', ';',
+    '"a string"', '"esc \\" quote"', '"line\\\ncont"', "'single'",
+    "'it\\'s'", '[1 2 3]', '[a\nb]', '#comment\n', '# x = 1 ;\n',
+    '\\\n', '\n', '\n\n\n', ' ', '\t', '  \t ',
+    ]
+
+# Pieces that are not valid tokens
+bad_fragments = ['%', '?', '^', '~', '"unterminated\n', "`"]
+
+
+def make_corpus(count, seed=42):
+    rnd = random.Random(seed)
+    res = []
+    for i in range(count):
+        pieces = []
+        for j in range(rnd.randint(1, 60)):
+            pieces.append(rnd.choice(fragments))
+            if rnd.random() < 0.5:
+                pieces.append(' ')
+        # some of the buffers contain a scan error
+        if rnd.random() < 0.2:
+            pieces.insert(rnd.randint(0, len(pieces)),
+                          rnd.choice(bad_fragments))
+        res.append(''.join(pieces))
+    return res
+
+
+class SkFastScannerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.ply_scanner = sk_lexer.skScanner(logger=logger, debug=False,
+                                              lextab='scan3_tab')
+        self.fast_scanner = sk_lexer.skFastScanner(logger=logger,
+                                                   debug=False,
+                                                   lextab='scan3_tab')
+
+    def scan(self, scanner, buf, startline=1):
+        (errors, tokens, errinfo) = scanner.tokenize(buf,
+                                                     startline=startline)
+        tokens = [(tok.type, tok.value, tok.lineno, tok.lexpos)
+                  for tok in tokens]
+        errinfo = [(bnch.lineno, bnch.errstr, bnch.token.lexpos)
+                   for bnch in errinfo]
+        return (errors, tokens, errinfo, scanner.lexer.lineno)
+
+    def assertSameScan(self, buf, startline=1):
+        res1 = self.scan(self.ply_scanner, buf, startline=startline)
+        res2 = self.scan(self.fast_scanner, buf, startline=startline)
+        self.assertEqual(res1, res2, msg=repr(buf))
+
+    def test_skeleton(self):
+        self.assertSameScan(test_sk)
+        self.assertSameScan(test_sk, startline=10)
+
+    def test_corpus(self):
+        for buf in make_corpus(2000):
+            self.assertSameScan(buf)
+
+    def test_edges(self):
+        for buf in ('', ' ', '\n', ' \t\n \t', '%', ' %', '\n\n%', 'A %',
+                    'A\\\nB', '#no newline', '"', "'", '[', '1.2.3.',
+                    'ABC ' * 1000, 'caf\u00e9 \u017fet \u212a', '\u00e9'):
+            self.assertSameScan(buf)
+
+    def test_token_interface(self):
+        self.fast_scanner.reset(lineno=5)
+        self.fast_scanner.input('EXEC A\nB')
+        tok = self.fast_scanner.token()
+        self.assertEqual((tok.type, tok.value, tok.lineno),
+                         ('EXEC', 'EXEC', 5))
+        self.fast_scanner.token()
+        tok = self.fast_scanner.token()
+        self.assertEqual((tok.type, tok.value, tok.lineno), ('ID', 'B', 6))
+        self.assertEqual(self.fast_scanner.lexer.lineno, 6)
+        self.assertIsNone(self.fast_scanner.token())
+        self.assertIsNone(self.fast_scanner.token())
+
+    def test_parse(self):
+        parser1 = sk_parser.skParser(self.ply_scanner, logger=logger)
+        parser1.build()
+        parser2 = sk_parser.skParser(self.fast_scanner, logger=logger)
+        parser2.build()
+
+        res1 = parser1.parse_skbuf(test_sk)
+        res2 = parser2.parse_skbuf(test_sk)
+        self.assertEqual(res1.errors, 0)
+        self.assertEqual(res2.errors, 0)
+        self.assertEqual(res1.ast.AST2str(), res2.ast.AST2str())
+
+        # error reporting goes through the same paths
+        buf = test_sk.replace('EXEC TSC WAIT TIME=3', 'EXEC TSC % TIME=3')
+        res1 = parser1.parse_skbuf(buf)
+        res2 = parser2.parse_skbuf(buf)
+        self.assertGreater(res1.errors, 0)
+        self.assertEqual(res1.errors, res2.errors)
+        self.assertEqual([(bnch.lineno, bnch.errstr) for bnch in res1.errinfo],
+                         [(bnch.lineno, bnch.errstr) for bnch in res2.errinfo])
+
+
+if __name__ == '__main__':
+    unittest.main()
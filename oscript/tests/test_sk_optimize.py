@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# test_sk_optimize.py
+
+import os
+import unittest
+import tempfile
+import logging
+
+from oscript.parse import sk_lexer, sk_parser, sk_interp
+from oscript.parse.sk_common import ASTNode, Closure
+from oscript.tests.sk_fakes import FakeFrameSource
+
+logger = logging.getLogger('sk.test')
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.CRITICAL)
+
+test_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+OBE_ID=TEST
+EXPTIME=10
+:COMMAND
+:START
+*SET X=(2 * 3)
+*IF 1 == 1
+    *SET Y=1
+*ELSE
+    *SET Y=2
+*ENDIF
+:MAIN_START
+EXEC TSC MOVE RA=(1 + 2 * 3) DEC=-5 T=(-(4 / 2)) N=$X M=$Y ;
+*IF 0
+    EXEC TSC WAIT TIME=1 ;
+*ELIF "A" == "A"
+    EXEC TSC WAIT TIME=2 ;
+    EXEC TSC WAIT TIME=3 ,
+*ELSE
+    EXEC TSC WAIT TIME=4 ;
+*ENDIF
+*IF $EXPTIME > 5 AND 1
+    EXEC TSC WAIT TIME=5 ;
+*ELIF 1 > 2
+    EXEC TSC WAIT TIME=6 ;
+*ELIF 2 > 1
+    EXEC TSC WAIT TIME=7 ;
+*ELIF $X
+    EXEC TSC WAIT TIME=8 ;
+*ENDIF
+*IF 0
+    EXEC TSC WAIT TIME=9 ;
+*ENDIF
+*IF NOT 0
+    EXEC TSC WAIT TIME=10 ,
+*ENDIF
+EXEC TSC WAIT TIME=(1 / 0) NAME="a $X" ;
+:MAIN_END
+:END
+'''
+
+
+class SkOptimizeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        lexer = sk_lexer.skScanner(logger=logger, debug=False,
+                                   lextab='scan3_tab')
+        self.parser = sk_parser.skParser(lexer, logger=logger)
+        self.parser.build()
+        self.optimizer = sk_interp.Optimizer()
+
+    def make_evaluator(self, params):
+        return sk_interp.Evaluator(sk_interp.VariableResolver(params),
+                                   sk_interp.RegisterResolver(),
+                                   sk_interp.MockStatusResolver({}),
+                                   FakeFrameSource(), logger)
+
+    def decode(self, ast, params):
+        evaluator = self.make_evaluator(params)
+        decoder = sk_interp.Decoder(evaluator, None, logger)
+        return (decoder.decode(ast.items[1], evaluator), evaluator)
+
+    def value(self, evaluator, ast):
+        try:
+            if isinstance(ast, Closure):
+                return ('ok', ast.thaw())
+            return ('ok', evaluator.eval(ast))
+        except Exception as e:
+            return ('error', type(e))
+
+    def trace(self, ast, evaluator, res):
+        """Records what executing the decoded (ast) does, in the way of
+        interpTask.block_exec(): the statements executed, the waits for
+        asynchronous ones and the returns.
+        """
+        if ast.tag == 'command_section':
+            for section in ast.items:
+                self.trace(section, evaluator, res)
+
+        elif ast.tag in ('block', 'block_merge', 'cmdlist'):
+            waits = False
+            for item in ast.items:
+                if item.tag == 'nop':
+                    continue
+                elif item.tag == 'return':
+                    res.append('return')
+                    break
+                elif item.tag == 'async':
+                    waits = True
+                    self.trace(item.items[0], evaluator, res)
+                elif item.tag == 'sync':
+                    self.trace(item.items[0], evaluator, res)
+                else:
+                    self.trace(item, evaluator, res)
+            if waits:
+                res.append('wait')
+
+        elif ast.tag == 'exec':
+            params = [(keyval.items[0], self.value(evaluator,
+                                                   keyval.items[1]))
+                      for keyval in ast.items[2].items]
+            res.append((ast.items[0].items[0], ast.items[1].items[0],
+                        params))
+
+        else:
+            res.append(str(ast))
+
+        return res
+
+    def test_fold(self):
+        skbunch = self.parser.parse_skbuf(test_sk)
+        self.assertEqual(skbunch.errors, 0)
+        text = str(skbunch.ast)
+
+        ast = self.optimizer.optimize(skbunch.ast)
+        # the original AST is left as it is
+        self.assertEqual(str(skbunch.ast), text)
+        # and the parameters, that have nothing to simplify, are shared
+        self.assertIs(ast.items[0], skbunch.ast.items[0])
+
+        (pre_ast, main_ast, post_ast) = ast.items[1].items
+        self.assertEqual([item.tag for item in pre_ast.items],
+                         ['star_set', 'star_set'])
+        self.assertEqual(str(pre_ast.items[0].items[0].items[0].items[1]),
+                         str(ASTNode('number', 6.0)))
+
+        self.assertEqual([item.tag for item in main_ast.items],
+                         ['sync', 'cmdlist', 'star_if', 'cmdlist', 'sync'])
+        params = main_ast.items[0].items[0].items[2]
+        self.assertEqual([keyval.items[1].items[0]
+                          for keyval in params.items[:3]], [7.0, -5.0, -2.0])
+
+        # the constant ELIF has become the ELSE rib
+        ribs = main_ast.items[2].items
+        self.assertEqual(len(ribs), 2)
+        self.assertIs(ribs[1].items[0], True)
+
+        # a list whose statement is waited for at its end is kept
+        self.assertEqual(main_ast.items[3].items[0].tag, 'async')
+
+        # division by zero is left for execution
+        param = main_ast.items[4].items[0].items[2].items[0]
+        self.assertEqual(param.items[1].tag, 'asnum')
+
+        # optimizing again does nothing more
+        self.assertIs(self.optimizer.optimize(ast), ast)
+
+    def test_decode(self):
+        skbunch = self.parser.parse_skbuf(test_sk)
+        ast = self.optimizer.optimize(skbunch.ast)
+
+        for exptime in (10, 1):
+            params = dict(OBE_ID='TEST', EXPTIME=exptime)
+            (res1, eval1) = self.decode(skbunch.ast, params)
+            (res2, eval2) = self.decode(ast, params)
+            self.assertEqual(self.trace(res1, eval1, []),
+                             self.trace(res2, eval2, []))
+
+    def test_predicates(self):
+        # constant predicates that are not booleans, or that the
+        # evaluator raises an error for
+        params = dict(OBE_ID='TEST', EXPTIME=10)
+        for pred in ('"0"', '0 OR "A"', '1 AND "A"', 'NOT "A"', '"" OR 0',
+                     '"A" == 1', '(1 + 2) == "3"', 'NOT (1 - 1)',
+                     '"A" - 1', '"A" < 1', '-"A"', '1 / 0'):
+            sk = test_sk.replace('*IF NOT 0', '*IF %s' % (pred))
+            skbunch = self.parser.parse_skbuf(sk)
+            self.assertEqual(skbunch.errors, 0)
+            ast = self.optimizer.optimize(skbunch.ast)
+
+            res = []
+            for sk_ast in (skbunch.ast, ast):
+                try:
+                    (dec_ast, evaluator) = self.decode(sk_ast, params)
+                    res.append(self.trace(dec_ast, evaluator, []))
+                except Exception as e:
+                    res.append(type(e))
+            self.assertEqual(res[0], res[1], pred)
+
+        # predicates the evaluator raises an error for are kept
+        sk = test_sk.replace('*IF NOT 0', '*IF "A" - 1')
+        ast = self.optimizer.optimize(self.parser.parse_skbuf(sk).ast)
+        star_if = ast.items[1].items[1].items[3].items[0]
+        self.assertEqual(star_if.tag, 'star_if')
+        self.assertEqual(star_if.items[0].items[0].tag, 'dyad')
+
+    def test_issue(self):
+        skbunch = self.parser.parse_skbuf(test_sk)
+        ast = self.optimizer.optimize(skbunch.ast)
+        text = ast.items[1].AST2str()
+        self.assertIn('EXEC TSC MOVE RA=7.0 DEC=-5.0 T=-2.0 N=$X', text)
+        self.assertNotIn('TIME=1 ', text)
+        self.assertNotIn('TIME=9', text)
+
+    def test_flat(self):
+        def stmt(tag):
+            return ASTNode(tag, ASTNode('exec', ASTNode('string', 'TSC'),
+                                        ASTNode('string', 'WAIT'),
+                                        ASTNode('param_list'), None))
+        for (item, flat) in ((stmt('sync'), True), (stmt('async'), False),
+                             (ASTNode('return'), False),
+                             (ASTNode('cmdlist', stmt('async')), True)):
+            ast = ASTNode('cmdlist', ASTNode('cmdlist', item), stmt('sync'))
+            ast = self.optimizer.optimize(ast)
+            if flat:
+                self.assertIs(ast.items[0], item)
+            else:
+                self.assertEqual(ast.items[0].tag, 'cmdlist')
+                self.assertIs(ast.items[0].items[0], item)
+
+    def test_bank(self):
+        with tempfile.TemporaryDirectory() as topdir:
+            skdir = os.path.join(topdir, 'TEST', 'sk', 'TEST')
+            os.makedirs(skdir)
+            with open(os.path.join(skdir, 'MAIN.sk'), 'w') as out_f:
+                out_f.write(test_sk)
+
+            res = []
+            for optimize in (False, True):
+                sk_bank = sk_interp.skBank(topdir, logger=logger,
+                                           optimize=optimize)
+                skbunch = sk_bank.lookup('TEST', 'TEST', 'MAIN')
+                res.append(len(str(skbunch.ast)))
+            self.assertLess(res[1], res[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
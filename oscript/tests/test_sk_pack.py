@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# test_sk_pack.py
+
+import unittest
+import io
+import logging
+
+from oscript.parse import sk_lexer, sk_parser, sk_pack
+from oscript.parse.sk_common import ASTNode, Closure
+
+logger = logging.getLogger('sk.test')
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.WARNING)
+
+# Skeleton file exercising the constructs of the grammar
+test_sk = '''
+:HEADER
+OBS_MOD=TEST
+:PARAMETER
+OBE_ID=TEST
+OBE_MODE=TEST
+EXPTIME=10.5
+COUNT=3
+NAME="a string"
+:COMMAND
+:START
+# comment
+*SET -ALIASOFF VAL=!STATS.RA
+*SET NUMS=[1 2 3]
+ASN X=1, Y=$EXPTIME * 2
+FROM "os.path" IMPORT join, split
+DEF DOUBLE(A) {
+    RETURN $A * 2
+}
+:MAIN_START
+EXEC TSC MOVE RA=!STATS.RA DEC=-5 MODE=(1 + 2) ;
+RET1 = EXEC OBS CHECK FRAME=&GET_F_NO[SUP A] ;
+*SUB SETUP OBE_ID=$OBE_ID OBE_MODE=$OBE_MODE POS=@DOUBLE(3) ,
+{ EXEC TSC WAIT TIME=1 ; EXEC TSC WAIT TIME=2 , } ;
+*IF $COUNT > 2 AND NOT $EXPTIME == 0
+    EXEC TSC WAIT TIME=3 ;
+*ELIF $COUNT < 0 OR $COUNT >= 10
+    EXEC TSC WAIT TIME=4 ;
+*ELSE
+    EXEC TSC WAIT TIME=5 ;
+*ENDIF
+IF $X != 1
+    EXEC TSC WAIT TIME=6 ;
+ELIF $X <= 1
+    EXEC TSC WAIT TIME=7 ;
+ELSE
+    EXEC TSC WAIT TIME=8 ;
+ENDIF
+*FOR $COUNT I IN
+    EXEC OBS EXPOSE INDEX=$I ;
+*ENDFOR
+*FOR 0 A B IN "1 2 3 4"
+    EXEC OBS EXPOSE A=$A B=$B ;
+*ENDFOR
+WHILE $X < 3 {
+    ASN X=$X + 1
+} ;
+LET Z=1 IN {
+    EXEC OBS EXPOSE Z=$Z ;
+} ;
+CATCH ERR {
+    RAISE "failed"
+} ;
+@DOUBLE(2) ;
+:MAIN_END
+EXEC TSC WAIT TIME=SIN(30) NAME='single' ;
+:END
+'''
+
+
+class SkPackTestCase(unittest.TestCase):
+
+    def assertSameAST(self, ast1, ast2):
+        if isinstance(ast1, ASTNode):
+            self.assertIsInstance(ast2, ASTNode)
+            self.assertEqual(ast1.tag, ast2.tag)
+            self.assertEqual(ast1.name, ast2.name)
+            self.assertEqual(ast1.serial_num, ast2.serial_num)
+            self.assertEqual(len(ast1.items), len(ast2.items))
+            for (item1, item2) in zip(ast1.items, ast2.items):
+                self.assertSameAST(item1, item2)
+            self.assertEqual(set(ast1.get_attributes().keys()),
+                             set(ast2.get_attributes().keys()))
+            for (name, val) in ast1.get_attributes().items():
+                self.assertSameAST(val, ast2.attributes[name])
+
+        elif isinstance(ast1, Closure):
+            self.assertIsInstance(ast2, Closure)
+            self.assertIsNone(ast2.eval)
+            self.assertSameAST(ast1.ast, ast2.ast)
+
+        elif isinstance(ast1, dict):
+            self.assertIsInstance(ast2, dict)
+            self.assertEqual(set(ast1.keys()), set(ast2.keys()))
+            for (key, val) in ast1.items():
+                self.assertSameAST(val, ast2[key])
+
+        elif isinstance(ast1, (list, tuple)):
+            self.assertEqual(type(ast1), type(ast2))
+            self.assertEqual(len(ast1), len(ast2))
+            for (item1, item2) in zip(ast1, ast2):
+                self.assertSameAST(item1, item2)
+
+        else:
+            self.assertEqual(type(ast1), type(ast2))
+            self.assertEqual(ast1, ast2)
+
+    def test_skeleton(self):
+        lexer = sk_lexer.skScanner(logger=logger, debug=False,
+                                   lextab='scan3_tab')
+        parser = sk_parser.skParser(lexer, logger=logger)
+        parser.build()
+
+        res = parser.parse_skbuf(test_sk)
+        self.assertEqual(res.errors, 0)
+
+        ast = sk_pack.loads(sk_pack.dumps(res.ast))
+        self.assertSameAST(res.ast, ast)
+        self.assertEqual(res.ast.AST2str(), ast.AST2str())
+
+        fields = dict(params=res.params, patterns=res.patterns,
+                      header=res.header)
+        self.assertEqual(sk_pack.loads(sk_pack.dumps(fields)), fields)
+
+    def test_opecmd(self):
+        lexer = sk_lexer.skScanner(logger=logger, debug=False,
+                                   lextab='scan2_tab')
+        parser = sk_parser.opeParser(lexer, logger=logger)
+        parser.build()
+
+        for cmdstr in ('EXEC TSC MOVE RA=!STATS.RA DEC=-5.25',
+                       'SETUPFIELD OBE_ID=TEST OBE_MODE=TEST X=$X Y="q"'):
+            (errors, ast, errinfo) = parser.parse_opecmd(cmdstr)
+            self.assertEqual(errors, 0)
+            self.assertSameAST(ast, sk_pack.loads(sk_pack.dumps(ast)))
+
+    def test_values(self):
+        ast = ASTNode('block',
+                      ASTNode('number', 0), ASTNode('number', -1),
+                      ASTNode('number', 2**70), ASTNode('number', -2**70),
+                      ASTNode('number', 3.25), ASTNode('number', -0.0),
+                      ASTNode('string', ''), ASTNode('qstring', 'héllo'),
+                      None, True, False, [1, 'a', (2, None)],
+                      {'key': [ASTNode('nop')], 3: False},
+                      Closure(ASTNode('alias_ref', 'STATS.RA'), object()),
+                      flag=True, info='x')
+        ast.name = 'TEST_BLOCK'
+
+        self.assertSameAST(ast, sk_pack.loads(sk_pack.dumps(ast)))
+
+    def test_stream(self):
+        asts = [ASTNode('cmdlist', ASTNode('string', 'FOO%d' % i),
+                        ASTNode('string', 'FOO'))
+                for i in range(100)]
+
+        out_f = io.BytesIO()
+        packer = sk_pack.Packer(out_f)
+        for ast in asts:
+            packer.pack(ast)
+
+        in_f = io.BytesIO(out_f.getvalue())
+        res = list(sk_pack.Unpacker(in_f))
+        self.assertEqual(len(res), len(asts))
+        for (ast1, ast2) in zip(asts, res):
+            self.assertSameAST(ast1, ast2)
+
+    def test_records(self):
+        ast1 = ASTNode('cmdlist', ASTNode('string', 'FOO'))
+        ast2 = ASTNode('block', ASTNode('string', 'FOO'), 'x' * 100000)
+
+        out_f = io.BytesIO()
+        sk_pack.dump(ast1, out_f)
+        sk_pack.dump(ast2, out_f)
+        out_f.write(b'trailer')
+
+        # each load() reads one record, and no more
+        in_f = io.BytesIO(out_f.getvalue())
+        self.assertSameAST(sk_pack.load(in_f), ast1)
+        self.assertSameAST(sk_pack.load(in_f), ast2)
+        self.assertEqual(in_f.read(), b'trailer')
+        self.assertRaises(EOFError, sk_pack.load, in_f)
+
+        buf = out_f.getvalue()
+        self.assertRaises(sk_pack.PackError, sk_pack.load,
+                          io.BytesIO(buf[:4]))
+        self.assertRaises(sk_pack.PackError, sk_pack.load,
+                          io.BytesIO(buf[:20]))
+
+    def test_errors(self):
+        buf = sk_pack.dumps(ASTNode('nop'))
+
+        self.assertRaises(sk_pack.PackError, sk_pack.loads, b'XX' + buf)
+        self.assertRaises(sk_pack.PackError, sk_pack.loads, buf[:-1])
+        self.assertRaises(EOFError, sk_pack.loads, b'')
+        self.assertRaises(sk_pack.PackError, sk_pack.dumps, object())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+#
+# frame_pool.py -- reservation pool of frame ids
+#
+"""
+Frame ids are allocated by the frame service in blocks, which are kept
+in a FramePool and handed out locally, so that allocating frames one at
+a time (e.g. for the exposures of an unrolled *FOR loop) does not cost
+one call of the service per frame.
+
+Tasks get their frames from a pool if one is allocated to them as
+'framepool', see g2Task.add_framepool().
+"""
+import threading
+import logging
+
+
+class FramePoolError(Exception):
+    pass
+
+
+class FramePool(object):
+    """Reserves blocks of (block_size) frame ids from (frameSvc), per
+    owner, instrument and frame type, and serves requests for frames from
+    them.
+
+    (frameSvc) provides a getFrames(instname, frametype, count) method
+    returning a list of (count) contiguous frame ids, and so does the
+    pool, so it may stand in for the frame service wherever one is used.
+
+    A request is served from the oldest reserved block that has enough
+    frames left, so that frames left over at the end of a block, when a
+    request for several contiguous frames did not fit in them, are used
+    by later requests rather than lost.  Otherwise a new block is
+    reserved.
+
+    The reservations of an (owner), e.g. the executor running a queue of
+    tasks (see g2Task.cancelFrames()), are kept apart from the others, so
+    that cancel() can release them alone; those made without an owner
+    are released by cancel() without one.  Released frames are given
+    back to the frame service if it has a releaseFrames(instname,
+    frametype, frames) method, otherwise they are dropped.
+    """
+
+    def __init__(self, frameSvc, block_size=10, logger=None):
+        self.frameSvc = frameSvc
+        self.block_size = block_size
+        if logger:
+            self.logger = logger
+        else:
+            self.logger = logging.getLogger('sk.framepool')
+
+        # (owner, instname, frametype) -> list of reserved blocks, each a
+        # list of contiguous frames not handed out yet
+        self.reserved = {}
+        # (owner, instname, frametype) -> lock held while reserving a new
+        # block from the frame service
+        self.locks = {}
+        # lock for reserved and locks
+        self.lock = threading.Lock()
+
+        # number of blocks reserved from the frame service
+        self.fetches = 0
+
+    def _get_lock(self, key):
+        with self.lock:
+            lock = self.locks.get(key)
+            if lock is None:
+                lock = threading.Lock()
+                self.locks[key] = lock
+            return lock
+
+    def _take(self, key, count):
+        # Takes (count) frames from the oldest reserved block of (key) that
+        # has enough of them left, if any.  Must be called with the lock
+        # held.
+        blocks = self.reserved.get(key, [])
+        for i in range(len(blocks)):
+            frames = blocks[i]
+            if len(frames) >= count:
+                if len(frames) > count:
+                    blocks[i] = frames[count:]
+                else:
+                    del blocks[i]
+                return frames[:count]
+
+        return None
+
+    def getFrames(self, instname, frametype, count, owner=None):
+        """Returns a list of (count) contiguous frame ids of type
+        (frametype) for instrument (instname), from the reservations of
+        (owner).
+        """
+        count = int(count)
+        if count < 1:
+            raise FramePoolError("Bad number of frames requested: %d" % (
+                count))
+        key = (owner, instname.upper(), frametype.upper())
+
+        with self.lock:
+            frames = self._take(key, count)
+        if frames is not None:
+            return frames
+
+        with self._get_lock(key):
+            # another thread may have reserved a block meanwhile
+            with self.lock:
+                frames = self._take(key, count)
+            if frames is not None:
+                return frames
+
+            size = max(count, self.block_size)
+            self.logger.debug("Reserving %d frames of %s" % (
+                size, str(key)))
+            frames = list(self.frameSvc.getFrames(instname, frametype,
+                                                  size))
+            if len(frames) < count:
+                raise FramePoolError(
+                    "Number of frames allocated (%d) does not match "
+                    "request (%d)" % (len(frames), count))
+
+            with self.lock:
+                self.fetches += 1
+                if len(frames) > count:
+                    self.reserved.setdefault(key, []).append(frames[count:])
+            return frames[:count]
+
+    def _release(self, key, frames):
+        if len(frames) == 0:
+            return
+
+        self.logger.debug("Releasing %d frames of %s" % (
+            len(frames), str(key)))
+        release_fn = getattr(self.frameSvc, 'releaseFrames', None)
+        if release_fn is not None:
+            release_fn(key[1], key[2], frames)
+
+    def _match(self, key, instname, frametype, owner, all_owners):
+        return (all_owners or (key[0] == owner)) and \
+               ((instname is None) or (key[1] == instname.upper())) and \
+               ((frametype is None) or (key[2] == frametype.upper()))
+
+    def cancel(self, instname=None, frametype=None, owner=None,
+               all_owners=False):
+        """Releases the frames reserved for (owner), or for all owners if
+        (all_owners) is True, but not handed out, for instrument
+        (instname) and frame type (frametype) if they are given.
+        """
+        with self.lock:
+            keys = [key for key in self.reserved.keys()
+                    if self._match(key, instname, frametype, owner,
+                                   all_owners)]
+            released = [(key, self.reserved.pop(key)) for key in keys]
+            # locks of requests in progress are left to them
+            for key in keys:
+                lock = self.locks.get(key)
+                if (lock is not None) and (not lock.locked()):
+                    del self.locks[key]
+
+        for (key, blocks) in released:
+            for frames in blocks:
+                self._release(key, frames)
+
+    def available(self, instname, frametype, owner=None):
+        """Returns the number of frames of type (frametype) for instrument
+        (instname) reserved for (owner) but not handed out.
+        """
+        key = (owner, instname.upper(), frametype.upper())
+        with self.lock:
+            return sum([len(frames) for frames in self.reserved.get(key, [])])
+
+#END
@@ -0,0 +1,617 @@
+#!/usr/bin/env python3
+#
+# sk_benchmarks -- benchmarks for the oscript parsing/decoding machinery
+#
+"""
+Benchmarks for the oscript parsing and decoding machinery.
+
+Usage:
+    $ python sk_benchmarks.py <benchmark> [options]
+
+Each benchmark builds a synthetic skeleton file tree in a temporary
+directory, so no observation data is needed.  Run with --help for the
+list of benchmarks.
+"""
+import sys, os
+import time
+import tempfile
+import tracemalloc
+import argparse
+import logging
+
+from g2base import Bunch
+
+from oscript.parse import sk_common, sk_interp, sk_lexer, sk_pack
+from oscript.parse.sk_common import ASTNode, Closure
+
+logger = logging.getLogger('sk_benchmarks')
+
+# A skeleton file that unrolls a loop of commands, including a *SUB
+main_sk = """
+:HEADER
+OBS_MOD=BENCH
+:PARAMETER
+OBE_ID=BENCH
+OBE_MODE=BENCH
+COUNT=100
+EXPTIME=10
+:COMMAND
+:START
+*SET NAME=ONE
+:MAIN_START
+*FOR $COUNT I IN
+    EXEC OBS CHECK_STATUS MODE=$I EXPTIME=$EXPTIME NAME=$NAME ;
+    *SUB SETUP OBE_ID=$OBE_ID OBE_MODE=$OBE_MODE POS=$I ;
+*ENDFOR
+:MAIN_END
+:END
+"""
+
+sub_sk = """
+:HEADER
+OBS_MOD=BENCH
+:PARAMETER
+OBE_ID=BENCH
+OBE_MODE=BENCH
+POS=0
+:COMMAND
+:START
+:MAIN_START
+EXEC TSC MOVE POS=$POS SPEED=FAST ;
+*IF $POS > 10
+    EXEC TSC WAIT TIME=1 ;
+*ELSE
+    EXEC TSC WAIT TIME=2 ;
+*ENDIF
+:MAIN_END
+:END
+"""
+
+# A skeleton file with constant expressions and *IF predicates
+const_sk = """
+:HEADER
+OBS_MOD=BENCH
+:PARAMETER
+OBE_ID=BENCH
+OBE_MODE=BENCH
+:COMMAND
+:START
+*SET DEBUG=0
+:MAIN_START
+*FOR 20 I IN
+    *IF 0
+        EXEC OBS DEBUG LEVEL=(2 * 5) ;
+    *ELIF 1 == 1
+        EXEC TSC MOVE RA=(10 + 2.5 * 3) DEC=(-(15 / 4)) SPEED=FAST ;
+    *ENDIF
+    EXEC TSC WAIT TIME=(60 * 2) MODE=$I ;
+*ENDFOR
+:MAIN_END
+:END
+"""
+
+# A skeleton file that expands itself (DEPTH) levels deep by *SUB
+nest_sk = """
+:HEADER
+OBS_MOD=BENCH
+:PARAMETER
+OBE_ID=BENCH
+OBE_MODE=BENCH
+DEPTH=0
+:COMMAND
+:START
+EXEC OBS SET_MODE MODE=BENCH LEVEL=1 ;
+:MAIN_START
+EXEC TSC MOVE RA=10.5 DEC=-15.25 SPEED=FAST ;
+*IF $DEPTH > 0
+    *SUB NEST OBE_ID=$OBE_ID OBE_MODE=$OBE_MODE DEPTH=($DEPTH - 1) ;
+    EXEC TSC WAIT TIME=1 ;
+    EXEC TSC WAIT TIME=2 ,
+*ENDIF
+EXEC OBS CHECK_STATUS MODE=BENCH EXPTIME=10 ;
+:MAIN_END
+EXEC OBS SET_MODE MODE=NONE ;
+:END
+"""
+
+
+class NoFrameSource(object):
+    def get(self, *args):
+        raise sk_interp.DecodeError("No frames in benchmarks")
+
+
+def make_sk_tree(topdir):
+    """Writes the benchmark skeleton files under (topdir).
+    """
+    skdir = os.path.join(topdir, 'BENCH', 'sk', 'BENCH')
+    os.makedirs(skdir)
+    for (name, buf) in (('MAIN', main_sk), ('SETUP', sub_sk),
+                        ('CONST', const_sk), ('NEST', nest_sk)):
+        with open(os.path.join(skdir, name + '.sk'), 'w') as out_f:
+            out_f.write(buf)
+
+
+def make_evaluator():
+    return sk_interp.Evaluator(sk_interp.VariableResolver({}),
+                               sk_interp.RegisterResolver(),
+                               sk_interp.MockStatusResolver({}),
+                               NoFrameSource(), logger)
+
+
+def decode_main(sk_bank, count, decoder=None):
+    """Decodes the MAIN benchmark skeleton with a loop count of (count).
+    Returns the decoded AST.
+    """
+    return decode_cmd(sk_bank,
+                      'MAIN OBE_ID=BENCH OBE_MODE=BENCH COUNT=%d' % (count),
+                      decoder=decoder)
+
+
+def decode_cmd(sk_bank, cmdstr, decoder=None):
+    """Decodes the abstract command (cmdstr), with (decoder) if it is
+    given.  Returns the decoded AST.
+    """
+    (errors, ast, errinfo) = sk_bank.ope_parser.parse_opecmd(cmdstr)
+    assert errors == 0, errinfo
+    (ast_cmd_exp, ast_params) = ast.items[0].items
+    ast = ASTNode('star_sub', ast_cmd_exp, ast_params)
+
+    if decoder is None:
+        decoder = sk_interp.Decoder(make_evaluator(), sk_bank, logger)
+    return decoder.decode(ast, decoder.eval)
+
+
+def count_nodes(ast):
+    res = 0
+    todo = [ast]
+    while len(todo) > 0:
+        node = todo.pop()
+        if isinstance(node, ASTNode):
+            res += 1
+            todo.extend(node.items)
+        elif isinstance(node, Closure):
+            todo.append(node.ast)
+    return res
+
+
+class LegacyASTNode(object):
+    """The AST node representation used before ASTNode had __slots__,
+    for comparison.
+    """
+    def __init__(self, tag, *args, **kwargs):
+        self.serial_num = sk_common.seq_num.bump()
+        self.tag = tag
+        self.name = tag
+        self.items = []
+        for anItem in args:
+            self.items.append(anItem)
+        self.attributes = kwargs
+
+
+def copy_tree(ast, klass):
+    if isinstance(ast, ASTNode):
+        return klass(ast.tag, *[copy_tree(item, klass) for item in ast.items],
+                     **ast.get_attributes())
+    return ast
+
+
+def measure(fn, *args):
+    """Calls fn(*args) and returns a tuple of its result, the elapsed time
+    and the number of bytes allocated and still in use.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        time_start = time.perf_counter()
+        res = fn(*args)
+        elapsed = time.perf_counter() - time_start
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return (res, elapsed, used)
+
+
+def bench_memory(options, sk_bank):
+    """Memory used by a large decoded AST."""
+    (ast, elapsed, used) = measure(decode_main, sk_bank, options.count)
+    nodes = count_nodes(ast)
+    print("decode: %d nodes in %.3f sec, %d bytes retained" % (
+        nodes, elapsed, used))
+
+    for klass in (ASTNode, LegacyASTNode):
+        (res, elapsed, used) = measure(copy_tree, ast, klass)
+        print("%-14s: %8.1f bytes/node, %.3f usec/node" % (
+            klass.__name__, float(used) / nodes, elapsed * 1e6 / nodes))
+        res = None
+
+
+def bench_pack(options, sk_bank):
+    """Binary AST serialization vs. issuing and reparsing the source."""
+    skpath = os.path.join(sk_bank.sk_basedir, 'BENCH', 'sk', 'BENCH',
+                          'MAIN.sk')
+    with open(skpath, 'r') as in_f:
+        buf = in_f.read()
+    skbunch = sk_bank.sk_parser.parse_skbuf(buf)
+    ast = skbunch.ast
+
+    def issue_reparse():
+        # the command section is the part issued back to text
+        text = ast.items[1].AST2str()
+        return sk_bank.sk_parser.parse(text)
+
+    def pack_unpack():
+        return sk_pack.loads(sk_pack.dumps(ast))
+
+    for (name, fn) in (('issue+reparse', issue_reparse),
+                       ('pack+unpack', pack_unpack)):
+        time_start = time.perf_counter()
+        for i in range(options.count):
+            fn()
+        elapsed = time.perf_counter() - time_start
+        print("%-14s: %.1f usec/round trip" % (
+            name, elapsed * 1e6 / options.count))
+
+    print("packed size: %d bytes" % (len(sk_pack.dumps(ast))))
+
+
+def bench_scan(options, sk_bank):
+    """Scanner throughput, ply based vs. single pass scanner."""
+    skpath = os.path.join(sk_bank.sk_basedir, 'BENCH', 'sk', 'BENCH',
+                          'SETUP.sk')
+    with open(skpath, 'r') as in_f:
+        buf = in_f.read()
+    (hdrbuf, prmbuf, cmdbuf, startline) = sk_common.get_skparts(buf)
+    cmdbuf = cmdbuf * options.count
+
+    for klass in (sk_lexer.skScanner, sk_lexer.skFastScanner):
+        scanner = klass(logger=logger, debug=False, lextab='scan3_tab')
+        # best of a few runs
+        elapsed = None
+        for i in range(3):
+            time_start = time.perf_counter()
+            (errors, tokens, errinfo) = scanner.tokenize(cmdbuf)
+            elapsed_i = time.perf_counter() - time_start
+            assert errors == 0, errinfo
+            if (elapsed is None) or (elapsed_i < elapsed):
+                elapsed = elapsed_i
+        print("%-14s: %d tokens in %.3f sec, %.2f MB/sec" % (
+            klass.__name__, len(tokens), elapsed,
+            len(cmdbuf) / elapsed / 1e6))
+
+
+def bench_opecmd(options, sk_bank):
+    """Parsing OPE command lines, with and without the flat fast path."""
+    cmds = ['EXEC TSC MOVE RA=10.5 DEC=5.25 MODE=FAST',
+            'SETUPFIELD OBE_ID=BENCH OBE_MODE=BENCH EXPTIME=10 NAME="a b"',
+            # not flat, always parsed by the grammar
+            'EXEC TSC MOVE RA=!STATS.RA DEC=-5.25 MODE=FAST']
+    parser = sk_bank.ope_parser
+
+    for cmdstr in cmds:
+        print(cmdstr)
+        for fast_path in (False, True):
+            parser.fast_path = fast_path
+            time_start = time.perf_counter()
+            for i in range(options.count):
+                (errors, ast, errinfo) = parser.parse_opecmd(cmdstr)
+                assert errors == 0, errinfo
+            elapsed = time.perf_counter() - time_start
+            print("  fast_path=%-5s: %.1f usec/command" % (
+                fast_path, elapsed * 1e6 / options.count))
+
+
+def bench_eval(options, sk_bank):
+    """Expression evaluation, tree walking vs. compiled."""
+    cmdstr = 'EXEC OBS CHECK K=($I < $COUNT AND NOT $I * 2 == 7)'
+    (errors, ast, errinfo) = sk_bank.ope_parser.parse_opecmd(cmdstr)
+    assert errors == 0, errinfo
+    pred_ast = ast.items[0].items[2].items[0].items[1]
+
+    class WalkingEvaluator(sk_interp.Evaluator):
+        eval = sk_interp.Evaluator.interpret
+
+    for (name, klass) in (('interpret', WalkingEvaluator),
+                          ('compiled', sk_interp.Evaluator)):
+        sk_eval = klass(sk_interp.VariableResolver({}),
+                        sk_interp.RegisterResolver(),
+                        sk_interp.MockStatusResolver({}),
+                        NoFrameSource(), logger)
+        sk_eval.set_vars(dict(I=1, COUNT=options.count))
+        time_start = time.perf_counter()
+        for i in range(options.count):
+            sk_eval.eval(pred_ast)
+        elapsed = time.perf_counter() - time_start
+        print("%-14s: %.2f usec/evaluation" % (
+            name, elapsed * 1e6 / options.count))
+
+
+def bench_interpolate(options, sk_bank):
+    """String interpolation of short and long strings."""
+    sk_eval = make_evaluator()
+    sk_eval.set_vars(dict(OBE_ID='BENCH', EXPTIME=10))
+    short = 'OBE_ID=$OBE_ID EXPTIME=$EXPTIME'
+    for (name, stg) in (('short', short),
+                        ('long', ' '.join([short] * 100))):
+        time_start = time.perf_counter()
+        for i in range(options.count):
+            sk_eval.eval_string_interpolate(stg)
+        elapsed = time.perf_counter() - time_start
+        print("%-14s: %.1f usec/string, %d chars" % (
+            name, elapsed * 1e6 / options.count, len(stg)))
+
+
+def bench_clone(options, sk_bank):
+    """Evaluator clones of a scope of many variables, copying vs. sharing
+    the variables."""
+
+    class CopyingVariableResolver(sk_interp.VariableResolver):
+        def clone(self):
+            return CopyingVariableResolver(self.variable_map)
+
+    params = dict([('VAR%d' % i, i) for i in range(options.count)])
+    for klass in (CopyingVariableResolver, sk_interp.VariableResolver):
+        sk_eval = sk_interp.Evaluator(klass(params),
+                                      sk_interp.RegisterResolver(),
+                                      sk_interp.MockStatusResolver({}),
+                                      NoFrameSource(), logger)
+        # nested scopes, as of *SUB expansions or procedure calls
+        time_start = time.perf_counter()
+        for i in range(1000):
+            sk_eval2 = sk_eval.clone()
+            sk_eval2.registers.push(dict(ARG=i))
+            sk_eval2.eval_string_interpolate('$VAR0 @ARG')
+        elapsed = time.perf_counter() - time_start
+        print("%-24s: %.1f usec/clone of %d variables" % (
+            klass.__name__, elapsed * 1e6 / 1000, len(params)))
+
+
+class ListRegisterResolver(object):
+    """The register resolver used before registers were indexed, scanning
+    a list of ribs, for comparison.
+    """
+    def __init__(self):
+        self.ribs = [Bunch.caselessDict()]
+
+    def get(self, key):
+        for rib in self.ribs:
+            if key in rib:
+                return rib[key]
+        raise sk_interp.skError("Variable accessed before assignment")
+
+    def set(self, **kwdargs):
+        self.ribs[0].update(kwdargs)
+
+    def push(self, params):
+        self.ribs.insert(0, Bunch.caselessDict(params))
+
+
+def bench_registers(options, sk_bank):
+    """Register lookups at nesting depths of 1 to 50, scanning a list of
+    ribs vs. indexed."""
+    for depth in (1, 5, 10, 20, 50):
+        res = []
+        for klass in (ListRegisterResolver, sk_interp.RegisterResolver):
+            registers = klass()
+            registers.set(OUTER=1)
+            for i in range(depth - 1):
+                registers.push(dict([('ARG%d' % i, i)]))
+
+            time_start = time.perf_counter()
+            for i in range(options.count):
+                registers.get('OUTER')
+            elapsed = time.perf_counter() - time_start
+            res.append(elapsed * 1e6 / options.count)
+        print("depth %2d: list %.3f usec/lookup, indexed %.3f usec/lookup" % (
+            depth, res[0], res[1]))
+
+
+def bench_optimize(options, sk_bank):
+    """Decoding of sk files, as parsed vs. simplified by an Optimizer."""
+    cmdstr = 'CONST OBE_ID=BENCH OBE_MODE=BENCH'
+    for optimize in (False, True):
+        bank = sk_interp.skBank(sk_bank.sk_basedir, logger=logger,
+                                optimize=optimize)
+        nodes = count_nodes(bank.lookup('BENCH', 'BENCH', 'CONST').ast)
+        time_start = time.perf_counter()
+        for i in range(options.count):
+            decode_cmd(bank, cmdstr)
+        elapsed = time.perf_counter() - time_start
+        print("optimize=%-5s: %d nodes, %.1f usec/decoding" % (
+            optimize, nodes, elapsed * 1e6 / options.count))
+
+
+def getattr_method(walker, prefix, default, tag):
+    """The lookup of AST node methods used before ASTVisitor, for
+    comparison.
+    """
+    try:
+        return getattr(walker, prefix + tag)
+    except AttributeError:
+        return default
+
+
+def bench_dispatch(options, sk_bank):
+    """Per-node method lookup of the AST walkers, by getattr() vs. the
+    ASTVisitor method tables."""
+    ast = decode_main(sk_bank, options.count)
+    tags = []
+    todo = [ast]
+    while len(todo) > 0:
+        node = todo.pop()
+        if isinstance(node, ASTNode):
+            tags.append(node.tag)
+            todo.extend(node.items)
+        elif isinstance(node, Closure):
+            todo.append(node.ast)
+
+    walkers = (sk_common.IssueAST(),
+               sk_interp.Decoder(make_evaluator(), sk_bank, logger),
+               sk_interp.Optimizer())
+    for walker in walkers:
+        prefix = walker.visit_prefix
+        default = None
+        if walker.visit_default is not None:
+            default = getattr(walker, walker.visit_default)
+        # the table is built once per class, leave that out
+        walker.visit_table()
+
+        time_start = time.perf_counter()
+        for tag in tags:
+            getattr_method(walker, prefix, default, tag)
+        elapsed1 = time.perf_counter() - time_start
+
+        time_start = time.perf_counter()
+        for tag in tags:
+            walker.visit_method(tag)
+        elapsed2 = time.perf_counter() - time_start
+
+        print("%-10s: getattr %.3f usec/node, table %.3f usec/node" % (
+            walker.__class__.__name__, elapsed1 * 1e6 / len(tags),
+            elapsed2 * 1e6 / len(tags)))
+
+    issuer = sk_common.IssueAST()
+    time_start = time.perf_counter()
+    issuer.issue(ast)
+    elapsed = time.perf_counter() - time_start
+    print("issue     : %d nodes, %.3f usec/node" % (
+        len(tags), elapsed * 1e6 / len(tags)))
+
+
+class CopyingDecoder(sk_interp.Decoder):
+    """The decoder before it shared the subtrees left unchanged by
+    decoding, for comparison.
+    """
+    def recode(self, ast, eval):
+        merge_ok = (ast.tag in ('block', 'block_merge', 'cmdlist'))
+
+        newitems = []
+        for item in ast.items:
+            if type(item) == ASTNode:
+                new_ast = self._decode(item, eval)
+
+                if isinstance(new_ast, ASTNode) and \
+                        (new_ast.tag == 'block_merge') and merge_ok:
+                    newitems.extend(new_ast.items)
+                else:
+                    newitems.append(new_ast)
+            else:
+                newitems.append(item)
+
+        if (ast.tag in ('async', 'sync', 'block', 'cmdlist')) and \
+           (len(newitems) == 0):
+            return ASTNode('block_merge')
+
+        return ASTNode(ast.tag, *newitems, **ast.get_attributes())
+
+
+def bench_share(options, sk_bank):
+    """Decoding of a deep *SUB hierarchy, copying vs. sharing the
+    unchanged subtrees."""
+    cmdstr = 'NEST OBE_ID=BENCH OBE_MODE=BENCH DEPTH=%d' % (options.depth)
+    (errors, ast, errinfo) = sk_bank.ope_parser.parse_opecmd(cmdstr)
+    assert errors == 0, errinfo
+    ast = ASTNode('star_sub', *ast.items[0].items)
+
+    for klass in (CopyingDecoder, sk_interp.Decoder):
+        start_num = sk_common.seq_num.bump()
+        time_start = time.perf_counter()
+        for i in range(options.count):
+            sk_eval = make_evaluator()
+            decoder = klass(sk_eval, sk_bank, logger)
+            res = decoder.decode(ast, sk_eval)
+        elapsed = time.perf_counter() - time_start
+        nodes = sk_common.seq_num.bump() - start_num - 1
+
+        (res, elapsed2, used) = measure(decoder.decode, ast, make_evaluator())
+        print("%-14s: %d nodes, %.1f nodes allocated/decoding, "
+              "%.1f usec/decoding, %d bytes retained" % (
+            klass.__name__, count_nodes(res), float(nodes) / options.count,
+            elapsed * 1e6 / options.count, used))
+
+
+def bench_lazy(options, sk_bank):
+    """Decoding of a long *FOR loop, unrolled vs. deferred until its
+    iterations are executed."""
+    # parse the sk files first
+    decode_main(sk_bank, 1)
+
+    for lazy_for in (False, True):
+        decoder = sk_interp.Decoder(make_evaluator(), sk_bank, logger,
+                                    lazy_for=lazy_for)
+        (ast, elapsed, used) = measure(decode_main, sk_bank, options.count,
+                                       decoder)
+        ast = None
+        decoder = sk_interp.Decoder(make_evaluator(), sk_bank, logger,
+                                    lazy_for=lazy_for)
+        time_start = time.perf_counter()
+        ast = decode_main(sk_bank, options.count, decoder)
+        elapsed = time.perf_counter() - time_start
+
+        # time to the first statement of the loop, and to run through all
+        # of them, as interpTask.block_exec() does
+        def first(ast):
+            if ast.tag in ('block', 'block_merge', 'cmdlist'):
+                return first(next(decoder.expand(ast.items)))
+            elif ast.tag in ('sync', 'async'):
+                return first(ast.items[0])
+            return ast
+
+        def walk(ast):
+            res = 0
+            for item in decoder.expand(ast.items):
+                if item.tag in ('sync', 'async'):
+                    item = item.items[0]
+                if item.tag in ('block', 'block_merge', 'cmdlist'):
+                    res += walk(item)
+                else:
+                    res += 1
+            return res
+
+        main_ast = ast.items[1].items[0].items[0]
+        time_start = time.perf_counter()
+        first(main_ast)
+        elapsed2 = time.perf_counter() - time_start
+        time_start = time.perf_counter()
+        stmts = walk(main_ast)
+        elapsed3 = time.perf_counter() - time_start
+
+        print("lazy_for=%-5s: decode %.1f msec, %d bytes retained; "
+              "first statement after %.1f msec; "
+              "%d statements expanded in %.1f msec" % (
+            lazy_for, elapsed * 1e3, used, (elapsed + elapsed2) * 1e3,
+            stmts, elapsed3 * 1e3))
+
+
+benchmarks = dict(memory=bench_memory, pack=bench_pack, scan=bench_scan,
+                  opecmd=bench_opecmd, eval=bench_eval,
+                  interpolate=bench_interpolate, optimize=bench_optimize,
+                  clone=bench_clone, registers=bench_registers,
+                  dispatch=bench_dispatch, share=bench_share,
+                  lazy=bench_lazy)
+
+
+def main(options, args):
+
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as topdir:
+        make_sk_tree(topdir)
+        sk_bank = sk_interp.skBank(topdir, logger=logger)
+
+        benchmarks[options.benchmark](options, sk_bank)
+
+
+if __name__ == '__main__':
+
+    argprs = argparse.ArgumentParser(description="oscript benchmarks")
+    argprs.add_argument("benchmark", choices=sorted(benchmarks.keys()),
+                        help="Benchmark to run")
+    argprs.add_argument("-n", "--count", dest="count", type=int,
+                        default=1000,
+                        help="Size of the benchmark problem")
+    argprs.add_argument("-d", "--depth", dest="depth", type=int,
+                        default=20,
+                        help="Depth of the *SUB hierarchy")
+    (options, args) = argprs.parse_known_args(sys.argv[1:])
+
+    main(options, args)